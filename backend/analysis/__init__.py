@@ -5,18 +5,40 @@ This module provides AI-powered analysis and recommendations
 based on calculated indices and statistics.
 """
 
-from .insights import (
-    generate_insights,
-    generate_explanation,
-    generate_recommendations,
-    UHISeverity,
-    Recommendation,
-)
+from typing import TYPE_CHECKING
+
+from utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    # Static view of the lazy exports for type checkers and IDEs
+    from .insights import (
+        generate_insights,
+        generate_insights_batch,
+        generate_explanation,
+        generate_recommendations,
+        UHISeverity,
+        Recommendation,
+    )
+
+# Public name -> submodule that defines it.
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing the package does not pull in every dependency up front.
+_LAZY_IMPORTS = {
+    "generate_insights": "insights",
+    "generate_insights_batch": "insights",
+    "generate_explanation": "insights",
+    "generate_recommendations": "insights",
+    "UHISeverity": "insights",
+    "Recommendation": "insights",
+}
 
 __all__ = [
     "generate_insights",
+    "generate_insights_batch",
     "generate_explanation",
     "generate_recommendations",
     "UHISeverity",
     "Recommendation",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS, __all__)
@@ -17,8 +17,21 @@ References:
 
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, NamedTuple, Optional, Sequence, Tuple
+from bisect import bisect_right
+from collections import OrderedDict
+import copy
+import functools
+import heapq
+import inspect
+import io
+import json
 import math
+import operator
+import threading
+
+import numpy as np
+from numpy.typing import NDArray
 
 
 class UHISeverity(IntEnum):
@@ -38,7 +51,11 @@ class Priority(IntEnum):
     CRITICAL = 4
 
 
-@dataclass
+# Precomputed (name, value) pairs for serializing priorities
+_PRIORITY_FIELDS = {p: (p.name, int(p)) for p in Priority}
+
+
+@dataclass(frozen=True, slots=True)
 class Recommendation:
     """A prioritized recommendation with details."""
     title: str
@@ -50,11 +67,12 @@ class Recommendation:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        priority_name, priority_value = _PRIORITY_FIELDS[self.priority]
         return {
             "title": self.title,
             "description": self.description,
-            "priority": self.priority.name,
-            "priority_value": int(self.priority),
+            "priority": priority_name,
+            "priority_value": priority_value,
             "category": self.category,
             "timeframe": self.timeframe,
             "estimated_impact": self.estimated_impact,
@@ -78,52 +96,208 @@ SEVERITY_DESCRIPTIONS = {
     UHISeverity.CRITICAL: "critical",
 }
 
+# Sorted upper bounds of every finite severity level; the insertion point of an
+# intensity in this sequence is its severity value.
+_SEVERITY_BOUNDS = tuple(
+    UHI_SEVERITY_THRESHOLDS[s] for s in UHISeverity if s != UHISeverity.CRITICAL
+)
+_SEVERITY_THRESHOLDS_ARR = np.array(_SEVERITY_BOUNDS, dtype=np.float64)
+_SEVERITY_DESC_ARR = np.array([SEVERITY_DESCRIPTIONS[s] for s in UHISeverity])
+
 
 def classify_uhi_severity(intensity: float) -> UHISeverity:
     """Classify UHI intensity into severity levels."""
-    if intensity < UHI_SEVERITY_THRESHOLDS[UHISeverity.MINIMAL]:
-        return UHISeverity.MINIMAL
-    elif intensity < UHI_SEVERITY_THRESHOLDS[UHISeverity.MILD]:
-        return UHISeverity.MILD
-    elif intensity < UHI_SEVERITY_THRESHOLDS[UHISeverity.MODERATE]:
-        return UHISeverity.MODERATE
-    elif intensity < UHI_SEVERITY_THRESHOLDS[UHISeverity.SEVERE]:
-        return UHISeverity.SEVERE
-    else:
-        return UHISeverity.CRITICAL
+    return UHISeverity(bisect_right(_SEVERITY_BOUNDS, intensity))
+
+
+def classify_uhi_severity_batch(
+    intensities: NDArray[np.floating],
+) -> NDArray[np.int8]:
+    """
+    Classify an array of UHI intensities into severity levels.
+    
+    Vectorized counterpart of classify_uhi_severity() for per-pixel
+    severity maps or multi-region/time-series inputs.
+    
+    Args:
+        intensities: Array of UHI intensity values (Celsius)
+    
+    Returns:
+        Array of UHISeverity values with the same shape as the input
+    """
+    intensities = np.asarray(intensities, dtype=np.float64)
+    return np.searchsorted(
+        _SEVERITY_THRESHOLDS_ARR, intensities, side="right"
+    ).astype(np.int8)
+
+
+# Number of distinct analysis inputs kept by the insight caches
+INSIGHTS_CACHE_SIZE = 32
+
+
+# Vegetation health levels by mean NDVI: < 0.2, < 0.3, < 0.5, >= 0.5
+_NDVI_HEALTH_THRESHOLDS = np.array([0.2, 0.3, 0.5])
+_NDVI_HEALTH_LABELS = np.array(["poor", "fair", "moderate", "good"])
+_NDVI_HEALTH_DETAILS = np.array([
+    "indicating minimal healthy vegetation cover",
+    "suggesting sparse or stressed vegetation",
+    "with mixed vegetation conditions",
+    "indicating healthy, dense vegetation",
+])
+
+
+def classify_ndvi_health(
+    ndvi: NDArray[np.floating],
+) -> Tuple[NDArray[np.str_], NDArray[np.str_]]:
+    """
+    Classify NDVI values into vegetation health levels.
+    
+    Works on scalars (e.g. a mean NDVI) as well as per-pixel arrays.
+    
+    Args:
+        ndvi: NDVI value or array of NDVI values
+    
+    Returns:
+        Tuple of (health labels, descriptive details) with the input's shape
+    """
+    idx = np.digitize(ndvi, _NDVI_HEALTH_THRESHOLDS)
+    return _NDVI_HEALTH_LABELS[idx], _NDVI_HEALTH_DETAILS[idx]
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize non-JSON values for cache keys (arrays do not affect insights)."""
+    if isinstance(value, np.ndarray):
+        return None
+    return str(value)
+
+
+def _memoize_insights(func: Callable) -> Callable:
+    """
+    Memoize an insight generator on the canonical JSON form of its inputs.
+    
+    Insight generation is a pure function of the statistics dictionaries,
+    so repeated calls with unchanged analysis results are served from an
+    LRU cache. Mutable results are deep-copied so callers cannot alter the
+    cached value.
+    """
+    signature = inspect.signature(func)
+    cache: "OrderedDict[str, Any]" = OrderedDict()
+    lock = threading.Lock()
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = json.dumps(bound.arguments, sort_keys=True, default=_json_default)
+        
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return copy.deepcopy(cache[key])
+        
+        result = func(*args, **kwargs)
+        
+        with lock:
+            cache[key] = result
+            cache.move_to_end(key)
+            while len(cache) > INSIGHTS_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        return copy.deepcopy(result)
+    
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+# Health impact descriptions by severity
+_HEALTH_IMPACTS = {
+    UHISeverity.MINIMAL: (
+        "Current conditions pose minimal additional health risk from urban heat. "
+        "Standard precautions for vulnerable populations are sufficient."
+    ),
+    UHISeverity.MILD: (
+        "Mild heat stress may affect sensitive individuals including the elderly, "
+        "young children, and those with pre-existing conditions. Increased hydration "
+        "and limited outdoor activity during peak hours is recommended."
+    ),
+    UHISeverity.MODERATE: (
+        "Moderate heat stress conditions present. Risk of heat-related illness is elevated, "
+        "particularly in areas without adequate cooling. Outdoor workers and athletic "
+        "activities should take additional precautions."
+    ),
+    UHISeverity.SEVERE: (
+        "Severe heat conditions detected. Significant health risks exist for the general "
+        "population. Heat exhaustion and heat stroke cases are likely to increase. "
+        "Emergency cooling centers should be activated."
+    ),
+    UHISeverity.CRITICAL: (
+        "CRITICAL: Extreme heat emergency conditions. Life-threatening heat exposure is "
+        "possible without adequate cooling. Immediate protective actions are required "
+        "including public health alerts and emergency response activation."
+    ),
+}
+
+class _SeverityInfo(NamedTuple):
+    """Text associated with a UHI severity level."""
+    description: str
+    health_impact: str
+
+
+# Severity -> (description, health impact) for single-lookup access
+_SEVERITY_TABLE = {
+    s: _SeverityInfo(SEVERITY_DESCRIPTIONS[s], _HEALTH_IMPACTS[s]) for s in UHISeverity
+}
 
 
 def get_health_impact_description(severity: UHISeverity) -> str:
     """Get health impact description based on severity."""
-    impacts = {
-        UHISeverity.MINIMAL: (
-            "Current conditions pose minimal additional health risk from urban heat. "
-            "Standard precautions for vulnerable populations are sufficient."
-        ),
-        UHISeverity.MILD: (
-            "Mild heat stress may affect sensitive individuals including the elderly, "
-            "young children, and those with pre-existing conditions. Increased hydration "
-            "and limited outdoor activity during peak hours is recommended."
-        ),
-        UHISeverity.MODERATE: (
-            "Moderate heat stress conditions present. Risk of heat-related illness is elevated, "
-            "particularly in areas without adequate cooling. Outdoor workers and athletic "
-            "activities should take additional precautions."
-        ),
-        UHISeverity.SEVERE: (
-            "Severe heat conditions detected. Significant health risks exist for the general "
-            "population. Heat exhaustion and heat stroke cases are likely to increase. "
-            "Emergency cooling centers should be activated."
-        ),
-        UHISeverity.CRITICAL: (
-            "CRITICAL: Extreme heat emergency conditions. Life-threatening heat exposure is "
-            "possible without adequate cooling. Immediate protective actions are required "
-            "including public health alerts and emergency response activation."
-        ),
-    }
-    return impacts.get(severity, "")
+    return _HEALTH_IMPACTS[severity]
+
+
+# Explanation section templates, filled with str.format_map()
+_OVERVIEW_TMPL = """## Urban Heat Island Analysis Summary
+
+The analysis reveals a **{severity_desc} Urban Heat Island (UHI) effect** with an intensity of **{uhi_intensity:.1f}°C**. 
+
+Urban areas exhibit a mean temperature of **{urban_mean:.1f}°C**, which is {abs_intensity:.1f}°C {direction} than surrounding vegetated (rural reference) areas at **{rural_mean:.1f}°C**."""
 
+_TEMP_TMPL = """### Temperature Distribution
 
+Surface temperatures range from **{min_temp:.1f}°C to {max_temp:.1f}°C**, with a spatial variation of {temp_range:.1f}°C across the study area. The mean surface temperature is **{mean_temp:.1f}°C**."""
+
+_HOTSPOT_TMPL = """
+
+**{hotspot_count:,} thermal hotspot pixels** were identified, covering approximately **{affected_area:.2f} km²** of land area. These hotspots represent locations where temperatures exceed the regional mean by more than 2 standard deviations."""
+
+_LAND_COVER_TMPL = """### Land Cover Composition
+
+The study area contains:
+- **{urban_pct:.1f}%** urban/built-up surfaces
+- **{vegetation_pct:.1f}%** vegetation cover
+- **{water_pct:.1f}%** water bodies"""
+
+_URBAN_HIGH_TMPL = """
+
+⚠️ **High Urban Density Alert**: With more than 60% impervious surface coverage, this area is highly susceptible to heat accumulation. Urban surfaces absorb and retain solar radiation, contributing significantly to elevated temperatures."""
+
+_URBAN_MED_TMPL = """
+
+The urban coverage is moderately high. As impervious surfaces continue to expand, UHI effects are likely to intensify without mitigation measures."""
+
+_VEG_TMPL = """### Vegetation Health
+
+The mean NDVI value of **{mean_ndvi:.2f}** indicates **{veg_health}** vegetation health across the study area, {veg_detail}. Vegetation plays a critical role in urban cooling through evapotranspiration and shading."""
+
+_VEG_LOW_TMPL = """
+
+🌱 **Low Vegetation Alert**: The limited vegetation cover reduces the natural cooling capacity of the area. Green infrastructure investments would provide significant temperature reduction benefits."""
+
+_HEALTH_TMPL = """### Health Impact Assessment
+
+{health_impact}"""
+
+
+@_memoize_insights
 def generate_explanation(
     uhi_result: Dict[str, Any],
     land_cover_stats: Dict[str, Any],
@@ -142,20 +316,17 @@ def generate_explanation(
     Returns:
         A comprehensive natural language explanation string
     """
-    sections = []
+    # Sections are separated by a blank line; the land cover section is
+    # always written, so every section after it needs a separator.
+    buf = io.StringIO()
     
     # Extract key metrics
     uhi_intensity = uhi_result.get("uhi_intensity")
-    urban_mean = uhi_result.get("urban_mean_temp")
-    rural_mean = uhi_result.get("rural_mean_temp")
     hotspot_count = uhi_result.get("hotspot_count", 0)
-    affected_area = uhi_result.get("affected_area_km2", 0)
     
     # Land cover percentages
     lc_percentages = land_cover_stats.get("class_percentages", {})
     urban_pct = lc_percentages.get("Urban/Built-up", 0)
-    vegetation_pct = lc_percentages.get("Vegetation", 0)
-    water_pct = lc_percentages.get("Water", 0)
     
     # NDVI stats
     mean_ndvi = ndvi_stats.get("mean")
@@ -163,90 +334,174 @@ def generate_explanation(
     # LST stats
     max_temp = lst_stats.get("max")
     min_temp = lst_stats.get("min")
-    mean_temp = lst_stats.get("mean")
+    
+    values = {
+        "uhi_intensity": uhi_intensity,
+        "urban_mean": uhi_result.get("urban_mean_temp"),
+        "rural_mean": uhi_result.get("rural_mean_temp"),
+        "hotspot_count": hotspot_count,
+        "affected_area": uhi_result.get("affected_area_km2", 0),
+        "urban_pct": urban_pct,
+        "vegetation_pct": lc_percentages.get("Vegetation", 0),
+        "water_pct": lc_percentages.get("Water", 0),
+        "mean_ndvi": mean_ndvi,
+        "max_temp": max_temp,
+        "min_temp": min_temp,
+        "mean_temp": lst_stats.get("mean"),
+    }
     
     # ========== Section 1: Overview ==========
     if uhi_intensity is not None:
         severity = classify_uhi_severity(uhi_intensity)
-        severity_desc = SEVERITY_DESCRIPTIONS[severity]
-        
-        overview = f"""## Urban Heat Island Analysis Summary
-
-The analysis reveals a **{severity_desc} Urban Heat Island (UHI) effect** with an intensity of **{uhi_intensity:.1f}°C**. 
-
-Urban areas exhibit a mean temperature of **{urban_mean:.1f}°C**, which is {abs(uhi_intensity):.1f}°C {"warmer" if uhi_intensity > 0 else "cooler"} than surrounding vegetated (rural reference) areas at **{rural_mean:.1f}°C**."""
-        sections.append(overview)
+        values["severity_desc"], values["health_impact"] = _SEVERITY_TABLE[severity]
+        values["abs_intensity"] = abs(uhi_intensity)
+        values["direction"] = "warmer" if uhi_intensity > 0 else "cooler"
+        buf.write(_OVERVIEW_TMPL.format_map(values))
     
     # ========== Section 2: Temperature Analysis ==========
     if max_temp is not None and min_temp is not None:
-        temp_range = max_temp - min_temp
-        temp_section = f"""### Temperature Distribution
-
-Surface temperatures range from **{min_temp:.1f}°C to {max_temp:.1f}°C**, with a spatial variation of {temp_range:.1f}°C across the study area. The mean surface temperature is **{mean_temp:.1f}°C**."""
+        values["temp_range"] = max_temp - min_temp
+        if buf.tell():
+            buf.write("\n\n")
+        buf.write(_TEMP_TMPL.format_map(values))
         
         if hotspot_count > 0:
-            temp_section += f"""
-
-**{hotspot_count:,} thermal hotspot pixels** were identified, covering approximately **{affected_area:.2f} km²** of land area. These hotspots represent locations where temperatures exceed the regional mean by more than 2 standard deviations."""
-        
-        sections.append(temp_section)
+            buf.write(_HOTSPOT_TMPL.format_map(values))
     
     # ========== Section 3: Land Cover Analysis ==========
-    land_cover_section = f"""### Land Cover Composition
-
-The study area contains:
-- **{urban_pct:.1f}%** urban/built-up surfaces
-- **{vegetation_pct:.1f}%** vegetation cover
-- **{water_pct:.1f}%** water bodies"""
+    if buf.tell():
+        buf.write("\n\n")
+    buf.write(_LAND_COVER_TMPL.format_map(values))
     
     if urban_pct > 60:
-        land_cover_section += f"""
-
-⚠️ **High Urban Density Alert**: With more than 60% impervious surface coverage, this area is highly susceptible to heat accumulation. Urban surfaces absorb and retain solar radiation, contributing significantly to elevated temperatures."""
+        buf.write(_URBAN_HIGH_TMPL)
     elif urban_pct > 40:
-        land_cover_section += f"""
-
-The urban coverage is moderately high. As impervious surfaces continue to expand, UHI effects are likely to intensify without mitigation measures."""
-    
-    sections.append(land_cover_section)
+        buf.write(_URBAN_MED_TMPL)
     
     # ========== Section 4: Vegetation Health ==========
     if mean_ndvi is not None:
-        if mean_ndvi < 0.2:
-            veg_health = "poor"
-            veg_detail = "indicating minimal healthy vegetation cover"
-        elif mean_ndvi < 0.3:
-            veg_health = "fair"
-            veg_detail = "suggesting sparse or stressed vegetation"
-        elif mean_ndvi < 0.5:
-            veg_health = "moderate"
-            veg_detail = "with mixed vegetation conditions"
-        else:
-            veg_health = "good"
-            veg_detail = "indicating healthy, dense vegetation"
+        veg_health, veg_detail = classify_ndvi_health(mean_ndvi)
+        values["veg_health"] = str(veg_health)
+        values["veg_detail"] = str(veg_detail)
         
-        veg_section = f"""### Vegetation Health
-
-The mean NDVI value of **{mean_ndvi:.2f}** indicates **{veg_health}** vegetation health across the study area, {veg_detail}. Vegetation plays a critical role in urban cooling through evapotranspiration and shading."""
+        buf.write("\n\n")
+        buf.write(_VEG_TMPL.format_map(values))
         
         if mean_ndvi < 0.3:
-            veg_section += """
-
-🌱 **Low Vegetation Alert**: The limited vegetation cover reduces the natural cooling capacity of the area. Green infrastructure investments would provide significant temperature reduction benefits."""
-        
-        sections.append(veg_section)
+            buf.write(_VEG_LOW_TMPL)
     
     # ========== Section 5: Health Impact Assessment ==========
     if uhi_intensity is not None:
-        severity = classify_uhi_severity(uhi_intensity)
-        health_impact = get_health_impact_description(severity)
-        
-        health_section = f"""### Health Impact Assessment
-
-{health_impact}"""
-        sections.append(health_section)
-    
-    return "\n\n".join(sections)
+        buf.write("\n\n")
+        buf.write(_HEALTH_TMPL.format_map(values))
+    
+    return buf.getvalue()
+
+
+# Recommendation description templates, filled with str.format_map()
+_EMERGENCY_COOLING_TMPL = (
+    "With a UHI intensity of {uhi_intensity:.1f}°C, immediate action is required. "
+    "Open cooling centers in affected neighborhoods, extend public facility hours, "
+    "and deploy mobile cooling units to vulnerable areas. Issue public health advisories "
+    "recommending reduced outdoor activity during peak heat hours (11 AM - 4 PM)."
+)
+
+_TREE_CANOPY_TMPL = (
+    "Urban areas cover {urban_pct:.1f}% of the study area. Implement an aggressive "
+    "tree planting program targeting 40% canopy coverage in residential and commercial "
+    "zones. Prioritize shade trees along pedestrian corridors, parking lots, and around "
+    "buildings. Each 10% increase in tree canopy can reduce ambient temperatures by 1-2°C."
+)
+
+_GREEN_NETWORK_TMPL = (
+    "Mean NDVI of {mean_ndvi:.2f} indicates insufficient vegetation for effective "
+    "cooling. Develop a connected green infrastructure network including pocket parks, "
+    "green corridors, bioswales, and urban gardens. Target conversion of 5% of "
+    "impervious surfaces to vegetated areas within identified hotspot zones."
+)
+
+_HOTSPOT_MITIGATION_TMPL = (
+    "Approximately {affected_area:.2f} km² has been identified as thermal hotspots. "
+    "Prioritize these areas for immediate interventions including shade structures, "
+    "misting systems, and reflective surface treatments. Create detailed micro-climate "
+    "improvement plans for the top 10 most critical hotspot clusters."
+)
+
+_HEAT_ACTION_PLAN_TMPL = (
+    "The moderate UHI intensity of {uhi_intensity:.1f}°C warrants a comprehensive "
+    "heat action plan. Establish early warning systems, identify vulnerable populations, "
+    "and create neighborhood-level response protocols. Train community health workers "
+    "on heat illness prevention and response."
+)
+
+# Recommendations without analysis-specific values are shared across calls
+_COOL_PAVEMENT_REC = Recommendation(
+    title="Implement Cool Pavement Program",
+    description=(
+        "Apply high-albedo coatings or reflective surfaces to roads and parking lots "
+        "in identified hotspot areas. Cool pavement technologies can reduce surface "
+        "temperatures by 10-20°C compared to traditional asphalt, directly mitigating "
+        "UHI effects in severely affected zones."
+    ),
+    priority=Priority.HIGH,
+    category="Infrastructure",
+    timeframe="Short-term (3-6 months)",
+    estimated_impact="High",
+)
+
+_GREEN_BUILDING_REC = Recommendation(
+    title="Mandate Green Building Standards",
+    description=(
+        "Require cool roofs (high Solar Reflectance Index) and green roofs for new "
+        "construction and major renovations. Cool roofs can reduce surface temperatures "
+        "by up to 30°C compared to dark roofs. Offer tax incentives for voluntary retrofits."
+    ),
+    priority=Priority.MEDIUM,
+    category="Policy",
+    timeframe="Medium-term (1-2 years)",
+    estimated_impact="Medium",
+)
+
+_COMMUNITY_GARDEN_REC = Recommendation(
+    title="Establish Community Garden Program",
+    description=(
+        "Convert vacant lots and underutilized spaces in heat-vulnerable neighborhoods "
+        "into community gardens. This provides both cooling benefits and community "
+        "resilience through local food production. Target 5 new community gardens "
+        "per high-impact area."
+    ),
+    priority=Priority.MEDIUM,
+    category="Community",
+    timeframe="Short-term (6-12 months)",
+    estimated_impact="Medium",
+)
+
+_BLUE_INFRASTRUCTURE_REC = Recommendation(
+    title="Integrate Blue Infrastructure",
+    description=(
+        "Incorporate water features such as fountains, splash pads, and urban streams "
+        "in high-traffic public spaces. Water bodies and evaporative cooling features "
+        "can reduce local temperatures by 2-4°C. Prioritize locations near transit stops "
+        "and community gathering spaces."
+    ),
+    priority=Priority.MEDIUM,
+    category="Blue Infrastructure",
+    timeframe="Medium-term (1-2 years)",
+    estimated_impact="Medium",
+)
+
+_MONITORING_REC = Recommendation(
+    title="Establish Long-term Monitoring Program",
+    description=(
+        "Implement continuous thermal monitoring using satellite imagery and ground-based "
+        "sensors. Track UHI trends seasonally and evaluate mitigation effectiveness. "
+        "Create public dashboards showing real-time heat conditions and historical trends."
+    ),
+    priority=Priority.LOW,
+    category="Monitoring",
+    timeframe="Ongoing",
+    estimated_impact="Low",
+)
 
 
 def generate_recommendations(
@@ -283,105 +538,57 @@ def generate_recommendations(
     mean_ndvi = ndvi_stats.get("mean", 0.5) or 0.5
     max_temp = lst_stats.get("max", 35) or 35
     
+    values = {
+        "uhi_intensity": uhi_intensity,
+        "affected_area": affected_area,
+        "urban_pct": urban_pct,
+        "mean_ndvi": mean_ndvi,
+    }
+    
     # ========== Critical: Severe UHI (>5°C) ==========
     if uhi_intensity > 5:
         recommendations.append(Recommendation(
             title="Activate Emergency Cooling Measures",
-            description=(
-                f"With a UHI intensity of {uhi_intensity:.1f}°C, immediate action is required. "
-                "Open cooling centers in affected neighborhoods, extend public facility hours, "
-                "and deploy mobile cooling units to vulnerable areas. Issue public health advisories "
-                "recommending reduced outdoor activity during peak heat hours (11 AM - 4 PM)."
-            ),
+            description=_EMERGENCY_COOLING_TMPL.format_map(values),
             priority=Priority.CRITICAL,
             category="Emergency Response",
             timeframe="Immediate",
             estimated_impact="High",
         ))
         
-        recommendations.append(Recommendation(
-            title="Implement Cool Pavement Program",
-            description=(
-                "Apply high-albedo coatings or reflective surfaces to roads and parking lots "
-                "in identified hotspot areas. Cool pavement technologies can reduce surface "
-                "temperatures by 10-20°C compared to traditional asphalt, directly mitigating "
-                "UHI effects in severely affected zones."
-            ),
-            priority=Priority.HIGH,
-            category="Infrastructure",
-            timeframe="Short-term (3-6 months)",
-            estimated_impact="High",
-        ))
+        recommendations.append(_COOL_PAVEMENT_REC)
     
     # ========== High Urban Coverage (>60%) ==========
     if urban_pct > 60:
         recommendations.append(Recommendation(
             title="Expand Urban Tree Canopy Program",
-            description=(
-                f"Urban areas cover {urban_pct:.1f}% of the study area. Implement an aggressive "
-                "tree planting program targeting 40% canopy coverage in residential and commercial "
-                "zones. Prioritize shade trees along pedestrian corridors, parking lots, and around "
-                "buildings. Each 10% increase in tree canopy can reduce ambient temperatures by 1-2°C."
-            ),
+            description=_TREE_CANOPY_TMPL.format_map(values),
             priority=Priority.HIGH,
             category="Green Infrastructure",
             timeframe="Long-term (2-5 years)",
             estimated_impact="High",
         ))
         
-        recommendations.append(Recommendation(
-            title="Mandate Green Building Standards",
-            description=(
-                "Require cool roofs (high Solar Reflectance Index) and green roofs for new "
-                "construction and major renovations. Cool roofs can reduce surface temperatures "
-                "by up to 30°C compared to dark roofs. Offer tax incentives for voluntary retrofits."
-            ),
-            priority=Priority.MEDIUM,
-            category="Policy",
-            timeframe="Medium-term (1-2 years)",
-            estimated_impact="Medium",
-        ))
+        recommendations.append(_GREEN_BUILDING_REC)
     
     # ========== Low NDVI (<0.3) ==========
     if mean_ndvi < 0.3:
         recommendations.append(Recommendation(
             title="Invest in Green Infrastructure Network",
-            description=(
-                f"Mean NDVI of {mean_ndvi:.2f} indicates insufficient vegetation for effective "
-                "cooling. Develop a connected green infrastructure network including pocket parks, "
-                "green corridors, bioswales, and urban gardens. Target conversion of 5% of "
-                "impervious surfaces to vegetated areas within identified hotspot zones."
-            ),
+            description=_GREEN_NETWORK_TMPL.format_map(values),
             priority=Priority.HIGH,
             category="Green Infrastructure",
             timeframe="Medium-term (1-3 years)",
             estimated_impact="High",
         ))
         
-        recommendations.append(Recommendation(
-            title="Establish Community Garden Program",
-            description=(
-                "Convert vacant lots and underutilized spaces in heat-vulnerable neighborhoods "
-                "into community gardens. This provides both cooling benefits and community "
-                "resilience through local food production. Target 5 new community gardens "
-                "per high-impact area."
-            ),
-            priority=Priority.MEDIUM,
-            category="Community",
-            timeframe="Short-term (6-12 months)",
-            estimated_impact="Medium",
-        ))
+        recommendations.append(_COMMUNITY_GARDEN_REC)
     
     # ========== Significant Hotspots ==========
     if hotspot_count > 1000 or affected_area > 1.0:
         recommendations.append(Recommendation(
             title="Target Hotspot Mitigation Zones",
-            description=(
-                f"Approximately {affected_area:.2f} km² has been identified as thermal hotspots. "
-                "Prioritize these areas for immediate interventions including shade structures, "
-                "misting systems, and reflective surface treatments. Create detailed micro-climate "
-                "improvement plans for the top 10 most critical hotspot clusters."
-            ),
+            description=_HOTSPOT_MITIGATION_TMPL.format_map(values),
             priority=Priority.HIGH,
             category="Targeted Intervention",
             timeframe="Short-term (3-6 months)",
@@ -392,12 +599,7 @@ def generate_recommendations(
     if uhi_intensity > 3 and uhi_intensity <= 5:
         recommendations.append(Recommendation(
             title="Develop Heat Action Plan",
-            description=(
-                f"The moderate UHI intensity of {uhi_intensity:.1f}°C warrants a comprehensive "
-                "heat action plan. Establish early warning systems, identify vulnerable populations, "
-                "and create neighborhood-level response protocols. Train community health workers "
-                "on heat illness prevention and response."
-            ),
+            description=_HEAT_ACTION_PLAN_TMPL.format_map(values),
             priority=Priority.MEDIUM,
             category="Planning",
             timeframe="Medium-term (6-12 months)",
@@ -406,64 +608,28 @@ def generate_recommendations(
     
     # ========== Water features ==========
     if uhi_intensity > 3 and vegetation_pct < 30:
-        recommendations.append(Recommendation(
-            title="Integrate Blue Infrastructure",
-            description=(
-                "Incorporate water features such as fountains, splash pads, and urban streams "
-                "in high-traffic public spaces. Water bodies and evaporative cooling features "
-                "can reduce local temperatures by 2-4°C. Prioritize locations near transit stops "
-                "and community gathering spaces."
-            ),
-            priority=Priority.MEDIUM,
-            category="Blue Infrastructure",
-            timeframe="Medium-term (1-2 years)",
-            estimated_impact="Medium",
-        ))
+        recommendations.append(_BLUE_INFRASTRUCTURE_REC)
     
     # ========== General (always include at least one) ==========
     if len(recommendations) < 3:
-        recommendations.append(Recommendation(
-            title="Establish Long-term Monitoring Program",
-            description=(
-                "Implement continuous thermal monitoring using satellite imagery and ground-based "
-                "sensors. Track UHI trends seasonally and evaluate mitigation effectiveness. "
-                "Create public dashboards showing real-time heat conditions and historical trends."
-            ),
-            priority=Priority.LOW,
-            category="Monitoring",
-            timeframe="Ongoing",
-            estimated_impact="Low",
-        ))
+        recommendations.append(_MONITORING_REC)
     
-    # Sort by priority (highest first) and limit
-    recommendations.sort(key=lambda r: r.priority, reverse=True)
-    return recommendations[:max_recommendations]
+    # Select the highest-priority recommendations (ties keep insertion order)
+    return heapq.nlargest(
+        max_recommendations, recommendations, key=operator.attrgetter("priority")
+    )
 
 
-def generate_insights(
+def _assemble_insights(
     uhi_result: Dict[str, Any],
     land_cover_stats: Dict[str, Any],
     ndvi_stats: Dict[str, Any],
     lst_stats: Dict[str, Any],
+    uhi_intensity: float,
+    severity: UHISeverity,
+    severity_desc: str,
 ) -> Dict[str, Any]:
-    """
-    Generate comprehensive insights including explanation and recommendations.
-    
-    This is the main entry point for insight generation.
-    
-    Args:
-        uhi_result: Results from analyze_uhi()
-        land_cover_stats: Results from get_land_cover_statistics()
-        ndvi_stats: Results from get_ndvi_statistics()
-        lst_stats: Results from get_lst_statistics()
-    
-    Returns:
-        Dictionary containing:
-        - explanation: Natural language explanation string
-        - recommendations: List of Recommendation dicts
-        - severity: UHI severity level
-        - summary_metrics: Key metrics for quick reference
-    """
+    """Build the insights dictionary for an already classified analysis."""
     # Generate explanation
     explanation = generate_explanation(
         uhi_result, land_cover_stats, ndvi_stats, lst_stats
@@ -474,16 +640,12 @@ def generate_insights(
         uhi_result, land_cover_stats, ndvi_stats, lst_stats
     )
     
-    # Determine overall severity
-    uhi_intensity = uhi_result.get("uhi_intensity", 0) or 0
-    severity = classify_uhi_severity(uhi_intensity)
-    
     # Create summary metrics
     lc_percentages = land_cover_stats.get("class_percentages", {})
     
     summary_metrics = {
         "uhi_intensity_c": uhi_intensity,
-        "uhi_severity": SEVERITY_DESCRIPTIONS[severity],
+        "uhi_severity": severity_desc,
         "urban_coverage_pct": lc_percentages.get("Urban/Built-up", 0),
         "vegetation_coverage_pct": lc_percentages.get("Vegetation", 0),
         "mean_ndvi": ndvi_stats.get("mean"),
@@ -497,7 +659,76 @@ def generate_insights(
         "explanation": explanation,
         "recommendations": [r.to_dict() for r in recommendations],
         "recommendation_count": len(recommendations),
-        "severity": SEVERITY_DESCRIPTIONS[severity],
+        "severity": severity_desc,
         "severity_value": int(severity),
         "summary_metrics": summary_metrics,
     }
+
+
+@_memoize_insights
+def generate_insights(
+    uhi_result: Dict[str, Any],
+    land_cover_stats: Dict[str, Any],
+    ndvi_stats: Dict[str, Any],
+    lst_stats: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Generate comprehensive insights including explanation and recommendations.
+    
+    This is the main entry point for insight generation.
+    
+    Args:
+        uhi_result: Results from analyze_uhi()
+        land_cover_stats: Results from get_land_cover_statistics()
+        ndvi_stats: Results from get_ndvi_statistics()
+        lst_stats: Results from get_lst_statistics()
+    
+    Returns:
+        Dictionary containing:
+        - explanation: Natural language explanation string
+        - recommendations: List of Recommendation dicts
+        - severity: UHI severity level
+        - summary_metrics: Key metrics for quick reference
+    """
+    uhi_intensity = uhi_result.get("uhi_intensity", 0) or 0
+    severity = classify_uhi_severity(uhi_intensity)
+    severity_desc = _SEVERITY_TABLE[severity].description
+    
+    return _assemble_insights(
+        uhi_result, land_cover_stats, ndvi_stats, lst_stats,
+        uhi_intensity, severity, severity_desc,
+    )
+
+
+def generate_insights_batch(
+    records: Sequence[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """
+    Generate insights for many analyses (e.g. a time series or several regions).
+    
+    Severity classification for all records is done in a single vectorized
+    call; explanations and recommendations are then generated per record.
+    
+    Args:
+        records: Sequence of (uhi_result, land_cover_stats, ndvi_stats,
+            lst_stats) tuples, as accepted by generate_insights()
+    
+    Returns:
+        List of insight dictionaries in the same order as the input records
+    """
+    if not records:
+        return []
+    
+    intensities = [record[0].get("uhi_intensity", 0) or 0 for record in records]
+    severities = classify_uhi_severity_batch(np.array(intensities, dtype=np.float64))
+    descriptions = np.take(_SEVERITY_DESC_ARR, severities)
+    
+    insights = []
+    for record, uhi_intensity, severity, severity_desc in zip(
+        records, intensities, severities, descriptions
+    ):
+        insights.append(_assemble_insights(
+            *record, uhi_intensity, UHISeverity(int(severity)), str(severity_desc),
+        ))
+    
+    return insights
@@ -5,50 +5,117 @@ This module contains functions for calculating various vegetation and
 urban heat indices from Landsat 8/9 imagery.
 """
 
-from .ndvi import (
-    calculate_ndvi, 
-    classify_ndvi, 
-    NDVICategory,
-    get_ndvi_statistics,
-    get_classification_percentages,
-)
-from .lst import (
-    dn_to_radiance,
-    radiance_to_brightness_temperature,
-    estimate_emissivity_from_ndvi,
-    calculate_lst,
-    calculate_lst_from_band10,
-    get_lst_statistics,
-    classify_lst_thermal_zones,
-    ThermalConstants,
-    RadianceCoefficients,
-)
-from .land_cover import (
-    LandCoverClass,
-    calculate_ndwi,
-    calculate_urban_index,
-    calculate_ndbi,
-    classify_land_cover,
-    get_land_cover_statistics,
-    create_color_visualization,
-    export_classification_legend,
-    calculate_all_indices,
-)
-from .uhi import (
-    UHICategory,
-    analyze_uhi,
-    identify_hotspots,
-    count_hotspot_clusters,
-    calculate_affected_area,
-    classify_uhi_intensity,
-    create_uhi_map,
-    create_hotspot_visualization,
-    get_uhi_summary,
-)
+from typing import TYPE_CHECKING
+
+from utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    # Static view of the lazy exports for type checkers and IDEs
+    from .ndvi import (
+        calculate_ndvi,
+        calculate_ndvi_streaming,
+        classify_ndvi,
+        NDVICategory,
+        get_ndvi_statistics,
+        get_classification_percentages,
+    )
+    from .lst import (
+        dn_to_radiance,
+        radiance_to_brightness_temperature,
+        estimate_emissivity_from_ndvi,
+        calculate_lst,
+        calculate_lst_from_band10,
+        calculate_ndvi_lst,
+        get_lst_statistics,
+        classify_lst_thermal_zones,
+        get_thermal_zone_percentages,
+        ThermalConstants,
+        RadianceCoefficients,
+        LSTWorkspace,
+    )
+    from .land_cover import (
+        LandCoverClass,
+        calculate_ndwi,
+        calculate_urban_index,
+        calculate_ndbi,
+        classify_land_cover,
+        get_land_cover_statistics,
+        create_color_visualization,
+        export_classification_legend,
+        calculate_all_indices,
+    )
+    from .uhi import (
+        UHICategory,
+        analyze_uhi,
+        identify_hotspots,
+        count_hotspot_clusters,
+        calculate_affected_area,
+        classify_uhi_intensity,
+        create_uhi_map,
+        create_hotspot_visualization,
+        get_uhi_summary,
+    )
+    from ._common import (
+        set_num_threads,
+        get_num_threads,
+    )
+    from ._warmup import warmup_kernels
+
+# Public name -> submodule that defines it.
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing the package does not pull in every dependency up front.
+_LAZY_IMPORTS = {
+    # NDVI
+    "calculate_ndvi": "ndvi",
+    "calculate_ndvi_streaming": "ndvi",
+    "classify_ndvi": "ndvi",
+    "NDVICategory": "ndvi",
+    "get_ndvi_statistics": "ndvi",
+    "get_classification_percentages": "ndvi",
+    # LST
+    "dn_to_radiance": "lst",
+    "radiance_to_brightness_temperature": "lst",
+    "estimate_emissivity_from_ndvi": "lst",
+    "calculate_lst": "lst",
+    "calculate_lst_from_band10": "lst",
+    "calculate_ndvi_lst": "lst",
+    "get_lst_statistics": "lst",
+    "classify_lst_thermal_zones": "lst",
+    "get_thermal_zone_percentages": "lst",
+    "ThermalConstants": "lst",
+    "RadianceCoefficients": "lst",
+    "LSTWorkspace": "lst",
+    # Land Cover
+    "LandCoverClass": "land_cover",
+    "calculate_ndwi": "land_cover",
+    "calculate_urban_index": "land_cover",
+    "calculate_ndbi": "land_cover",
+    "classify_land_cover": "land_cover",
+    "get_land_cover_statistics": "land_cover",
+    "create_color_visualization": "land_cover",
+    "export_classification_legend": "land_cover",
+    "calculate_all_indices": "land_cover",
+    # UHI
+    "UHICategory": "uhi",
+    "analyze_uhi": "uhi",
+    "identify_hotspots": "uhi",
+    "count_hotspot_clusters": "uhi",
+    "calculate_affected_area": "uhi",
+    "classify_uhi_intensity": "uhi",
+    "create_uhi_map": "uhi",
+    "create_hotspot_visualization": "uhi",
+    "get_uhi_summary": "uhi",
+    # Threads
+    "set_num_threads": "_common",
+    "get_num_threads": "_common",
+    # Warm-up
+    "warmup_kernels": "_warmup",
+}
 
 __all__ = [
     # NDVI
     "calculate_ndvi",
+    "calculate_ndvi_streaming",
     "classify_ndvi", 
     "NDVICategory",
     "get_ndvi_statistics",
@@ -59,10 +126,13 @@ __all__ = [
     "estimate_emissivity_from_ndvi",
     "calculate_lst",
     "calculate_lst_from_band10",
+    "calculate_ndvi_lst",
     "get_lst_statistics",
     "classify_lst_thermal_zones",
+    "get_thermal_zone_percentages",
     "ThermalConstants",
     "RadianceCoefficients",
+    "LSTWorkspace",
     # Land Cover
     "LandCoverClass",
     "calculate_ndwi",
@@ -83,6 +153,11 @@ __all__ = [
     "create_uhi_map",
     "create_hotspot_visualization",
     "get_uhi_summary",
+    # Threads
+    "set_num_threads",
+    "get_num_threads",
+    # Warm-up
+    "warmup_kernels",
 ]
 
-
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS, __all__)
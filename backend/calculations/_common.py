@@ -0,0 +1,279 @@
+"""
+Shared helpers for the calculation modules.
+
+Row tiling, Numba kernel input/output buffers and the single-pass masked
+statistics used by the NDVI, LST and UHI modules. Private to the package:
+the public modules import from here and never from each other's private
+helpers.
+"""
+
+import math
+import os
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Numba is optional; without it statistics are reduced tile by tile in NumPy.
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# CuPy is optional; CuPy arrays are reduced on the GPU.
+try:
+    import cupy as cp
+    HAS_CUPY = True
+except ImportError:
+    HAS_CUPY = False
+
+
+# Threads the calculation thread pools and Numba kernels may use (default:
+# all cores); analysis worker processes lower it to their share
+_num_threads = os.cpu_count() or 1
+
+
+def set_num_threads(num_threads: int) -> None:
+    """
+    Limit the threads the calculations use in this process.
+    
+    Applies to the thread pools of the land cover and UHI modules and, when
+    installed, to the Numba parallel kernels.
+    
+    Args:
+        num_threads: Maximum number of threads (at least 1 is used)
+    """
+    global _num_threads
+    _num_threads = max(1, int(num_threads))
+    if HAS_NUMBA:
+        numba.set_num_threads(min(_num_threads, numba.config.NUMBA_NUM_THREADS))
+
+
+def get_num_threads() -> int:
+    """Return the thread limit set with set_num_threads (default: CPU count)."""
+    return _num_threads
+
+
+# Target size of one row tile of an input band for fused index computation.
+# Tiles this small keep every band slice and output of the tile in cache.
+TILE_BYTES = 256 * 1024
+
+
+def _row_tiles(
+    shape: Tuple[int, ...],
+    itemsize: int = 8,
+    target_bytes: int = TILE_BYTES,
+) -> Iterator[slice]:
+    """
+    Yield row slices that split an array of the given shape into tiles.
+    
+    Args:
+        shape: Shape of the array being tiled (rows along axis 0)
+        itemsize: Bytes per element
+        target_bytes: Approximate size of one tile in bytes
+    
+    Yields:
+        Slices over axis 0 covering all rows
+    """
+    if len(shape) == 0:
+        yield slice(None)
+        return
+    
+    row_bytes = max(1, int(np.prod(shape[1:], dtype=np.int64)) * itemsize)
+    rows_per_tile = max(1, target_bytes // row_bytes)
+    
+    for start in range(0, shape[0], rows_per_tile):
+        yield slice(start, min(start + rows_per_tile, shape[0]))
+
+
+# Input dtypes the Numba kernels read directly: integers (raw DNs) and the
+# two float widths; anything else is converted up front
+_KERNEL_FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def _kernel_input(array: Any, dtype: DTypeLike) -> NDArray:
+    """
+    Return array as a C-contiguous Numba kernel input.
+    
+    Integer, float32 and float64 arrays keep their native dtype (the kernels
+    are compiled per input dtype and cast each pixel to the output dtype),
+    so e.g. uint16 DNs are never upcast into a full-size float copy. Other
+    dtypes are converted to dtype.
+    """
+    array = np.asarray(array)
+    if array.dtype.isnative and (
+        array.dtype.kind in "ui" or array.dtype in _KERNEL_FLOAT_DTYPES
+    ):
+        return np.asarray(array, order="C")
+    return np.asarray(array, dtype=dtype, order="C")
+
+
+def _kernel_output(out: NDArray) -> NDArray:
+    """
+    Return out, or a C-contiguous scratch array like it if out is strided.
+    
+    The Numba kernels write flat C-order buffers; a strided out (e.g. a
+    column window of a larger raster) is filled by computing into the
+    scratch array and copying it in with np.copyto(out, buffer) afterwards.
+    """
+    if out.flags.c_contiguous:
+        return out
+    return np.empty(out.shape, dtype=out.dtype)
+
+
+if HAS_NUMBA:
+    @numba.njit(parallel=True, cache=True)
+    def _masked_moments_kernel(values, zone, nodata_value, n_chunks):
+        """
+        Return count, min, max, mean and M2 of valid pixels in one pass.
+        
+        A pixel is counted if it is finite, not nodata and (when zone is
+        given) inside the zone, so no mask or gathered copy is materialized.
+        Each chunk runs Welford's update in float64; chunk results are merged
+        with the pairwise (Chan et al.) combination.
+        """
+        n = values.size
+        chunk_size = (n + n_chunks - 1) // n_chunks
+        counts = np.zeros(n_chunks, dtype=np.int64)
+        mins = np.full(n_chunks, np.inf)
+        maxs = np.full(n_chunks, -np.inf)
+        means = np.zeros(n_chunks)
+        m2s = np.zeros(n_chunks)
+        
+        for c in numba.prange(n_chunks):
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            lo = np.inf
+            hi = -np.inf
+            for i in range(c * chunk_size, min((c + 1) * chunk_size, n)):
+                if zone is not None and not zone[i]:
+                    continue
+                x = np.float64(values[i])
+                if x == nodata_value or not math.isfinite(x):
+                    continue
+                count += 1
+                delta = x - mean
+                mean += delta / count
+                m2 += delta * (x - mean)
+                lo = min(lo, x)
+                hi = max(hi, x)
+            counts[c] = count
+            means[c] = mean
+            m2s[c] = m2
+            mins[c] = lo
+            maxs[c] = hi
+        
+        total = 0
+        total_mean = 0.0
+        total_m2 = 0.0
+        for c in range(n_chunks):
+            if counts[c] == 0:
+                continue
+            merged = total + counts[c]
+            delta = means[c] - total_mean
+            total_mean += delta * counts[c] / merged
+            total_m2 += m2s[c] + delta * delta * total * counts[c] / merged
+            total = merged
+        
+        return total, mins.min(), maxs.max(), total_mean, total_m2
+
+
+def _masked_statistics(
+    lst: NDArray[np.floating],
+    nodata_value: float = -9999.0,
+    mask: Optional[NDArray[np.bool_]] = None,
+    valid_mask: Optional[NDArray[np.bool_]] = None,
+) -> Dict[str, Optional[float]]:
+    """
+    Calculate min, max, mean, std and pixel count of valid LST pixels.
+    
+    Args:
+        lst: LST array in Celsius
+        nodata_value: Value indicating no-data pixels
+        mask: Optional boolean mask restricting the pixels considered
+        valid_mask: Optional pre-computed mask of finite, non-nodata LST
+            pixels (the Numba kernel tests validity inline and ignores it)
+    
+    Returns:
+        Dictionary with min, max, mean, std, and pixel count
+        (statistics are None when no pixel is valid)
+    """
+    if HAS_CUPY and isinstance(lst, cp.ndarray):
+        # GPU reduction kernels over the gathered valid pixels
+        if valid_mask is None:
+            valid_mask = (lst != nodata_value) & cp.isfinite(lst)
+        if mask is not None:
+            valid_mask = valid_mask & cp.asarray(mask)
+        valid_temps = lst[valid_mask]
+        count = int(valid_temps.size)
+        if count:
+            lst_min = valid_temps.min()
+            lst_max = valid_temps.max()
+            lst_mean = valid_temps.mean(dtype=np.float64)
+            lst_std = valid_temps.std(dtype=np.float64)
+    elif HAS_NUMBA:
+        count, lst_min, lst_max, lst_mean, m2 = _masked_moments_kernel(
+            np.ravel(lst),
+            None if mask is None else np.ravel(mask),
+            nodata_value,
+            numba.get_num_threads(),
+        )
+        lst_std = math.sqrt(m2 / count) if count else None
+    else:
+        # Reduce row tiles and merge their moments, so the validity mask and
+        # gathered values only ever exist at cache-sized tile scale
+        lst = np.atleast_1d(lst)
+        if mask is not None:
+            mask = np.atleast_1d(mask)
+        if valid_mask is not None:
+            valid_mask = np.atleast_1d(valid_mask)
+        count = 0
+        lst_mean = 0.0
+        m2 = 0.0
+        lst_min = np.inf
+        lst_max = -np.inf
+        for rows in _row_tiles(lst.shape, lst.itemsize):
+            tile = lst[rows]
+            if valid_mask is not None:
+                tile_valid = valid_mask[rows]
+            else:
+                tile_valid = (tile != nodata_value) & np.isfinite(tile)
+            if mask is not None:
+                tile_valid = tile_valid & mask[rows]
+            valid_temps = tile[tile_valid]
+            tile_count = valid_temps.size
+            if tile_count == 0:
+                continue
+            
+            tile_mean = valid_temps.mean(dtype=np.float64)
+            deviations = valid_temps - tile_mean
+            tile_m2 = float(np.dot(deviations, deviations))
+            
+            # Pairwise (Chan et al.) combination, as in the Numba kernel
+            merged = count + tile_count
+            delta = tile_mean - lst_mean
+            lst_mean += delta * tile_count / merged
+            m2 += tile_m2 + delta * delta * count * tile_count / merged
+            count = merged
+            lst_min = min(lst_min, valid_temps.min())
+            lst_max = max(lst_max, valid_temps.max())
+        lst_std = math.sqrt(m2 / count) if count else None
+    
+    if count == 0:
+        return {
+            "min": None,
+            "max": None,
+            "mean": None,
+            "std": None,
+            "pixel_count": 0,
+        }
+    
+    return {
+        "min": float(lst_min),
+        "max": float(lst_max),
+        "mean": float(lst_mean),
+        "std": float(lst_std),
+        "pixel_count": int(count),
+    }
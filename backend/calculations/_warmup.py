@@ -0,0 +1,60 @@
+"""
+Numba Kernel Warm-up
+
+Compiles the kernels of the analysis pipeline ahead of the first request.
+Kept apart from the calculation modules because it drives all of them:
+NDVI and LST sit below land cover and UHI in the package's layering.
+"""
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from ._common import HAS_NUMBA
+from .land_cover import LandCoverClass
+from .lst import calculate_lst_from_band10, calculate_ndvi_lst
+from .ndvi import calculate_ndvi
+from .uhi import analyze_uhi, create_uhi_map
+
+
+def warmup_kernels(dtype: DTypeLike = np.float32) -> bool:
+    """
+    Compile the Numba kernels of the analysis pipeline before first use.
+    
+    Covers the NDVI, LST and UHI (statistics, hotspots, anomaly map)
+    kernels. They are JIT-compiled with cache=True, so after the first run
+    this only loads them from the on-disk cache. Call it once in each
+    process that runs the analysis so its first request does not pay the
+    compilation latency; other input dtypes and kernels outside the
+    pipeline (hotspot rendering, heatmap points) compile on first use.
+    
+    Args:
+        dtype: Floating-point dtype to compile the kernels for (default: float32)
+    
+    Returns:
+        True if the kernels were compiled, False if Numba is not installed
+    """
+    if not HAS_NUMBA:
+        return False
+    
+    # A single valid pixel runs the NDVI, LST and statistics kernels (for
+    # inputs already in dtype; other input dtypes compile on first use)
+    ndvi = calculate_ndvi(
+        np.full((1, 1), 0.4, dtype=dtype), np.full((1, 1), 0.2, dtype=dtype), dtype=dtype
+    )
+    calculate_lst_from_band10(np.full((1, 1), 25000.0, dtype=dtype), ndvi, dtype=dtype)
+    calculate_ndvi_lst(
+        np.full((1, 1), 0.4, dtype=dtype), np.full((1, 1), 0.2, dtype=dtype),
+        np.full((1, 1), 25000.0, dtype=dtype), dtype=dtype,
+    )
+    
+    # Urban and rural pixels with one hotspot run the UHI statistics,
+    # hotspot labelling and anomaly map kernels
+    lst = np.array([[30.0, 30.0], [30.0, 45.0]], dtype=dtype)
+    land_cover = np.array(
+        [[LandCoverClass.VEGETATION, LandCoverClass.URBAN],
+         [LandCoverClass.URBAN, LandCoverClass.URBAN]],
+        dtype=np.int8,
+    )
+    analyze_uhi(lst, land_cover, hotspot_std_threshold=1.0)
+    create_uhi_map(lst, land_cover)
+    return True
@@ -20,12 +20,18 @@ References:
 - Zha, Y., et al. (2003). Use of normalized difference built-up index
 """
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from numpy.typing import NDArray
-from typing import Dict, Tuple, Optional
+from numpy.typing import DTypeLike, NDArray
+from typing import Dict, List, Tuple, Optional
 from enum import IntEnum
 from dataclasses import dataclass
 
+from ._common import _row_tiles, get_num_threads
+
 
 class LandCoverClass(IntEnum):
     """Land cover classification categories."""
@@ -45,6 +51,14 @@ LAND_COVER_COLORS = {
     LandCoverClass.BARE_SOIL: (210, 180, 140), # Tan
 }
 
+# RGBA lookup table indexed by class value (transparent nodata). The extra
+# trailing transparent row absorbs out-of-range class values.
+_COLOR_LUT = np.array(
+    [(*LAND_COVER_COLORS[cls], 0 if cls == LandCoverClass.NODATA else 255)
+     for cls in LandCoverClass] + [(0, 0, 0, 0)],
+    dtype=np.uint8,
+)
+
 LAND_COVER_NAMES = {
     LandCoverClass.NODATA: "No Data",
     LandCoverClass.WATER: "Water",
@@ -73,11 +87,221 @@ class ClassificationThresholds:
 
 THRESHOLDS = ClassificationThresholds()
 
+# Thread pool for the tiled index computation, created on first use and
+# shared by all calls (classify_land_cover runs once per row strip)
+_tile_pool: Optional[ThreadPoolExecutor] = None
+_tile_pool_lock = threading.Lock()
+
+
+def _get_tile_pool() -> ThreadPoolExecutor:
+    """Return the shared tile thread pool, creating it on first use."""
+    global _tile_pool
+    with _tile_pool_lock:
+        if _tile_pool is None:
+            _tile_pool = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix="land_cover"
+            )
+    return _tile_pool
+
+
+def _to_nan(
+    band: NDArray[np.floating],
+    nodata_value: float,
+    dtype: DTypeLike,
+) -> NDArray[np.floating]:
+    """Cast band to dtype with nodata pixels replaced by NaN."""
+    band = np.asarray(band, dtype=dtype)
+    return np.where(band == nodata_value, np.nan, band)
+
+
+def _has_negative(band: NDArray[np.floating]) -> bool:
+    """Return True if band holds any negative value (NaN is ignored)."""
+    return band.size > 0 and bool(np.fmin.reduce(band, axis=None) < 0)
+
+
+def _normalized_difference(
+    a: NDArray[np.floating],
+    b: NDArray[np.floating],
+    out: NDArray[np.floating],
+    nodata_value: float,
+    valid_mask: Optional[NDArray[np.bool_]] = None,
+    clip: bool = True,
+) -> None:
+    """
+    Write clipped (a - b) / (a + b) into out, nodata where invalid.
+    
+    Nodata pixels in a and b must already be NaN (see _to_nan) or be
+    excluded by valid_mask. NaN and inf propagate into the difference, so
+    one isfinite() on it replaces separate per-band validity tests.
+    
+    For non-negative a and b, |a - b| <= a + b holds (also after rounding),
+    so the ratio is already within [-1, 1]; callers that know this pass
+    clip=False to skip the clipping pass.
+    """
+    with np.errstate(invalid="ignore"):
+        np.subtract(a, b, out=out)
+        denominator = a + b
+    
+    valid = np.isfinite(out) & (denominator != 0)
+    if valid_mask is not None:
+        valid &= valid_mask
+    
+    np.divide(out, denominator, out=out, where=valid)
+    if clip:
+        np.clip(out, -1.0, 1.0, out=out, where=valid)
+    np.putmask(out, ~valid, nodata_value)
+
+
+def _fused_indices(
+    band_3: NDArray[np.floating],
+    band_4: NDArray[np.floating],
+    band_5: NDArray[np.floating],
+    band_6: NDArray[np.floating],
+    out_ndvi: Optional[NDArray[np.floating]],
+    out_ndwi: NDArray[np.floating],
+    out_ndbi: NDArray[np.floating],
+    out_urban_index: Optional[NDArray[np.floating]],
+    out_mndwi: Optional[NDArray[np.floating]],
+    nodata_value: float = -9999.0,
+    max_workers: Optional[int] = None,
+    out_urban_ratio: Optional[NDArray[np.bool_]] = None,
+) -> None:
+    """
+    Compute NDVI, NDWI, NDBI, Urban Index and MNDWI in one tiled pass.
+    
+    Computation is done in the dtype of the output arrays.
+    
+    Each row tile of the source bands is read once and every index is
+    produced from it while it is cache-resident. Nodata pixels are turned
+    into NaN once per tile, so each index only needs a single isfinite()
+    check on its own difference. Results are identical to the individual
+    calculate_* functions.
+    
+    Tiles write disjoint output rows, so they are processed concurrently
+    on the shared tile thread pool; NumPy releases the GIL inside the
+    ufunc loops.
+    
+    Args:
+        band_3: Band 3 (Green) array
+        band_4: Band 4 (Red) array
+        band_5: Band 5 (NIR) array
+        band_6: Band 6 (SWIR1) array
+        out_ndvi: Output array for NDVI, or None to skip NDVI
+        out_ndwi: Output array for NDWI
+        out_ndbi: Output array for NDBI
+        out_urban_index: Output array for the Urban Index (B6/B5), or None
+            to skip it
+        out_mndwi: Output array for MNDWI, or None to skip MNDWI
+        nodata_value: Value for no-data pixels
+        max_workers: Number of worker threads (default: get_num_threads())
+        out_urban_ratio: Optional boolean output marking pixels whose Urban
+            Index exceeds THRESHOLDS.URBAN_RATIO_MIN, computed without
+            dividing
+    """
+    dtype = out_ndwi.dtype
+    
+    def process_tile(rows: slice) -> None:
+        green = _to_nan(band_3[rows], nodata_value, dtype)
+        nir = _to_nan(band_5[rows], nodata_value, dtype)
+        swir1 = _to_nan(band_6[rows], nodata_value, dtype)
+        
+        # Indices are only clipped when a band in the tile has negative
+        # values (e.g. from atmospheric correction); otherwise they are
+        # bounded by construction
+        neg_green = _has_negative(green)
+        neg_nir = _has_negative(nir)
+        neg_swir1 = _has_negative(swir1)
+        
+        if out_ndvi is not None:
+            red = _to_nan(band_4[rows], nodata_value, dtype)
+            _normalized_difference(
+                nir, red, out_ndvi[rows], nodata_value,
+                clip=neg_nir or _has_negative(red),
+            )
+        
+        _normalized_difference(
+            green, nir, out_ndwi[rows], nodata_value, clip=neg_green or neg_nir
+        )
+        _normalized_difference(
+            swir1, nir, out_ndbi[rows], nodata_value, clip=neg_swir1 or neg_nir
+        )
+        
+        if out_mndwi is not None:
+            _normalized_difference(
+                green, swir1, out_mndwi[rows], nodata_value,
+                clip=neg_green or neg_swir1,
+            )
+        
+        # Urban Index: SWIR1 / NIR
+        if out_urban_index is not None:
+            ui_valid = np.isfinite(swir1) & np.isfinite(nir) & (nir != 0)
+            ui = out_urban_index[rows]
+            np.divide(swir1, nir, out=ui, where=ui_valid)
+            np.putmask(ui, ~ui_valid, nodata_value)
+        
+        # SWIR1 / NIR > t  <=>  SWIR1 > t * NIR for NIR > 0 (flipped for
+        # NIR < 0); NaN nodata compares False
+        if out_urban_ratio is not None:
+            limit = THRESHOLDS.URBAN_RATIO_MIN * nir
+            out_urban_ratio[rows] = np.isfinite(swir1) & np.where(
+                nir > 0, swir1 > limit, (nir < 0) & (swir1 < limit)
+            )
+    
+    tiles = list(_row_tiles(band_5.shape, out_ndwi.itemsize))
+    workers = min(max_workers or get_num_threads(), len(tiles))
+    
+    if workers <= 1:
+        for rows in tiles:
+            process_tile(rows)
+    else:
+        # One task per worker, each taking every workers-th tile, so at
+        # most max_workers threads of the shared pool run this call
+        def process_tiles(group: List[slice]) -> None:
+            for rows in group:
+                process_tile(rows)
+        
+        groups = [tiles[start::workers] for start in range(workers)]
+        # Consume the iterator so worker exceptions propagate
+        list(_get_tile_pool().map(process_tiles, groups))
+
+
+def _label_land_cover(
+    ndvi: NDArray[np.floating],
+    ndwi: NDArray[np.floating],
+    ndbi: NDArray[np.floating],
+    urban_ratio: NDArray[np.bool_],
+    out: NDArray[np.int8],
+    nodata_value: float = -9999.0,
+) -> None:
+    """
+    Write decision-tree land cover labels into out in one tiled pass.
+    
+    np.select picks the first matching condition per pixel, which encodes
+    the Water > Vegetation > Urban > Bare Soil priority directly instead of
+    re-deriving the unclassified remainder after every step. urban_ratio
+    marks pixels whose Urban Index exceeds the urban threshold.
+    """
+    for rows in _row_tiles(out.shape, ndvi.itemsize):
+        v = ndvi[rows]
+        w = ndwi[rows]
+        
+        valid = (v != nodata_value) & (w != nodata_value) & np.isfinite(v) & np.isfinite(w)
+        urban = urban_ratio[rows] | (ndbi[rows] > THRESHOLDS.NDBI_URBAN)
+        
+        out[rows] = np.select(
+            [~valid, w > THRESHOLDS.NDWI_WATER, v > THRESHOLDS.NDVI_VEGETATION, urban],
+            [LandCoverClass.NODATA, LandCoverClass.WATER,
+             LandCoverClass.VEGETATION, LandCoverClass.URBAN],
+            default=LandCoverClass.BARE_SOIL,
+        )
+
 
 def calculate_ndwi(
     green: NDArray[np.floating],
     nir: NDArray[np.floating],
     nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
+    valid_mask: Optional[NDArray[np.bool_]] = None,
 ) -> NDArray[np.floating]:
     """
     Calculate NDWI (Normalized Difference Water Index).
@@ -91,6 +315,9 @@ def calculate_ndwi(
         green: Band 3 (Green) array
         nir: Band 5 (NIR) array
         nodata_value: Value for no-data pixels
+        dtype: Floating-point dtype for computation and output (default: float32)
+        valid_mask: Optional pre-computed mask of pixels where both inputs
+            are finite and not nodata (computed if not provided)
     
     Returns:
         NDWI array with values between -1 and 1
@@ -101,30 +328,23 @@ def calculate_ndwi(
             f"Green: {green.shape}, NIR: {nir.shape}"
         )
     
-    green = green.astype(np.float64)
-    nir = nir.astype(np.float64)
-    
-    # Initialize with nodata
-    ndwi = np.full(green.shape, nodata_value, dtype=np.float64)
-    
-    # Calculate denominator
-    denominator = green + nir
-    
-    # Valid pixel mask
-    valid_mask = (
-        np.isfinite(green) & 
-        np.isfinite(nir) & 
-        (green != nodata_value) & 
-        (nir != nodata_value) &
-        (denominator != 0)
+    # Nodata becomes NaN unless the caller already supplies validity
+    if valid_mask is None:
+        green = _to_nan(green, nodata_value, dtype)
+        nir = _to_nan(nir, nodata_value, dtype)
+    else:
+        green = np.asarray(green, dtype=dtype)
+        nir = np.asarray(nir, dtype=dtype)
+    
+    ndwi = np.empty(green.shape, dtype=dtype)
+    
+    # Dense divide over valid pixels, nodata elsewhere; clipping is only
+    # needed when an input has negative values
+    _normalized_difference(
+        green, nir, ndwi, nodata_value, valid_mask,
+        clip=_has_negative(green) or _has_negative(nir),
     )
     
-    # Calculate NDWI
-    ndwi[valid_mask] = (green[valid_mask] - nir[valid_mask]) / denominator[valid_mask]
-    
-    # Clip to valid range
-    ndwi[valid_mask] = np.clip(ndwi[valid_mask], -1.0, 1.0)
-    
     return ndwi
 
 
@@ -132,6 +352,8 @@ def calculate_urban_index(
     swir1: NDArray[np.floating],
     nir: NDArray[np.floating],
     nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
+    valid_mask: Optional[NDArray[np.bool_]] = None,
 ) -> NDArray[np.floating]:
     """
     Calculate Urban Index (SWIR1/NIR ratio).
@@ -146,6 +368,9 @@ def calculate_urban_index(
         swir1: Band 6 (SWIR1) array
         nir: Band 5 (NIR) array
         nodata_value: Value for no-data pixels
+        dtype: Floating-point dtype for computation and output (default: float32)
+        valid_mask: Optional pre-computed mask of pixels where both inputs
+            are finite and not nodata (computed if not provided)
     
     Returns:
         Urban Index array (unbounded ratio)
@@ -156,23 +381,25 @@ def calculate_urban_index(
             f"SWIR1: {swir1.shape}, NIR: {nir.shape}"
         )
     
-    swir1 = swir1.astype(np.float64)
-    nir = nir.astype(np.float64)
+    swir1 = np.asarray(swir1, dtype=dtype)
+    nir = np.asarray(nir, dtype=dtype)
     
-    # Initialize with nodata
-    ui = np.full(swir1.shape, nodata_value, dtype=np.float64)
+    ui = np.empty(swir1.shape, dtype=dtype)
     
     # Valid pixel mask (avoid division by zero)
-    valid_mask = (
-        np.isfinite(swir1) & 
-        np.isfinite(nir) & 
-        (swir1 != nodata_value) & 
-        (nir != nodata_value) &
-        (nir != 0)
-    )
+    if valid_mask is None:
+        valid_mask = (
+            np.isfinite(swir1) & 
+            np.isfinite(nir) & 
+            (swir1 != nodata_value) & 
+            (nir != nodata_value)
+        )
+    valid_mask = valid_mask & (nir != 0)
     
-    # Calculate ratio
-    ui[valid_mask] = swir1[valid_mask] / nir[valid_mask]
+    # Calculate ratio (dense divide, valid pixels only), then write nodata
+    # once into the remaining pixels
+    np.divide(swir1, nir, out=ui, where=valid_mask)
+    np.putmask(ui, ~valid_mask, nodata_value)
     
     return ui
 
@@ -181,6 +408,8 @@ def calculate_ndbi(
     swir1: NDArray[np.floating],
     nir: NDArray[np.floating],
     nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
+    valid_mask: Optional[NDArray[np.bool_]] = None,
 ) -> NDArray[np.floating]:
     """
     Calculate NDBI (Normalized Difference Built-up Index).
@@ -194,6 +423,9 @@ def calculate_ndbi(
         swir1: Band 6 (SWIR1) array
         nir: Band 5 (NIR) array
         nodata_value: Value for no-data pixels
+        dtype: Floating-point dtype for computation and output (default: float32)
+        valid_mask: Optional pre-computed mask of pixels where both inputs
+            are finite and not nodata (computed if not provided)
     
     Returns:
         NDBI array with values between -1 and 1
@@ -204,30 +436,23 @@ def calculate_ndbi(
             f"SWIR1: {swir1.shape}, NIR: {nir.shape}"
         )
     
-    swir1 = swir1.astype(np.float64)
-    nir = nir.astype(np.float64)
-    
-    # Initialize with nodata
-    ndbi = np.full(swir1.shape, nodata_value, dtype=np.float64)
-    
-    # Calculate denominator
-    denominator = swir1 + nir
-    
-    # Valid pixel mask
-    valid_mask = (
-        np.isfinite(swir1) & 
-        np.isfinite(nir) & 
-        (swir1 != nodata_value) & 
-        (nir != nodata_value) &
-        (denominator != 0)
+    # Nodata becomes NaN unless the caller already supplies validity
+    if valid_mask is None:
+        swir1 = _to_nan(swir1, nodata_value, dtype)
+        nir = _to_nan(nir, nodata_value, dtype)
+    else:
+        swir1 = np.asarray(swir1, dtype=dtype)
+        nir = np.asarray(nir, dtype=dtype)
+    
+    ndbi = np.empty(swir1.shape, dtype=dtype)
+    
+    # Dense divide over valid pixels, nodata elsewhere; clipping is only
+    # needed when an input has negative values
+    _normalized_difference(
+        swir1, nir, ndbi, nodata_value, valid_mask,
+        clip=_has_negative(swir1) or _has_negative(nir),
     )
     
-    # Calculate NDBI
-    ndbi[valid_mask] = (swir1[valid_mask] - nir[valid_mask]) / denominator[valid_mask]
-    
-    # Clip to valid range
-    ndbi[valid_mask] = np.clip(ndbi[valid_mask], -1.0, 1.0)
-    
     return ndbi
 
 
@@ -240,6 +465,8 @@ def classify_land_cover(
     band_7: NDArray[np.floating],  # SWIR2
     nodata_value: float = -9999.0,
     ndvi: Optional[NDArray[np.floating]] = None,
+    dtype: DTypeLike = np.float32,
+    include_urban_index: bool = True,
 ) -> Tuple[NDArray[np.int8], Dict[str, NDArray[np.floating]]]:
     """
     Classify land cover using spectral indices.
@@ -259,11 +486,15 @@ def classify_land_cover(
         band_7: Band 7 (SWIR2) array
         nodata_value: Value for no-data pixels
         ndvi: Optional pre-calculated NDVI array
+        dtype: Floating-point dtype for computation and output (default: float32)
+        include_urban_index: If False, skip computing the Urban Index array
+            (classification compares SWIR1 and NIR directly either way)
     
     Returns:
         Tuple of:
         - Classification array (values 0-4)
-        - Dictionary with calculated indices (ndvi, ndwi, ndbi, urban_index)
+        - Dictionary with calculated indices (ndvi, ndwi, ndbi, and
+          urban_index if include_urban_index)
     """
     # Validate shapes
     shapes = [band_2.shape, band_3.shape, band_4.shape, 
@@ -271,63 +502,39 @@ def classify_land_cover(
     if not all(s == shapes[0] for s in shapes):
         raise ValueError("All input bands must have the same shape")
     
-    # Calculate indices
-    # NDVI: (NIR - Red) / (NIR + Red)
-    if ndvi is None:
-        from .ndvi import calculate_ndvi
-        ndvi = calculate_ndvi(band_5, band_4, nodata_value)
-    
+    # Calculate indices in a single fused pass over the bands
+    # NDVI: (NIR - Red) / (NIR + Red), unless pre-calculated
     # NDWI: (Green - NIR) / (Green + NIR)
-    ndwi = calculate_ndwi(band_3, band_5, nodata_value)
-    
     # NDBI: (SWIR1 - NIR) / (SWIR1 + NIR)
-    ndbi = calculate_ndbi(band_6, band_5, nodata_value)
-    
-    # Urban Index: SWIR1 / NIR
-    urban_index = calculate_urban_index(band_6, band_5, nodata_value)
-    
-    # Initialize classification with NODATA
-    classification = np.full(band_2.shape, LandCoverClass.NODATA, dtype=np.int8)
-    
-    # Create valid data mask (all bands must have valid data)
-    valid_mask = (
-        (ndvi != nodata_value) & 
-        (ndwi != nodata_value) &
-        np.isfinite(ndvi) & 
-        np.isfinite(ndwi)
+    # Urban Index: SWIR1 / NIR (only if requested; the urban test
+    # SWIR1 / NIR > 1.0 is evaluated as a comparison, without dividing)
+    compute_ndvi = ndvi is None
+    if compute_ndvi:
+        ndvi = np.empty(band_5.shape, dtype=dtype)
+    ndwi = np.empty(band_5.shape, dtype=dtype)
+    ndbi = np.empty(band_5.shape, dtype=dtype)
+    urban_index = np.empty(band_5.shape, dtype=dtype) if include_urban_index else None
+    urban_ratio = np.empty(band_5.shape, dtype=bool)
+    
+    _fused_indices(
+        band_3, band_4, band_5, band_6,
+        ndvi if compute_ndvi else None, ndwi, ndbi, urban_index, None,
+        nodata_value, out_urban_ratio=urban_ratio,
     )
     
     # Apply decision tree classification
     # Priority order: Water > Vegetation > Urban > Bare Soil
-    
-    # Step 1: Water (NDWI > 0)
-    water_mask = valid_mask & (ndwi > THRESHOLDS.NDWI_WATER)
-    classification[water_mask] = LandCoverClass.WATER
-    
-    # Step 2: Vegetation (NDVI > 0.2, not already classified)
-    remaining = valid_mask & (classification == LandCoverClass.NODATA)
-    vegetation_mask = remaining & (ndvi > THRESHOLDS.NDVI_VEGETATION)
-    classification[vegetation_mask] = LandCoverClass.VEGETATION
-    
-    # Step 3: Urban (Urban Index > 1.0 OR NDBI > 0, not already classified)
-    remaining = valid_mask & (classification == LandCoverClass.NODATA)
-    urban_mask = remaining & (
-        (urban_index > THRESHOLDS.URBAN_RATIO_MIN) | 
-        (ndbi > THRESHOLDS.NDBI_URBAN)
-    )
-    classification[urban_mask] = LandCoverClass.URBAN
-    
-    # Step 4: Bare Soil (everything else that's valid)
-    remaining = valid_mask & (classification == LandCoverClass.NODATA)
-    classification[remaining] = LandCoverClass.BARE_SOIL
+    classification = np.empty(band_2.shape, dtype=np.int8)
+    _label_land_cover(ndvi, ndwi, ndbi, urban_ratio, classification, nodata_value)
     
     # Store indices
     indices = {
         "ndvi": ndvi,
         "ndwi": ndwi,
         "ndbi": ndbi,
-        "urban_index": urban_index,
     }
+    if include_urban_index:
+        indices["urban_index"] = urban_index
     
     return classification, indices
 
@@ -349,14 +556,19 @@ def get_land_cover_statistics(
         - total_pixels: Total pixels including nodata
     """
     total_pixels = classification.size
-    valid_mask = classification != LandCoverClass.NODATA
-    total_valid = int(np.sum(valid_mask))
+    
+    # Count every class in one pass (uint8 keeps out-of-range values out of
+    # the class bins without a negative-index error)
+    counts = np.bincount(
+        classification.astype(np.uint8).ravel(), minlength=len(LandCoverClass)
+    )
+    total_valid = int(total_pixels - counts[LandCoverClass.NODATA])
     
     class_counts = {}
     class_percentages = {}
     
     for cls in LandCoverClass:
-        count = int(np.sum(classification == cls))
+        count = int(counts[cls])
         class_counts[LAND_COVER_NAMES[cls]] = count
         
         if total_valid > 0:
@@ -389,25 +601,10 @@ def create_color_visualization(
         NumPy array with shape (height, width, 3) or (height, width, 4)
         Values are uint8 (0-255) suitable for image export
     """
-    height, width = classification.shape
-    channels = 4 if alpha else 3
-    
-    # Initialize output (black/transparent for nodata)
-    rgb = np.zeros((height, width, channels), dtype=np.uint8)
-    
-    # Apply colors for each class
-    for cls, color in LAND_COVER_COLORS.items():
-        mask = classification == cls
-        rgb[mask, 0] = color[0]  # R
-        rgb[mask, 1] = color[1]  # G
-        rgb[mask, 2] = color[2]  # B
-        
-        if alpha:
-            # Set alpha to 255 (opaque) for valid data, 0 for nodata
-            if cls != LandCoverClass.NODATA:
-                rgb[mask, 3] = 255
-    
-    return rgb
+    # One gather through the palette; mode="clip" maps negative values to
+    # nodata and values above the last class to the transparent row
+    lut = _COLOR_LUT if alpha else _COLOR_LUT[:, :3]
+    return np.take(lut, classification, axis=0, mode="clip")
 
 
 def export_classification_legend() -> Dict[str, Dict]:
@@ -435,6 +632,7 @@ def calculate_all_indices(
     band_6: NDArray[np.floating],
     band_7: NDArray[np.floating],
     nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
 ) -> Dict[str, NDArray[np.floating]]:
     """
     Calculate all spectral indices for analysis.
@@ -449,35 +647,30 @@ def calculate_all_indices(
     Args:
         band_2 through band_7: Landsat bands
         nodata_value: Value for no-data pixels
+        dtype: Floating-point dtype for computation and output (default: float32)
     
     Returns:
         Dictionary with all calculated indices
     """
-    from .ndvi import calculate_ndvi
+    shapes = [band_3.shape, band_4.shape, band_5.shape, band_6.shape]
+    if not all(s == shapes[0] for s in shapes):
+        raise ValueError("All input bands must have the same shape")
     
     # NDVI: vegetation
-    ndvi = calculate_ndvi(band_5, band_4, nodata_value)
-    
     # NDWI: water (McFeeters)
-    ndwi = calculate_ndwi(band_3, band_5, nodata_value)
-    
     # NDBI: built-up
-    ndbi = calculate_ndbi(band_6, band_5, nodata_value)
-    
     # Urban Index: B6/B5 ratio
-    urban_index = calculate_urban_index(band_6, band_5, nodata_value)
-    
     # MNDWI: Modified NDWI (Green - SWIR1) / (Green + SWIR1)
     # Better for water in urban areas
-    mndwi = np.full(band_3.shape, nodata_value, dtype=np.float64)
-    denominator = band_3.astype(np.float64) + band_6.astype(np.float64)
-    valid_mask = (
-        np.isfinite(band_3) & np.isfinite(band_6) &
-        (band_3 != nodata_value) & (band_6 != nodata_value) &
-        (denominator != 0)
+    ndvi, ndwi, ndbi, urban_index, mndwi = (
+        np.empty(band_5.shape, dtype=dtype) for _ in range(5)
+    )
+    
+    _fused_indices(
+        band_3, band_4, band_5, band_6,
+        ndvi, ndwi, ndbi, urban_index, mndwi,
+        nodata_value,
     )
-    mndwi[valid_mask] = (band_3[valid_mask] - band_6[valid_mask]) / denominator[valid_mask]
-    mndwi[valid_mask] = np.clip(mndwi[valid_mask], -1.0, 1.0)
     
     return {
         "ndvi": ndvi,
@@ -16,11 +16,33 @@ References:
 - Sobrino, J.A., et al. (2004). Land surface temperature retrieval methods
 """
 
+import math
+
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
+from ._common import _kernel_input, _kernel_output, _masked_statistics, _row_tiles
+from .ndvi import calculate_ndvi
+
+# Numba is optional; without it the LST pipeline runs as separate NumPy steps.
+# Kernels are compiled for the host CPU (AVX2/AVX-512 when available), so no
+# per-ISA variants are needed; with icc_rt installed, Numba also routes
+# math.log/log1p to Intel SVML.
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# CuPy is optional; when installed, CuPy inputs are processed on the GPU.
+try:
+    import cupy as cp
+    HAS_CUPY = True
+except ImportError:
+    HAS_CUPY = False
+
 
 # Landsat 8/9 Band 10 Thermal Constants
 @dataclass(frozen=True)
@@ -70,12 +92,214 @@ class EmissivityConstants:
 THERMAL = ThermalConstants()
 EMISSIVITY = EmissivityConstants()
 
+# Names of the classify_lst_thermal_zones zones 0-6
+THERMAL_ZONE_NAMES = (
+    "very_cold", "cold", "cool", "comfortable", "warm", "hot", "very_hot",
+)
+
+
+if HAS_NUMBA:
+    from .ndvi import _ndvi_pixel
+    
+    # Numba cannot read dataclass instances, so the emissivity constants are
+    # bound as plain floats for the kernel.
+    _NDVI_SOIL = EMISSIVITY.NDVI_SOIL
+    _NDVI_VEG = EMISSIVITY.NDVI_VEG
+    _EMISSIVITY_SOIL = EMISSIVITY.EMISSIVITY_SOIL
+    _EMISSIVITY_VEG = EMISSIVITY.EMISSIVITY_VEG
+    _COEFF_PV = EMISSIVITY.COEFF_PV
+    _COEFF_BASE = EMISSIVITY.COEFF_BASE
+    
+    @numba.njit(parallel=True, cache=True)
+    def _row_ranges_kernel(band_10, ndvi, nodata_value, out_ranges):
+        """
+        Per-row [start, stop) column envelope of pixels with any LST input.
+        
+        Scans inward from both row edges and stops at the first pixel where
+        either band 10 or NDVI is usable, so only margin pixels are read.
+        Rows without any usable pixel get the empty range (0, 0). Inputs are
+        read in their native dtype; a pixel unusable before the cast to the
+        output dtype stays unusable after it, so the envelope is never too
+        tight.
+        """
+        width = band_10.shape[1]
+        
+        for r in numba.prange(band_10.shape[0]):
+            start = 0
+            while start < width:
+                dn = band_10[r, start]
+                v = ndvi[r, start]
+                if (dn != nodata_value and math.isfinite(dn) and dn > 0) or (
+                    v != nodata_value and math.isfinite(v)
+                ):
+                    break
+                start += 1
+            
+            stop = width
+            if start == width:
+                start = 0
+                stop = 0
+            else:
+                while stop > start:
+                    dn = band_10[r, stop - 1]
+                    v = ndvi[r, stop - 1]
+                    if (dn != nodata_value and math.isfinite(dn) and dn > 0) or (
+                        v != nodata_value and math.isfinite(v)
+                    ):
+                        break
+                    stop -= 1
+            
+            out_ranges[r, 0] = start
+            out_ranges[r, 1] = stop
+    
+    # "nnan"/"ninf" are deliberately left out of fastmath: the kernels rely
+    # on isfinite() to detect invalid pixels.
+    @numba.njit(fastmath={"contract", "arcp"}, cache=True)
+    def _lst_pixel(dn, v, ml, al, k1, k2, lam_over_rho, kelvin_offset, nodata_value):
+        """
+        Radiance, BT, emissivity and LST of one pixel from its DN and NDVI.
+        
+        Applies the same validity rules as the step-by-step NumPy functions;
+        each output is nodata where it cannot be computed.
+        """
+        # DN → radiance → brightness temperature
+        radiance = nodata_value
+        bt = nodata_value
+        if dn != nodata_value and math.isfinite(dn) and dn > 0:
+            value = ml * dn + al
+            if value > 0:
+                radiance = value
+                bt = k2 / math.log1p(k1 / value)
+        
+        # NDVI → emissivity
+        emissivity = nodata_value
+        if v != nodata_value and math.isfinite(v):
+            if v < _NDVI_SOIL:
+                emissivity = _EMISSIVITY_SOIL
+            elif v > _NDVI_VEG:
+                emissivity = _EMISSIVITY_VEG
+            else:
+                t = (v - _NDVI_SOIL) / (_NDVI_VEG - _NDVI_SOIL)
+                emissivity = _COEFF_PV * (t * t) + _COEFF_BASE
+        
+        # BT + emissivity → LST
+        lst = nodata_value
+        if (
+            bt != nodata_value and math.isfinite(bt) and bt > 0
+            and emissivity != nodata_value and emissivity > 0
+        ):
+            lst = bt / (1.0 + lam_over_rho * bt * math.log(emissivity)) - kelvin_offset
+        
+        return radiance, bt, emissivity, lst
+    
+    @numba.njit(parallel=True, cache=True)
+    def _lst_kernel(
+        band_10, ndvi, row_ranges, ml, al, k1, k2, lam_over_rho, kelvin_offset,
+        nodata_value, out_radiance, out_bt, out_emissivity, out_lst,
+    ):
+        """
+        Fused DN → radiance → BT, NDVI → emissivity → LST over 2-D arrays.
+        
+        Evaluates _lst_pixel in a single pass without intermediate masks or
+        temporaries. Only the columns inside each row's envelope are
+        evaluated; the nodata margins outside it are filled directly. Inputs
+        may be any integer or float dtype; each pixel is cast to the output
+        dtype when read.
+        """
+        width = band_10.shape[1]
+        
+        for r in numba.prange(band_10.shape[0]):
+            start = row_ranges[r, 0]
+            stop = row_ranges[r, 1]
+            
+            for c in range(start):
+                out_radiance[r, c] = nodata_value
+                out_bt[r, c] = nodata_value
+                out_emissivity[r, c] = nodata_value
+                out_lst[r, c] = nodata_value
+            for c in range(stop, width):
+                out_radiance[r, c] = nodata_value
+                out_bt[r, c] = nodata_value
+                out_emissivity[r, c] = nodata_value
+                out_lst[r, c] = nodata_value
+            
+            for c in range(start, stop):
+                radiance, bt, emissivity, lst = _lst_pixel(
+                    out_radiance.dtype.type(band_10[r, c]),
+                    out_emissivity.dtype.type(ndvi[r, c]),
+                    ml, al, k1, k2, lam_over_rho, kelvin_offset, nodata_value,
+                )
+                out_radiance[r, c] = radiance
+                out_bt[r, c] = bt
+                out_emissivity[r, c] = emissivity
+                out_lst[r, c] = lst
+    
+    @numba.njit(parallel=True, nogil=True, cache=True)
+    def _ndvi_lst_kernel(
+        nir, red, band_10, ml, al, k1, k2, lam_over_rho, kelvin_offset,
+        nodata_value, out_ndvi, out_lst,
+    ):
+        """
+        NDVI and LST over flat arrays in one pass, without intermediates.
+        
+        Each pixel's red, NIR and band 10 values are read once; the NDVI is
+        rounded to the output dtype before it feeds the emissivity, exactly
+        as when the NDVI raster is computed first. Runs without the GIL so
+        a concurrent band read can proceed.
+        """
+        for i in numba.prange(out_lst.size):
+            v = out_ndvi.dtype.type(_ndvi_pixel(
+                out_ndvi.dtype.type(nir[i]), out_ndvi.dtype.type(red[i]), nodata_value
+            ))
+            out_ndvi[i] = v
+            out_lst[i] = _lst_pixel(
+                out_lst.dtype.type(band_10[i]), v,
+                ml, al, k1, k2, lam_over_rho, kelvin_offset, nodata_value,
+            )[3]
+
+
+@dataclass(frozen=True)
+class LSTWorkspace:
+    """
+    Pre-allocated buffers for the LST pipeline.
+    
+    Passing the same workspace to calculate_lst_from_band10 for every scene
+    of a given shape avoids allocating four full-size rasters per call.
+    The returned arrays are these buffers, so they are overwritten by the
+    next call that uses the workspace.
+    """
+    radiance: NDArray[np.floating]
+    bt: NDArray[np.floating]
+    emissivity: NDArray[np.floating]
+    lst: NDArray[np.floating]
+    
+    @classmethod
+    def for_shape(
+        cls,
+        shape: Tuple[int, ...],
+        dtype: DTypeLike = np.float32,
+    ) -> "LSTWorkspace":
+        """Allocate (uninitialized) buffers for rasters of the given shape."""
+        return cls(*(np.empty(shape, dtype=dtype) for _ in range(4)))
+    
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Raster shape the buffers were allocated for."""
+        return self.lst.shape
+    
+    @property
+    def dtype(self) -> np.dtype:
+        """Floating-point dtype of the buffers."""
+        return self.lst.dtype
+
 
 def dn_to_radiance(
     band_10: NDArray[np.floating],
     ml: float = RadianceCoefficients.ML,
     al: float = RadianceCoefficients.AL,
     nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
+    out: Optional[NDArray[np.floating]] = None,
 ) -> NDArray[np.floating]:
     """
     Convert Digital Numbers (DN) to Top-of-Atmosphere Spectral Radiance.
@@ -93,24 +317,25 @@ def dn_to_radiance(
         ml: Multiplicative rescaling factor (RADIANCE_MULT_BAND_10)
         al: Additive rescaling factor (RADIANCE_ADD_BAND_10)
         nodata_value: Value for no-data pixels
+        dtype: Floating-point dtype for computation and output (default: float32)
+        out: Optional pre-allocated output array (e.g. from an LSTWorkspace)
     
     Returns:
         NumPy array with TOA Radiance values (W/(m²·sr·μm))
     """
-    # Convert to float64
-    band_10 = band_10.astype(np.float64)
-    
-    # Initialize output with nodata
-    radiance = np.full(band_10.shape, nodata_value, dtype=np.float64)
+    # Work in the requested precision (no copy if already that dtype)
+    band_10 = np.asarray(band_10, dtype=dtype)
     
     # Create valid data mask
     valid_mask = (band_10 != nodata_value) & np.isfinite(band_10) & (band_10 > 0)
     
-    # Apply radiometric calibration
-    radiance[valid_mask] = ml * band_10[valid_mask] + al
+    # Apply radiometric calibration densely; invalid pixels are reset below
+    radiance = np.empty(band_10.shape, dtype=dtype) if out is None else out
+    np.multiply(ml, band_10, out=radiance)
+    np.add(radiance, al, out=radiance)
     
-    # Ensure positive radiance values
-    radiance[valid_mask & (radiance <= 0)] = nodata_value
+    # Nodata for invalid pixels and non-positive radiance values
+    np.putmask(radiance, ~valid_mask | (radiance <= 0), nodata_value)
     
     return radiance
 
@@ -120,6 +345,8 @@ def radiance_to_brightness_temperature(
     k1: float = THERMAL.K1,
     k2: float = THERMAL.K2,
     nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
+    out: Optional[NDArray[np.floating]] = None,
 ) -> NDArray[np.floating]:
     """
     Convert TOA Radiance to Brightness Temperature.
@@ -137,19 +364,24 @@ def radiance_to_brightness_temperature(
         k1: Thermal constant K1 (default: 774.89)
         k2: Thermal constant K2 (default: 1321.08)
         nodata_value: Value for no-data pixels
+        dtype: Floating-point dtype for computation and output (default: float32)
+        out: Optional pre-allocated output array (e.g. from an LSTWorkspace)
     
     Returns:
         NumPy array with Brightness Temperature in Kelvin
     """
-    # Initialize output with nodata
-    bt = np.full(radiance.shape, nodata_value, dtype=np.float64)
+    radiance = np.asarray(radiance, dtype=dtype)
     
     # Create valid mask (radiance must be positive)
     valid_mask = (radiance != nodata_value) & np.isfinite(radiance) & (radiance > 0)
     
-    # Calculate brightness temperature
-    # BT = K2 / ln((K1/L) + 1)
-    bt[valid_mask] = k2 / np.log((k1 / radiance[valid_mask]) + 1)
+    # Calculate brightness temperature on valid pixels only
+    # BT = K2 / ln((K1/L) + 1) = K2 / log1p(K1/L)
+    bt = np.empty(radiance.shape, dtype=dtype) if out is None else out
+    np.divide(k1, radiance, out=bt, where=valid_mask)
+    np.log1p(bt, out=bt, where=valid_mask)
+    np.divide(k2, bt, out=bt, where=valid_mask)
+    np.putmask(bt, ~valid_mask, nodata_value)
     
     return bt
 
@@ -157,6 +389,8 @@ def radiance_to_brightness_temperature(
 def estimate_emissivity_from_ndvi(
     ndvi: NDArray[np.floating],
     nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
+    out: Optional[NDArray[np.floating]] = None,
 ) -> NDArray[np.floating]:
     """
     Estimate Land Surface Emissivity from NDVI.
@@ -175,37 +409,34 @@ def estimate_emissivity_from_ndvi(
     Args:
         ndvi: NumPy array with NDVI values (-1 to 1)
         nodata_value: Value for no-data pixels
+        dtype: Floating-point dtype for computation and output (default: float32)
+        out: Optional pre-allocated output array (e.g. from an LSTWorkspace)
     
     Returns:
         NumPy array with emissivity values (typically 0.95 to 1.0)
     """
-    # Initialize output with nodata
-    emissivity = np.full(ndvi.shape, nodata_value, dtype=np.float64)
+    ndvi = np.asarray(ndvi, dtype=dtype)
     
     # Create valid mask
     valid_mask = (ndvi != nodata_value) & np.isfinite(ndvi)
     
-    # Initialize valid pixels
-    emissivity[valid_mask] = EMISSIVITY.EMISSIVITY_SOIL
-    
-    # Case 1: Bare soil (NDVI < 0.2)
-    soil_mask = valid_mask & (ndvi < EMISSIVITY.NDVI_SOIL)
-    emissivity[soil_mask] = EMISSIVITY.EMISSIVITY_SOIL
-    
-    # Case 2: Full vegetation (NDVI > 0.5)
-    veg_mask = valid_mask & (ndvi > EMISSIVITY.NDVI_VEG)
-    emissivity[veg_mask] = EMISSIVITY.EMISSIVITY_VEG
-    
-    # Case 3: Mixed (0.2 <= NDVI <= 0.5)
-    mixed_mask = valid_mask & (ndvi >= EMISSIVITY.NDVI_SOIL) & (ndvi <= EMISSIVITY.NDVI_VEG)
-    
-    # Calculate Proportion of Vegetation (Pv)
+    # Calculate Proportion of Vegetation (Pv) in place, clamped to [0, 1]
+    # so it is well-defined for every pixel and needs no mixed-case mask
     ndvi_range = EMISSIVITY.NDVI_VEG - EMISSIVITY.NDVI_SOIL
-    pv = np.zeros(ndvi.shape, dtype=np.float64)
-    pv[mixed_mask] = ((ndvi[mixed_mask] - EMISSIVITY.NDVI_SOIL) / ndvi_range) ** 2
+    emissivity = np.empty(ndvi.shape, dtype=dtype) if out is None else out
+    np.subtract(ndvi, EMISSIVITY.NDVI_SOIL, out=emissivity)
+    np.divide(emissivity, ndvi_range, out=emissivity)
+    np.clip(emissivity, 0.0, 1.0, out=emissivity)
+    np.square(emissivity, out=emissivity)
+    
+    # Mixed: ε = 0.004 * Pv + 0.986
+    np.multiply(EMISSIVITY.COEFF_PV, emissivity, out=emissivity)
+    np.add(emissivity, EMISSIVITY.COEFF_BASE, out=emissivity)
     
-    # Calculate emissivity: ε = 0.004 * Pv + 0.986
-    emissivity[mixed_mask] = EMISSIVITY.COEFF_PV * pv[mixed_mask] + EMISSIVITY.COEFF_BASE
+    # Bare soil (NDVI < 0.2), full vegetation (NDVI > 0.5), then nodata
+    np.putmask(emissivity, ndvi < EMISSIVITY.NDVI_SOIL, EMISSIVITY.EMISSIVITY_SOIL)
+    np.putmask(emissivity, ndvi > EMISSIVITY.NDVI_VEG, EMISSIVITY.EMISSIVITY_VEG)
+    np.putmask(emissivity, ~valid_mask, nodata_value)
     
     return emissivity
 
@@ -217,6 +448,8 @@ def calculate_lst(
     rho: float = THERMAL.RHO,
     nodata_value: float = -9999.0,
     output_celsius: bool = True,
+    dtype: DTypeLike = np.float32,
+    out: Optional[NDArray[np.floating]] = None,
 ) -> NDArray[np.floating]:
     """
     Calculate Land Surface Temperature using emissivity correction.
@@ -237,6 +470,8 @@ def calculate_lst(
         rho: Planck's constant ratio (default: 1.438e-2)
         nodata_value: Value for no-data pixels
         output_celsius: If True, convert output to Celsius (default: True)
+        dtype: Floating-point dtype for computation and output (default: float32)
+        out: Optional pre-allocated output array (e.g. from an LSTWorkspace)
     
     Returns:
         NumPy array with LST values in Celsius (or Kelvin if output_celsius=False)
@@ -247,8 +482,8 @@ def calculate_lst(
             f"BT: {brightness_temp.shape}, Emissivity: {emissivity.shape}"
         )
     
-    # Initialize output with nodata
-    lst = np.full(brightness_temp.shape, nodata_value, dtype=np.float64)
+    brightness_temp = np.asarray(brightness_temp, dtype=dtype)
+    emissivity = np.asarray(emissivity, dtype=dtype)
     
     # Create valid mask
     valid_mask = (
@@ -260,26 +495,80 @@ def calculate_lst(
         (brightness_temp > 0)  # Temperature must be positive
     )
     
-    # Calculate LST
+    # Calculate LST on valid pixels only
     # LST = BT / (1 + (λ * BT / ρ) * ln(ε))
-    bt = brightness_temp[valid_mask]
-    eps = emissivity[valid_mask]
-    
-    lst[valid_mask] = bt / (1 + (wavelength * bt / rho) * np.log(eps))
+    lst = np.empty(brightness_temp.shape, dtype=dtype) if out is None else out
+    scale = np.empty(brightness_temp.shape, dtype=dtype)
+    np.multiply(wavelength, brightness_temp, out=scale, where=valid_mask)
+    np.divide(scale, rho, out=scale, where=valid_mask)
+    np.log(emissivity, out=lst, where=valid_mask)
+    np.multiply(scale, lst, out=lst, where=valid_mask)
+    np.add(1, lst, out=lst, where=valid_mask)
+    np.divide(brightness_temp, lst, out=lst, where=valid_mask)
     
     # Convert to Celsius if requested
     if output_celsius:
-        lst[valid_mask] = lst[valid_mask] - THERMAL.KELVIN_TO_CELSIUS
+        np.subtract(lst, THERMAL.KELVIN_TO_CELSIUS, out=lst, where=valid_mask)
+    
+    np.putmask(lst, ~valid_mask, nodata_value)
     
     return lst
 
 
+def _as_rows(array: NDArray) -> NDArray:
+    """View an array as 2-D (rows, columns), treating 0-d/1-d as one row."""
+    return array.reshape(-1, array.shape[-1]) if array.ndim else array.reshape(1, 1)
+
+
+def _valid_row_ranges(
+    band_10: NDArray[np.floating],
+    ndvi: NDArray[np.floating],
+    nodata_value: float = -9999.0,
+) -> NDArray[np.intp]:
+    """
+    Find the per-row column envelope of pixels that can produce an output.
+    
+    Landsat scenes are rotated rectangles inside their bounding grid, so a
+    large share of each row is nodata margin. A pixel is inside the envelope
+    if either its band 10 DN or its NDVI is usable; everything outside the
+    envelope is nodata in every LST intermediate.
+    
+    Args:
+        band_10: 2-D Band 10 Digital Number values
+        ndvi: 2-D NDVI array of the same shape
+        nodata_value: Value indicating no-data pixels
+    
+    Returns:
+        Array of shape (rows, 2) holding [start, stop) column indices per
+        row; rows without any usable pixel get (0, 0).
+    """
+    row_ranges = np.empty((band_10.shape[0], 2), dtype=np.intp)
+    
+    if HAS_NUMBA:
+        _row_ranges_kernel(band_10, ndvi, nodata_value, row_ranges)
+        return row_ranges
+    
+    with np.errstate(invalid="ignore"):
+        valid = np.isfinite(band_10) & (band_10 != nodata_value) & (band_10 > 0)
+    valid |= np.isfinite(ndvi) & (ndvi != nodata_value)
+    
+    width = valid.shape[1]
+    row_ranges[:, 0] = np.argmax(valid, axis=1)
+    row_ranges[:, 1] = width - np.argmax(valid[:, ::-1], axis=1)
+    row_ranges[~valid.any(axis=1)] = 0
+    
+    return row_ranges
+
+
 def calculate_lst_from_band10(
     band_10: NDArray[np.floating],
     ndvi: NDArray[np.floating],
     ml: float = RadianceCoefficients.ML,
     al: float = RadianceCoefficients.AL,
     nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
+    workspace: Optional[LSTWorkspace] = None,
+    compute_statistics: bool = True,
 ) -> Tuple[NDArray[np.floating], Dict[str, any]]:
     """
     Complete LST calculation pipeline from Band 10 DN and NDVI.
@@ -290,32 +579,117 @@ def calculate_lst_from_band10(
     3. NDVI → Emissivity
     4. BT + Emissivity → LST
     
+    When Numba is installed the steps run as one fused, parallel kernel;
+    otherwise the individual NumPy functions are chained over row tiles.
+    Either way, only each row's valid-data envelope is evaluated, so the
+    nodata margins around a rotated Landsat footprint cost a single fill.
+    
     Args:
         band_10: Band 10 Digital Number values
         ndvi: NDVI array (from calculate_ndvi)
         ml: Radiance multiplicative factor (from MTL)
         al: Radiance additive factor (from MTL)
         nodata_value: Value for no-data pixels
+        dtype: Floating-point dtype for computation and output (default: float32)
+        workspace: Optional LSTWorkspace whose buffers receive the outputs
+            (its dtype takes precedence over dtype)
+        compute_statistics: If False, skip the statistics pass and return
+            None for "statistics" (e.g. when the raster is one tile of a
+            larger scene whose statistics are computed afterwards)
     
     Returns:
         Tuple of:
         - LST array in Celsius
         - Dictionary with intermediate results and statistics
     """
-    # Step 1: DN to Radiance
-    radiance = dn_to_radiance(band_10, ml, al, nodata_value)
+    if band_10.shape != ndvi.shape:
+        raise ValueError(
+            f"Input arrays must have same shape. "
+            f"Band 10: {band_10.shape}, NDVI: {ndvi.shape}"
+        )
     
-    # Step 2: Radiance to Brightness Temperature
-    bt = radiance_to_brightness_temperature(radiance, nodata_value=nodata_value)
+    if workspace is None:
+        workspace = LSTWorkspace.for_shape(band_10.shape, dtype)
+    elif workspace.shape != band_10.shape:
+        raise ValueError(
+            f"Workspace shape {workspace.shape} does not match "
+            f"input shape {band_10.shape}"
+        )
+    dtype = workspace.dtype
+    radiance, bt, emissivity, lst = (
+        workspace.radiance, workspace.bt, workspace.emissivity, workspace.lst
+    )
     
-    # Step 3: Estimate Emissivity from NDVI
-    emissivity = estimate_emissivity_from_ndvi(ndvi, nodata_value)
+    # Only the valid-data envelope of each row is evaluated; scene margins
+    # outside it are filled with nodata directly. The fused kernel reads
+    # integer DNs in their native dtype instead of an upcast copy.
+    if HAS_NUMBA:
+        band_10 = _as_rows(_kernel_input(band_10, dtype))
+        ndvi = _as_rows(_kernel_input(ndvi, dtype))
+    else:
+        band_10 = _as_rows(np.ascontiguousarray(band_10, dtype=dtype))
+        ndvi = _as_rows(np.ascontiguousarray(ndvi, dtype=dtype))
+    row_ranges = _valid_row_ranges(band_10, ndvi, nodata_value)
+    radiance_2d, bt_2d, emissivity_2d, lst_2d = (
+        _as_rows(radiance), _as_rows(bt), _as_rows(emissivity), _as_rows(lst)
+    )
     
-    # Step 4: Calculate LST
-    lst = calculate_lst(bt, emissivity, nodata_value=nodata_value)
+    if HAS_NUMBA:
+        # All four steps in a single fused pass
+        _lst_kernel(
+            band_10, ndvi, row_ranges,
+            ml, al, THERMAL.K1, THERMAL.K2,
+            THERMAL.WAVELENGTH / THERMAL.RHO, THERMAL.KELVIN_TO_CELSIUS,
+            nodata_value,
+            radiance_2d, bt_2d, emissivity_2d, lst_2d,
+        )
+    else:
+        # Run all four steps per row tile so each tile's intermediates stay
+        # cache-resident from radiance through LST. Each tile is limited to
+        # the union of its rows' envelopes.
+        for rows in _row_tiles(band_10.shape, lst.itemsize):
+            tile_ranges = row_ranges[rows]
+            has_data = tile_ranges[:, 1] > tile_ranges[:, 0]
+            if has_data.any():
+                c0 = int(tile_ranges[has_data, 0].min())
+                c1 = int(tile_ranges[has_data, 1].max())
+            else:
+                c0 = c1 = 0
+            
+            for buffer in (radiance_2d, bt_2d, emissivity_2d, lst_2d):
+                buffer[rows, :c0] = nodata_value
+                buffer[rows, c1:] = nodata_value
+            if c0 == c1:
+                continue
+            
+            cols = slice(c0, c1)
+            
+            # Step 1: DN to Radiance
+            dn_to_radiance(
+                band_10[rows, cols], ml, al, nodata_value,
+                dtype=dtype, out=radiance_2d[rows, cols],
+            )
+            
+            # Step 2: Radiance to Brightness Temperature
+            radiance_to_brightness_temperature(
+                radiance_2d[rows, cols], nodata_value=nodata_value,
+                dtype=dtype, out=bt_2d[rows, cols],
+            )
+            
+            # Step 3: Estimate Emissivity from NDVI
+            estimate_emissivity_from_ndvi(
+                ndvi[rows, cols], nodata_value,
+                dtype=dtype, out=emissivity_2d[rows, cols],
+            )
+            
+            # Step 4: Calculate LST
+            calculate_lst(
+                bt_2d[rows, cols], emissivity_2d[rows, cols],
+                nodata_value=nodata_value, dtype=dtype, out=lst_2d[rows, cols],
+            )
     
     # Calculate statistics
-    stats = get_lst_statistics(lst, nodata_value)
+    stats = get_lst_statistics(lst, nodata_value) if compute_statistics else None
     
     return lst, {
         "radiance": radiance,
@@ -325,6 +699,152 @@ def calculate_lst_from_band10(
     }
 
 
+if HAS_CUPY:
+    # Same per-pixel rules as _ndvi_lst_kernel, one GPU thread per pixel:
+    # the NDVI is computed and rounded in T, the LST chain in double
+    _ndvi_lst_cupy_kernel = cp.ElementwiseKernel(
+        "T nir, T red, T band_10, float64 ml, float64 al, float64 k1, "
+        "float64 k2, float64 lam_over_rho, float64 kelvin_offset, T nodata_value",
+        "T ndvi, T lst",
+        """
+        T s = nir + red;
+        T v = nodata_value;
+        if (isfinite(nir) && isfinite(red)
+                && nir != nodata_value && red != nodata_value && s != (T)0) {
+            v = min((T)1, max((T)-1, (nir - red) / s));
+        }
+        ndvi = v;
+        
+        double nodata = nodata_value;
+        double bt = nodata;
+        double dn = band_10;
+        if (dn != nodata && isfinite(dn) && dn > 0) {
+            double radiance = ml * dn + al;
+            if (radiance > 0) {
+                bt = k2 / log1p(k1 / radiance);
+            }
+        }
+        
+        double emissivity = nodata;
+        double n = v;
+        if (n != nodata && isfinite(n)) {
+            if (n < NDVI_SOIL) {
+                emissivity = EMISSIVITY_SOIL;
+            } else if (n > NDVI_VEG) {
+                emissivity = EMISSIVITY_VEG;
+            } else {
+                double t = (n - NDVI_SOIL) / (NDVI_VEG - NDVI_SOIL);
+                emissivity = COEFF_PV * (t * t) + COEFF_BASE;
+            }
+        }
+        
+        lst = nodata_value;
+        if (bt != nodata && isfinite(bt) && bt > 0
+                && emissivity != nodata && emissivity > 0) {
+            lst = bt / (1.0 + lam_over_rho * bt * log(emissivity)) - kelvin_offset;
+        }
+        """,
+        "ndvi_lst_kernel",
+        preamble=f"""
+        #define NDVI_SOIL {EMISSIVITY.NDVI_SOIL!r}
+        #define NDVI_VEG {EMISSIVITY.NDVI_VEG!r}
+        #define EMISSIVITY_SOIL {EMISSIVITY.EMISSIVITY_SOIL!r}
+        #define EMISSIVITY_VEG {EMISSIVITY.EMISSIVITY_VEG!r}
+        #define COEFF_PV {EMISSIVITY.COEFF_PV!r}
+        #define COEFF_BASE {EMISSIVITY.COEFF_BASE!r}
+        """,
+    )
+
+
+def calculate_ndvi_lst(
+    nir: NDArray[np.floating],
+    red: NDArray[np.floating],
+    band_10: NDArray[np.floating],
+    ml: float = RadianceCoefficients.ML,
+    al: float = RadianceCoefficients.AL,
+    nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
+    out_ndvi: Optional[NDArray[np.floating]] = None,
+    out_lst: Optional[NDArray[np.floating]] = None,
+) -> Tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """
+    Calculate NDVI and LST from the NIR, Red and Band 10 rasters together.
+    
+    Equivalent to calculate_ndvi followed by calculate_lst_from_band10, for
+    callers that only need the NDVI and LST rasters. With Numba installed
+    both are computed in a single fused pass that reads each input pixel
+    once and materializes no radiance, BT or emissivity rasters; CuPy
+    inputs run the same fused pass as one GPU kernel.
+    
+    Args:
+        nir: Band 5 (NIR) values
+        red: Band 4 (Red) values
+        band_10: Band 10 Digital Number values
+        ml: Radiance multiplicative factor (from MTL)
+        al: Radiance additive factor (from MTL)
+        nodata_value: Value for no-data pixels
+        dtype: Floating-point dtype for computation and output (default: float32)
+        out_ndvi: Optional pre-allocated NDVI output array
+        out_lst: Optional pre-allocated LST output array
+    
+    Returns:
+        Tuple of (NDVI array, LST array in Celsius); CuPy arrays for CuPy
+        inputs
+    
+    Raises:
+        ValueError: If input arrays have different shapes.
+    """
+    if not (nir.shape == red.shape == band_10.shape):
+        raise ValueError(
+            f"Input arrays must have the same shape. NIR: {nir.shape}, "
+            f"Red: {red.shape}, Band 10: {band_10.shape}"
+        )
+    
+    if HAS_CUPY and isinstance(nir, cp.ndarray):
+        # Device-resident inputs: one fused elementwise kernel on the GPU
+        nir = nir.astype(dtype, copy=False)
+        return _ndvi_lst_cupy_kernel(
+            nir,
+            cp.asarray(red, dtype=dtype),
+            cp.asarray(band_10, dtype=dtype),
+            ml, al, THERMAL.K1, THERMAL.K2,
+            THERMAL.WAVELENGTH / THERMAL.RHO, THERMAL.KELVIN_TO_CELSIUS,
+            nir.dtype.type(nodata_value),
+            out_ndvi, out_lst,
+        )
+    
+    ndvi = np.empty(nir.shape, dtype=dtype) if out_ndvi is None else out_ndvi
+    lst = np.empty(nir.shape, dtype=dtype) if out_lst is None else out_lst
+    
+    if HAS_NUMBA:
+        ndvi_buffer = _kernel_output(ndvi)
+        lst_buffer = _kernel_output(lst)
+        _ndvi_lst_kernel(
+            _kernel_input(nir, dtype).reshape(-1),
+            _kernel_input(red, dtype).reshape(-1),
+            _kernel_input(band_10, dtype).reshape(-1),
+            ml, al, THERMAL.K1, THERMAL.K2,
+            THERMAL.WAVELENGTH / THERMAL.RHO, THERMAL.KELVIN_TO_CELSIUS,
+            nodata_value,
+            ndvi_buffer.reshape(-1), lst_buffer.reshape(-1),
+        )
+        if ndvi_buffer is not ndvi:
+            np.copyto(ndvi, ndvi_buffer)
+        if lst_buffer is not lst:
+            np.copyto(lst, lst_buffer)
+        return ndvi, lst
+    
+    calculate_ndvi(nir, red, nodata_value, dtype=dtype, out=ndvi)
+    workspace = LSTWorkspace(
+        *(np.empty(lst.shape, dtype=lst.dtype) for _ in range(3)), lst
+    )
+    calculate_lst_from_band10(
+        band_10, ndvi, ml, al, nodata_value,
+        workspace=workspace, compute_statistics=False,
+    )
+    return ndvi, lst
+
+
 def get_lst_statistics(
     lst: NDArray[np.floating],
     nodata_value: float = -9999.0,
@@ -362,13 +882,27 @@ def get_lst_statistics(
             "unit": "Celsius",
         }
     
+    n_valid = valid_values.size
+    
+    # min/max/mean/std in one pass over the compacted values
+    moments = _masked_statistics(valid_values, nodata_value)
+    
+    # Median via in-place partition of the already-compacted valid values
+    k = n_valid // 2
+    if n_valid % 2:
+        valid_values.partition(k)
+        lst_median = float(valid_values[k])
+    else:
+        valid_values.partition((k - 1, k))
+        lst_median = (float(valid_values[k - 1]) + float(valid_values[k])) / 2.0
+    
     return {
-        "min": float(np.min(valid_values)),
-        "max": float(np.max(valid_values)),
-        "mean": float(np.mean(valid_values)),
-        "std": float(np.std(valid_values)),
-        "median": float(np.median(valid_values)),
-        "valid_pixels": int(np.sum(valid_mask)),
+        "min": moments["min"],
+        "max": moments["max"],
+        "mean": moments["mean"],
+        "std": moments["std"],
+        "median": lst_median,
+        "valid_pixels": int(n_valid),
         "total_pixels": int(lst.size),
         "unit": "Celsius",
     }
@@ -379,6 +913,7 @@ def classify_lst_thermal_zones(
     mean_lst: Optional[float] = None,
     std_lst: Optional[float] = None,
     nodata_value: float = -9999.0,
+    out: Optional[NDArray[np.int8]] = None,
 ) -> NDArray[np.int8]:
     """
     Classify LST into thermal comfort zones based on standard deviations from mean.
@@ -397,6 +932,7 @@ def classify_lst_thermal_zones(
         mean_lst: Optional pre-calculated mean (calculated if not provided)
         std_lst: Optional pre-calculated std (calculated if not provided)
         nodata_value: Value for no-data pixels
+        out: Optional pre-allocated int8 output array
     
     Returns:
         Classified array with zone values (0-6), -1 for nodata
@@ -407,32 +943,59 @@ def classify_lst_thermal_zones(
         mean_lst = stats["mean"]
         std_lst = stats["std"]
     
-    if mean_lst is None or std_lst is None:
-        return np.full(lst.shape, -1, dtype=np.int8)
-    
-    # Initialize with nodata
-    zones = np.full(lst.shape, -1, dtype=np.int8)
+    zones = np.empty(lst.shape, dtype=np.int8) if out is None else out
     
-    # Valid mask
-    valid_mask = (lst != nodata_value) & np.isfinite(lst)
+    if mean_lst is None or std_lst is None:
+        zones.fill(-1)
+        return zones
     
-    # Define thresholds
-    thresholds = [
+    # Define thresholds (in the LST dtype, matching elementwise comparisons)
+    thresholds = np.asarray([
         mean_lst - 2 * std_lst,
         mean_lst - 1 * std_lst,
         mean_lst - 0.5 * std_lst,
         mean_lst + 0.5 * std_lst,
         mean_lst + 1 * std_lst,
         mean_lst + 2 * std_lst,
-    ]
-    
-    # Classify
-    zones[valid_mask & (lst < thresholds[0])] = 0  # Very Cold
-    zones[valid_mask & (lst >= thresholds[0]) & (lst < thresholds[1])] = 1  # Cold
-    zones[valid_mask & (lst >= thresholds[1]) & (lst < thresholds[2])] = 2  # Cool
-    zones[valid_mask & (lst >= thresholds[2]) & (lst < thresholds[3])] = 3  # Comfortable
-    zones[valid_mask & (lst >= thresholds[3]) & (lst < thresholds[4])] = 4  # Warm
-    zones[valid_mask & (lst >= thresholds[4]) & (lst < thresholds[5])] = 5  # Hot
-    zones[valid_mask & (lst >= thresholds[5])] = 6  # Very Hot
+    ], dtype=lst.dtype)
+    
+    # Classify: zone i satisfies thresholds[i-1] <= lst < thresholds[i],
+    # i.e. the zone is the number of thresholds at or below the value,
+    # accumulated from vectorized compares straight into the int8 output
+    np.greater_equal(lst, thresholds[0], out=zones.view(np.bool_))
+    above = np.empty(lst.shape, dtype=bool)
+    for threshold in thresholds[1:]:
+        np.greater_equal(lst, threshold, out=above)
+        zones += above
+    
+    # Nodata and non-finite pixels (NaN lands past the last bin) get -1
+    invalid = ~np.isfinite(lst)
+    invalid |= lst == nodata_value
+    np.putmask(zones, invalid, -1)
     
     return zones
+
+
+def get_thermal_zone_percentages(zones: NDArray[np.int8]) -> Dict[str, float]:
+    """
+    Calculate the percentage of valid pixels in each thermal zone.
+    
+    Args:
+        zones: Thermal zone array from classify_lst_thermal_zones()
+    
+    Returns:
+        Dictionary with zone names (very_cold ... very_hot) and their
+        percentages (all 0.0 when no pixel is valid)
+    """
+    # One counting pass; nodata (-1) lands in the uint8 bin 255
+    counts = np.bincount(zones.view(np.uint8).reshape(-1), minlength=256)
+    counts = counts[:len(THERMAL_ZONE_NAMES)]
+    total_valid = int(counts.sum())
+    
+    if total_valid == 0:
+        return {name: 0.0 for name in THERMAL_ZONE_NAMES}
+    
+    return {
+        name: float(count / total_valid * 100)
+        for name, count in zip(THERMAL_ZONE_NAMES, counts.tolist())
+    }
@@ -13,10 +13,29 @@ NDVI values range from -1 to 1:
 - Values > 0.4: Dense vegetation, forests
 """
 
+import math
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 from enum import IntEnum
-from typing import Tuple, Dict
+from typing import Any, Dict, Optional, Tuple
+
+from ._common import _kernel_input, _kernel_output, _masked_statistics
+
+# Numba is optional; without it NDVI is computed with predicated NumPy ufuncs.
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# CuPy is optional; when installed, CuPy inputs are processed on the GPU.
+try:
+    import cupy as cp
+    HAS_CUPY = True
+except ImportError:
+    HAS_CUPY = False
 
 
 class NDVICategory(IntEnum):
@@ -34,11 +53,82 @@ NDVI_THRESHOLDS = {
     "sparse_max": 0.4,
 }
 
+# Ascending category boundaries for classify_ndvi, hoisted out of the call
+_NDVI_BINS = np.array([
+    NDVI_THRESHOLDS["water_max"],
+    NDVI_THRESHOLDS["urban_max"],
+    NDVI_THRESHOLDS["sparse_max"],
+])
+
+
+# Creation options for streamed NDVI rasters: internally tiled so each
+# block maps to one window, deflate-compressed (rasterio profile keywords)
+STREAMING_PROFILE = {
+    "driver": "GTiff",
+    "dtype": "float32",
+    "count": 1,
+    "nodata": -9999.0,
+    "tiled": True,
+    "blockxsize": 512,
+    "blockysize": 512,
+    "compress": "deflate",
+}
+
+
+if HAS_NUMBA:
+    # fastmath is left off: the kernels rely on isfinite() to detect invalid
+    # pixels and must match the NumPy path bit for bit.
+    @numba.njit(cache=True)
+    def _ndvi_pixel(n, r, nodata_value):
+        """Clipped NDVI of one pixel (already in the output dtype), or nodata."""
+        s = n + r
+        if (
+            math.isfinite(n) and math.isfinite(r)
+            and n != nodata_value and r != nodata_value and s != 0
+        ):
+            return min(1.0, max(-1.0, (n - r) / s))
+        return nodata_value
+    
+    @numba.njit(parallel=True, cache=True)
+    def _ndvi_kernel(nir, red, nodata_value, out):
+        """
+        Fused sum/difference, validity check, divide and clip over flat arrays.
+        
+        Reads each input once and writes each output once, so no temporaries
+        or masks are materialized. Compiled per (nir, red, out) dtype on first
+        use; each pixel is cast to the output dtype before any arithmetic.
+        """
+        for i in numba.prange(nir.size):
+            out[i] = _ndvi_pixel(
+                out.dtype.type(nir[i]), out.dtype.type(red[i]), nodata_value
+            )
+
+
+if HAS_CUPY:
+    # Same per-pixel rule as _ndvi_kernel, one GPU thread per pixel
+    _ndvi_cupy_kernel = cp.ElementwiseKernel(
+        "T nir, T red, T nodata_value",
+        "T ndvi",
+        """
+        T s = nir + red;
+        if (isfinite(nir) && isfinite(red)
+                && nir != nodata_value && red != nodata_value && s != (T)0) {
+            ndvi = min((T)1, max((T)-1, (nir - red) / s));
+        } else {
+            ndvi = nodata_value;
+        }
+        """,
+        "ndvi_kernel",
+    )
+
 
 def calculate_ndvi(
     nir: NDArray[np.floating],
     red: NDArray[np.floating],
     nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
+    valid_mask: Optional[NDArray[np.bool_]] = None,
+    out: Optional[NDArray[np.floating]] = None,
 ) -> NDArray[np.floating]:
     """
     Calculate NDVI from NIR (Band 5) and Red (Band 4) arrays.
@@ -49,10 +139,16 @@ def calculate_ndvi(
         nir: NumPy array containing Near Infrared band values (Landsat Band 5)
         red: NumPy array containing Red band values (Landsat Band 4)
         nodata_value: Value to use for no-data pixels (default: -9999.0)
+        dtype: Floating-point dtype for computation and output (default: float32)
+        valid_mask: Optional pre-computed mask of pixels where both inputs
+            are finite and not nodata (computed if not provided)
+        out: Optional pre-allocated output array, e.g. reused across the
+            scenes of a time series
     
     Returns:
         NumPy array with NDVI values clipped between -1 and 1.
-        NoData pixels are set to nodata_value.
+        NoData pixels are set to nodata_value. CuPy inputs yield a CuPy
+        array computed on the GPU.
     
     Raises:
         ValueError: If input arrays have different shapes.
@@ -72,12 +168,30 @@ def calculate_ndvi(
             f"NIR shape: {nir.shape}, Red shape: {red.shape}"
         )
     
-    # Convert to float64 for precision
-    nir = nir.astype(np.float64)
-    red = red.astype(np.float64)
+    if HAS_CUPY and isinstance(nir, cp.ndarray):
+        # Device-resident inputs: one fused elementwise kernel on the GPU
+        nir = nir.astype(dtype, copy=False)
+        red = cp.asarray(red, dtype=dtype)
+        return _ndvi_cupy_kernel(nir, red, nir.dtype.type(nodata_value), out)
+    
+    if HAS_NUMBA and valid_mask is None:
+        # Single pass: nir and red in their native dtype, ndvi out
+        nir = _kernel_input(nir, dtype)
+        red = _kernel_input(red, dtype)
+        if out is None:
+            out = np.empty(nir.shape, dtype=dtype)
+        ndvi = _kernel_output(out)
+        _ndvi_kernel(nir.reshape(-1), red.reshape(-1), nodata_value, ndvi.reshape(-1))
+        if ndvi is not out:
+            np.copyto(out, ndvi)
+        return out
+    
+    # Work in the requested precision (no copy if already that dtype)
+    nir = np.asarray(nir, dtype=dtype)
+    red = np.asarray(red, dtype=dtype)
     
-    # Create output array filled with nodata
-    ndvi = np.full(nir.shape, nodata_value, dtype=np.float64)
+    # Output is written once: NDVI for valid pixels, then nodata elsewhere
+    ndvi = np.empty(nir.shape, dtype=dtype) if out is None else out
     
     # Calculate sum for denominator
     denominator = nir + red
@@ -86,27 +200,104 @@ def calculate_ndvi(
     # - Both bands have valid data (not nodata)
     # - Denominator is not zero (avoid division by zero)
     # - Values are finite
-    valid_mask = (
-        np.isfinite(nir) & 
-        np.isfinite(red) & 
-        (nir != nodata_value) & 
-        (red != nodata_value) &
-        (denominator != 0)
-    )
+    if valid_mask is None:
+        valid_mask = (
+            np.isfinite(nir) & 
+            np.isfinite(red) & 
+            (nir != nodata_value) & 
+            (red != nodata_value)
+        )
+    valid_mask = valid_mask & (denominator != 0)
     
     # Calculate NDVI only for valid pixels
-    ndvi[valid_mask] = (nir[valid_mask] - red[valid_mask]) / denominator[valid_mask]
+    # (dense divide with a predicate rather than a masked gather/scatter)
+    np.subtract(nir, red, out=ndvi, where=valid_mask)
+    np.divide(ndvi, denominator, out=ndvi, where=valid_mask)
     
     # Clip values to valid NDVI range [-1, 1]
     # Only clip valid pixels to preserve nodata values
-    ndvi[valid_mask] = np.clip(ndvi[valid_mask], -1.0, 1.0)
+    np.clip(ndvi, -1.0, 1.0, out=ndvi, where=valid_mask)
+    np.putmask(ndvi, ~valid_mask, nodata_value)
     
     return ndvi
 
 
+def calculate_ndvi_streaming(
+    nir_ds: Any,
+    red_ds: Any,
+    out_ds: Any,
+    nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
+    prefetch: bool = True,
+) -> None:
+    """
+    Calculate NDVI block by block between open raster datasets.
+    
+    Iterates the internal blocks of the NIR dataset, reads only that window
+    from both bands, computes NDVI for it and writes it to the output, so
+    the full scene is never held in memory. With prefetch enabled the next
+    block pair is read on a background thread while the current one is
+    computed (raster reads release the GIL), overlapping IO with compute.
+    
+    Args:
+        nir_ds: Open rasterio dataset with the NIR band (Landsat Band 5)
+        red_ds: Open rasterio dataset with the Red band (Landsat Band 4),
+            on the same grid as nir_ds
+        out_ds: Rasterio dataset opened for writing, same grid as nir_ds
+            (see STREAMING_PROFILE for suitable creation options)
+        nodata_value: Value to use for no-data pixels (default: -9999.0)
+        dtype: Floating-point dtype for computation (default: float32)
+        prefetch: Read the next block while computing the current one
+    
+    Raises:
+        ValueError: If the datasets have different shapes.
+    
+    Example:
+        >>> with rasterio.open("B5.TIF") as nir, rasterio.open("B4.TIF") as red:
+        ...     profile = {**STREAMING_PROFILE, "width": nir.width,
+        ...                "height": nir.height, "crs": nir.crs,
+        ...                "transform": nir.transform}
+        ...     with rasterio.open("ndvi.tif", "w", **profile) as out:
+        ...         calculate_ndvi_streaming(nir, red, out)
+    """
+    shapes = [(ds.height, ds.width) for ds in (nir_ds, red_ds, out_ds)]
+    if len(set(shapes)) != 1:
+        raise ValueError(
+            f"Datasets must have the same shape. "
+            f"NIR: {shapes[0]}, Red: {shapes[1]}, Output: {shapes[2]}"
+        )
+    
+    def read_block(window):
+        blocks = []
+        for ds in (nir_ds, red_ds):
+            block = ds.read(1, window=window).astype(dtype, copy=False)
+            if ds.nodata is not None:
+                np.putmask(block, block == ds.nodata, nodata_value)
+            blocks.append(block)
+        return blocks
+    
+    windows = [window for _, window in nir_ds.block_windows(1)]
+    if not windows:
+        return
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(read_block, windows[0]) if prefetch else None
+        for i, window in enumerate(windows):
+            if prefetch:
+                nir, red = pending.result()
+                if i + 1 < len(windows):
+                    pending = executor.submit(read_block, windows[i + 1])
+            else:
+                nir, red = read_block(window)
+            
+            ndvi = calculate_ndvi(nir, red, nodata_value, dtype=dtype)
+            out_ds.write(ndvi.astype(out_ds.dtypes[0], copy=False), 1, window=window)
+
+
 def classify_ndvi(
     ndvi: NDArray[np.floating],
     nodata_value: float = -9999.0,
+    out: Optional[NDArray[np.int8]] = None,
 ) -> NDArray[np.int8]:
     """
     Classify NDVI values into land cover categories.
@@ -120,6 +311,7 @@ def classify_ndvi(
     Args:
         ndvi: NumPy array with NDVI values (from calculate_ndvi)
         nodata_value: Value indicating no-data pixels (default: -9999.0)
+        out: Optional pre-allocated int8 output array
     
     Returns:
         NumPy array with classification values (0-3).
@@ -132,28 +324,24 @@ def classify_ndvi(
         [[0 1]
          [2 3]]
     """
-    # Initialize with -1 for nodata
-    classified = np.full(ndvi.shape, -1, dtype=np.int8)
-    
-    # Create mask for valid NDVI values
-    valid_mask = (ndvi != nodata_value) & np.isfinite(ndvi)
+    # Category boundaries (in the NDVI dtype, matching elementwise comparisons)
+    bins = _NDVI_BINS.astype(ndvi.dtype, copy=False)
     
-    # Classify valid pixels
-    # Water: NDVI < 0
-    water_mask = valid_mask & (ndvi < NDVI_THRESHOLDS["water_max"])
-    classified[water_mask] = NDVICategory.WATER
+    # Category = number of thresholds at or below the value, accumulated
+    # from plain vectorized compares straight into the int8 output
+    # (NDVICategory values are these counts); CuPy inputs run the same
+    # ufuncs on the GPU
+    xp = cp.get_array_module(ndvi) if HAS_CUPY else np
+    classified = xp.empty(ndvi.shape, dtype=np.int8) if out is None else out
+    xp.greater_equal(ndvi, bins[0], out=classified.view(np.bool_))
+    above = xp.empty(ndvi.shape, dtype=bool)
+    for threshold in bins[1:]:
+        xp.greater_equal(ndvi, threshold, out=above)
+        classified += above
     
-    # Urban/Bare soil: 0 <= NDVI < 0.2
-    urban_mask = valid_mask & (ndvi >= NDVI_THRESHOLDS["water_max"]) & (ndvi < NDVI_THRESHOLDS["urban_max"])
-    classified[urban_mask] = NDVICategory.URBAN_BARE_SOIL
-    
-    # Sparse vegetation: 0.2 <= NDVI < 0.4
-    sparse_mask = valid_mask & (ndvi >= NDVI_THRESHOLDS["urban_max"]) & (ndvi < NDVI_THRESHOLDS["sparse_max"])
-    classified[sparse_mask] = NDVICategory.SPARSE_VEGETATION
-    
-    # Dense vegetation: NDVI >= 0.4
-    dense_mask = valid_mask & (ndvi >= NDVI_THRESHOLDS["sparse_max"])
-    classified[dense_mask] = NDVICategory.DENSE_VEGETATION
+    # Mark nodata pixels with a single masked write
+    valid_mask = (ndvi != nodata_value) & xp.isfinite(ndvi)
+    xp.putmask(classified, ~valid_mask, -1)
     
     return classified
 
@@ -178,26 +366,15 @@ def get_ndvi_statistics(
         - valid_pixels: Count of valid pixels
         - total_pixels: Total pixel count
     """
-    # Mask valid pixels
-    valid_mask = (ndvi != nodata_value) & np.isfinite(ndvi)
-    valid_values = ndvi[valid_mask]
-    
-    if len(valid_values) == 0:
-        return {
-            "min": None,
-            "max": None,
-            "mean": None,
-            "std": None,
-            "valid_pixels": 0,
-            "total_pixels": int(ndvi.size),
-        }
+    # Single pass over the valid pixels, without gathering them
+    stats = _masked_statistics(ndvi, nodata_value)
     
     return {
-        "min": float(np.min(valid_values)),
-        "max": float(np.max(valid_values)),
-        "mean": float(np.mean(valid_values)),
-        "std": float(np.std(valid_values)),
-        "valid_pixels": int(np.sum(valid_mask)),
+        "min": stats["min"],
+        "max": stats["max"],
+        "mean": stats["mean"],
+        "std": stats["std"],
+        "valid_pixels": stats["pixel_count"],
         "total_pixels": int(ndvi.size),
     }
 
@@ -17,15 +17,45 @@ References:
 - Voogt, J.A., & Oke, T.R. (2003). Thermal remote sensing of urban climates
 """
 
+import math
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 from typing import Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import IntEnum
 
+from ._common import _kernel_output, _masked_statistics, get_num_threads
 # Import land cover classes
 from .land_cover import LandCoverClass
 
+# SciPy is optional; without it hotspot clusters are labeled with a BFS.
+try:
+    from scipy import ndimage
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+# Numba is optional; without it zone statistics gather the valid pixels first.
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# CuPy is optional; when installed, CuPy LST arrays are analyzed on the GPU
+# and the hotspot mask stays device-resident.
+try:
+    import cupy as cp
+    from cupyx.scipy import ndimage as cp_ndimage
+    HAS_CUPY = True
+except ImportError:
+    HAS_CUPY = False
+
 
 @dataclass(frozen=True)
 class UHIThresholds:
@@ -58,6 +88,11 @@ UHI_INTENSITY_THRESHOLDS = {
     UHICategory.VERY_STRONG: 8.0,
 }
 
+# Lower bounds of WEAK..VERY_STRONG; a category is the count of bounds <= intensity
+_UHI_INTENSITY_BOUNDS = tuple(
+    UHI_INTENSITY_THRESHOLDS[category] for category in list(UHICategory)[1:]
+)
+
 UHI_CATEGORY_NAMES = {
     UHICategory.NONE: "No UHI Effect",
     UHICategory.WEAK: "Weak",
@@ -69,11 +104,119 @@ UHI_CATEGORY_NAMES = {
 
 THRESHOLDS = UHIThresholds()
 
+# Structuring element for 4-connected hotspot clusters
+_FOUR_CONNECTIVITY = np.array([[0, 1, 0],
+                               [1, 1, 1],
+                               [0, 1, 0]], dtype=bool)
+
+
+if HAS_NUMBA:
+    @numba.njit(parallel=True, cache=True)
+    def _hotspot_kernel(values, threshold, nodata_value, check_nodata, out):
+        """
+        Write values > threshold for finite, non-nodata pixels in one pass.
+        
+        NaN never passes the threshold test, and when the nodata value is
+        not above the threshold neither does nodata, so with check_nodata
+        False only +inf needs excluding.
+        """
+        if check_nodata:
+            for i in numba.prange(values.size):
+                x = values[i]
+                out[i] = x > threshold and math.isfinite(x) and x != nodata_value
+        else:
+            for i in numba.prange(values.size):
+                x = values[i]
+                out[i] = x > threshold and x != math.inf
+    
+    @numba.njit(parallel=True, cache=True)
+    def _uhi_map_kernel(values, rural_mean, nodata_value, out):
+        """Write values - rural_mean for valid pixels and nodata elsewhere."""
+        for i in numba.prange(values.size):
+            x = values[i]
+            if x != nodata_value and math.isfinite(x):
+                out[i] = x - rural_mean
+            else:
+                out[i] = nodata_value
+    
+    @numba.njit(parallel=True, cache=True)
+    def _masked_range_kernel(mask, values):
+        """Return min and max of values where mask is set, without gathering."""
+        lo = np.inf
+        hi = -np.inf
+        for i in numba.prange(mask.size):
+            if mask[i]:
+                lo = min(lo, values[i])
+                hi = max(hi, values[i])
+        return lo, hi
+    
+    @numba.njit(parallel=True, cache=True)
+    def _render_hotspots_kernel(mask, values, lo, span, one, scale, out):
+        """
+        Write the yellow-to-red gradient for hotspot pixels in one pass.
+        
+        lo, span, one and scale are passed in the intensity dtype so the
+        arithmetic matches the equivalent NumPy expression exactly.
+        """
+        alpha = out.shape[1] == 4
+        for i in numba.prange(mask.size):
+            if mask[i]:
+                t = (values[i] - lo) / span
+                out[i, 0] = 255
+                out[i, 1] = np.uint8(scale * (one - t))
+                out[i, 2] = 0
+                if alpha:
+                    out[i, 3] = 200
+    
+    @numba.njit(cache=True)
+    def _flood_label_kernel(labels, width, n_hot):
+        """
+        Label 4-connected clusters in place on a flat int32 label array.
+        
+        -1 marks an unlabeled hotspot pixel; returns the size of each cluster.
+        Each pixel is queued at most once, so an n_hot array is a big enough
+        queue.
+        """
+        queue = np.empty(n_hot, dtype=np.int64)
+        sizes = np.empty(n_hot, dtype=np.int64)
+        n_clusters = 0
+        for start in range(labels.size):
+            if labels[start] != -1:
+                continue
+            n_clusters += 1
+            labels[start] = n_clusters
+            head = 0
+            tail = 1
+            queue[0] = start
+            while head < tail:
+                idx = queue[head]
+                head += 1
+                col = idx % width
+                if idx >= width and labels[idx - width] == -1:
+                    labels[idx - width] = n_clusters
+                    queue[tail] = idx - width
+                    tail += 1
+                if idx + width < labels.size and labels[idx + width] == -1:
+                    labels[idx + width] = n_clusters
+                    queue[tail] = idx + width
+                    tail += 1
+                if col > 0 and labels[idx - 1] == -1:
+                    labels[idx - 1] = n_clusters
+                    queue[tail] = idx - 1
+                    tail += 1
+                if col < width - 1 and labels[idx + 1] == -1:
+                    labels[idx + 1] = n_clusters
+                    queue[tail] = idx + 1
+                    tail += 1
+            sizes[n_clusters - 1] = tail
+        return sizes[:n_clusters]
+
 
 def calculate_zone_temperature(
     lst: NDArray[np.floating],
     mask: NDArray[np.bool_],
     nodata_value: float = -9999.0,
+    valid_mask: Optional[NDArray[np.bool_]] = None,
 ) -> Dict[str, Optional[float]]:
     """
     Calculate temperature statistics for a specific zone.
@@ -82,30 +225,14 @@ def calculate_zone_temperature(
         lst: LST array in Celsius
         mask: Boolean mask for the zone of interest
         nodata_value: Value indicating no-data pixels
+        valid_mask: Optional pre-computed mask of finite, non-nodata LST
+            pixels (computed if needed and not provided)
     
     Returns:
         Dictionary with min, max, mean, std, and pixel count
     """
-    # Combine mask with valid LST data
-    valid_mask = mask & (lst != nodata_value) & np.isfinite(lst)
-    valid_temps = lst[valid_mask]
-    
-    if len(valid_temps) == 0:
-        return {
-            "min": None,
-            "max": None,
-            "mean": None,
-            "std": None,
-            "pixel_count": 0,
-        }
-    
-    return {
-        "min": float(np.min(valid_temps)),
-        "max": float(np.max(valid_temps)),
-        "mean": float(np.mean(valid_temps)),
-        "std": float(np.std(valid_temps)),
-        "pixel_count": int(len(valid_temps)),
-    }
+    # Single pass over the zone, without gathering its valid pixels
+    return _masked_statistics(lst, nodata_value, mask, valid_mask)
 
 
 def identify_hotspots(
@@ -114,6 +241,7 @@ def identify_hotspots(
     nodata_value: float = -9999.0,
     mean_temp: Optional[float] = None,
     std_temp: Optional[float] = None,
+    valid_mask: Optional[NDArray[np.bool_]] = None,
 ) -> Tuple[NDArray[np.bool_], Dict[str, float]]:
     """
     Identify thermal hotspots in LST data.
@@ -127,34 +255,59 @@ def identify_hotspots(
         nodata_value: Value indicating no-data pixels
         mean_temp: Optional pre-calculated mean temperature
         std_temp: Optional pre-calculated standard deviation
+        valid_mask: Optional pre-computed mask of finite, non-nodata LST
+            pixels (computed if needed and not provided)
     
     Returns:
         Tuple of:
         - Boolean mask of hotspot pixels
         - Dictionary with threshold info (mean, std, threshold_temp)
     """
-    # Create valid data mask
-    valid_mask = (lst != nodata_value) & np.isfinite(lst)
-    valid_temps = lst[valid_mask]
-    
-    if len(valid_temps) == 0:
-        return np.zeros(lst.shape, dtype=bool), {
-            "mean": None,
-            "std": None,
-            "threshold_temp": None,
-        }
-    
-    # Calculate stats if not provided
-    if mean_temp is None:
-        mean_temp = float(np.mean(valid_temps))
-    if std_temp is None:
-        std_temp = float(np.std(valid_temps))
+    # Calculate stats if not provided (single pass, no gathered copy)
+    if mean_temp is None or std_temp is None:
+        stats = _masked_statistics(lst, nodata_value, valid_mask=valid_mask)
+        if stats["pixel_count"] == 0:
+            return np.zeros(lst.shape, dtype=bool), {
+                "mean": None,
+                "std": None,
+                "threshold_temp": None,
+            }
+        if mean_temp is None:
+            mean_temp = stats["mean"]
+        if std_temp is None:
+            std_temp = stats["std"]
     
     # Calculate threshold temperature
     threshold_temp = mean_temp + (std_threshold * std_temp)
     
-    # Create hotspot mask
-    hotspot_mask = valid_mask & (lst > threshold_temp)
+    # Create hotspot mask, comparing in the LST dtype. A realistic threshold
+    # lies far above the nodata fill, so nodata pixels already fail the
+    # threshold test and need no separate check.
+    threshold = lst.dtype.type(threshold_temp)
+    check_nodata = bool(nodata_value > threshold)
+    
+    if HAS_CUPY and isinstance(lst, cp.ndarray):
+        # Stays on the device for cluster labeling
+        hotspot_mask = lst > threshold_temp
+        if valid_mask is None:
+            valid_mask = (lst != nodata_value) & cp.isfinite(lst)
+        hotspot_mask &= valid_mask
+    elif HAS_NUMBA:
+        hotspot_mask = np.empty(lst.shape, dtype=bool)
+        _hotspot_kernel(
+            np.ravel(lst), threshold, nodata_value, check_nodata,
+            hotspot_mask.reshape(-1),
+        )
+    else:
+        hotspot_mask = np.empty(lst.shape, dtype=bool)
+        np.greater(lst, threshold_temp, out=hotspot_mask)
+        if valid_mask is not None:
+            hotspot_mask &= valid_mask
+        elif check_nodata:
+            hotspot_mask &= np.isfinite(lst)
+            hotspot_mask &= lst != nodata_value
+        else:
+            hotspot_mask &= lst != np.inf
     
     return hotspot_mask, {
         "mean": mean_temp,
@@ -167,71 +320,96 @@ def identify_hotspots(
 def count_hotspot_clusters(
     hotspot_mask: NDArray[np.bool_],
     min_cluster_size: int = THRESHOLDS.MIN_CLUSTER_SIZE,
-) -> Tuple[int, NDArray[np.int32]]:
+    return_labels: bool = False,
+) -> Tuple[int, Optional[NDArray[np.int32]]]:
     """
     Count connected hotspot clusters using connected component labeling.
     
-    Uses a simple 4-connectivity flood fill algorithm.
-    For production use, consider scipy.ndimage.label for better performance.
+    Uses 4-connectivity. Labeling is done by scipy.ndimage.label when SciPy
+    is installed (cupyx.scipy.ndimage.label for CuPy masks), otherwise by a
+    flood fill over flat pixel indices (compiled with Numba when available).
     
     Args:
         hotspot_mask: Boolean mask of hotspot pixels
         min_cluster_size: Minimum pixels for a valid cluster
+        return_labels: Return the label array (a full-raster int32 array);
+            when False only the count is kept and None is returned instead
     
     Returns:
         Tuple of:
         - Number of clusters meeting minimum size
-        - Labeled array where each cluster has a unique ID
+        - Labeled array where each cluster has a unique ID, or None
     """
-    # Initialize labels
-    labels = np.zeros(hotspot_mask.shape, dtype=np.int32)
-    current_label = 0
-    
-    # Get hotspot coordinates
-    hotspot_coords = np.argwhere(hotspot_mask)
-    
-    if len(hotspot_coords) == 0:
-        return 0, labels
-    
-    # Create a set of unvisited hotspot pixels
-    unvisited = set(map(tuple, hotspot_coords))
-    
-    cluster_sizes = []
-    
-    while unvisited:
-        # Start new cluster
-        current_label += 1
-        start = unvisited.pop()
-        
-        # BFS to find connected pixels
-        queue = [start]
-        cluster_size = 0
-        
-        while queue:
-            pixel = queue.pop(0)
-            row, col = pixel
-            
-            if labels[row, col] != 0:
+    if HAS_CUPY and isinstance(hotspot_mask, cp.ndarray):
+        # Label on the GPU; only the cluster count comes back to the host
+        labels, num_clusters = cp_ndimage.label(
+            hotspot_mask, structure=cp.asarray(_FOUR_CONNECTIVITY)
+        )
+        cluster_sizes = cp.bincount(labels.ravel(), minlength=num_clusters + 1)
+        significant_clusters = int(cp.count_nonzero(cluster_sizes[1:] >= min_cluster_size))
+        return significant_clusters, labels.astype(np.int32, copy=False) if return_labels else None
+    
+    if HAS_SCIPY:
+        # C-implemented labeling, then cluster sizes from one bincount
+        labels = np.empty(hotspot_mask.shape, dtype=np.int32)
+        num_clusters = ndimage.label(
+            hotspot_mask, structure=_FOUR_CONNECTIVITY, output=labels
+        )
+        cluster_sizes = np.bincount(labels.ravel(), minlength=num_clusters + 1)
+        significant_clusters = int(np.count_nonzero(cluster_sizes[1:] >= min_cluster_size))
+        return significant_clusters, labels if return_labels else None
+    
+    # Initialize labels: -1 marks an unvisited hotspot pixel, 0 background,
+    # so the labels array itself doubles as the visited set
+    labels = np.negative(hotspot_mask, dtype=np.int32)
+    flat_labels = labels.reshape(-1)
+    width = labels.shape[-1] if labels.ndim else 1
+    n_hot = int(np.count_nonzero(hotspot_mask))
+    
+    if n_hot == 0:
+        return 0, labels if return_labels else None
+    
+    if HAS_NUMBA:
+        cluster_sizes = _flood_label_kernel(flat_labels, width, n_hot)
+    else:
+        # Same flood fill on flat indices; seeds are visited in raster order
+        cluster_sizes = []
+        current_label = 0
+        for start in np.flatnonzero(flat_labels):
+            if flat_labels[start] != -1:
                 continue
             
-            labels[row, col] = current_label
-            cluster_size += 1
+            # Start new cluster
+            current_label += 1
+            flat_labels[start] = current_label
             
-            # Check 4-connected neighbors
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nr, nc = row + dr, col + dc
+            # BFS to find connected pixels (labeled when queued)
+            queue = deque([int(start)])
+            cluster_size = 0
+            
+            while queue:
+                idx = queue.popleft()
+                cluster_size += 1
+                col = idx % width
                 
-                if 0 <= nr < hotspot_mask.shape[0] and 0 <= nc < hotspot_mask.shape[1]:
-                    if hotspot_mask[nr, nc] and (nr, nc) in unvisited:
-                        queue.append((nr, nc))
-                        unvisited.discard((nr, nc))
-        
-        cluster_sizes.append(cluster_size)
+                # Check 4-connected neighbors
+                for neighbor, inside in (
+                    (idx - width, idx >= width),
+                    (idx + width, idx + width < flat_labels.size),
+                    (idx - 1, col > 0),
+                    (idx + 1, col < width - 1),
+                ):
+                    if inside and flat_labels[neighbor] == -1:
+                        flat_labels[neighbor] = current_label
+                        queue.append(neighbor)
+            
+            cluster_sizes.append(cluster_size)
+        cluster_sizes = np.asarray(cluster_sizes)
     
     # Count clusters meeting minimum size
-    significant_clusters = sum(1 for size in cluster_sizes if size >= min_cluster_size)
+    significant_clusters = int(np.count_nonzero(cluster_sizes >= min_cluster_size))
     
-    return significant_clusters, labels
+    return significant_clusters, labels if return_labels else None
 
 
 def calculate_affected_area(
@@ -282,16 +460,7 @@ def classify_uhi_intensity(intensity: float) -> UHICategory:
     Returns:
         UHICategory enum value
     """
-    if intensity < UHI_INTENSITY_THRESHOLDS[UHICategory.WEAK]:
-        return UHICategory.NONE
-    elif intensity < UHI_INTENSITY_THRESHOLDS[UHICategory.MODERATE]:
-        return UHICategory.WEAK
-    elif intensity < UHI_INTENSITY_THRESHOLDS[UHICategory.STRONG]:
-        return UHICategory.MODERATE
-    elif intensity < UHI_INTENSITY_THRESHOLDS[UHICategory.VERY_STRONG]:
-        return UHICategory.STRONG
-    else:
-        return UHICategory.VERY_STRONG
+    return UHICategory(bisect_right(_UHI_INTENSITY_BOUNDS, intensity))
 
 
 def analyze_uhi(
@@ -300,6 +469,9 @@ def analyze_uhi(
     nodata_value: float = -9999.0,
     pixel_resolution_m: float = THRESHOLDS.PIXEL_RESOLUTION_M,
     hotspot_std_threshold: float = THRESHOLDS.HOTSPOT_STD_THRESHOLD,
+    return_labels: bool = False,
+    max_workers: Optional[int] = None,
+    lst_stats: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Comprehensive Urban Heat Island analysis.
@@ -317,6 +489,13 @@ def analyze_uhi(
         nodata_value: Value indicating no-data pixels
         pixel_resolution_m: Pixel size in meters
         hotspot_std_threshold: Std devs above mean for hotspots
+        return_labels: Include the hotspot cluster label array
+            ("cluster_labels") in the result
+        max_workers: Number of worker threads for the independent
+            sub-analyses on the NumPy path (default: get_num_threads())
+        lst_stats: Optional pre-computed scene statistics with min, max,
+            mean and std (e.g. from get_lst_statistics); saves the pass
+            over the LST array that would otherwise compute them
     
     Returns:
         Dictionary containing all UHI analysis results
@@ -328,13 +507,38 @@ def analyze_uhi(
             f"LST: {lst.shape}, Land cover: {land_cover.shape}"
         )
     
-    # Create masks for urban and vegetation (rural reference)
-    urban_mask = land_cover == LandCoverClass.URBAN
-    vegetation_mask = land_cover == LandCoverClass.VEGETATION
+    # Valid LST pixels, computed once and shared by every sub-analysis
+    # (the Numba kernels test validity inline and do not need it)
+    valid_lst = None if HAS_NUMBA else (lst != nodata_value) & np.isfinite(lst)
     
-    # Calculate zone temperatures
-    urban_stats = calculate_zone_temperature(lst, urban_mask, nodata_value)
-    rural_stats = calculate_zone_temperature(lst, vegetation_mask, nodata_value)
+    def zone_stats(land_cover_class):
+        zone_mask = land_cover == land_cover_class
+        return calculate_zone_temperature(lst, zone_mask, nodata_value, valid_lst)
+    
+    # Urban zone, rural (vegetation) reference zone and overall statistics
+    # only read the inputs, so they are independent tasks
+    tasks = [
+        partial(zone_stats, LandCoverClass.URBAN),
+        partial(zone_stats, LandCoverClass.VEGETATION),
+    ]
+    if lst_stats is None:
+        tasks.append(partial(_masked_statistics, lst, nodata_value, valid_mask=valid_lst))
+    
+    # Numba kernels already use every core, so threads only pay off on the
+    # NumPy path, whose ufuncs and reductions release the GIL
+    workers = 1 if HAS_NUMBA else min(max_workers or get_num_threads(), len(tasks))
+    
+    if workers <= 1:
+        results = [task() for task in tasks]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda task: task(), tasks))
+    urban_stats, rural_stats = results[:2]
+    if lst_stats is None:
+        overall_stats = results[2]
+        del overall_stats["pixel_count"]
+    else:
+        overall_stats = {key: lst_stats[key] for key in ("min", "max", "mean", "std")}
     
     # Calculate UHI intensity
     uhi_intensity = None
@@ -344,29 +548,26 @@ def analyze_uhi(
         uhi_intensity = urban_stats["mean"] - rural_stats["mean"]
         uhi_category = classify_uhi_intensity(uhi_intensity)
     
-    # Identify hotspots
+    # Identify hotspots, reusing the overall mean and std rather than
+    # reducing the whole raster again
     hotspot_mask, hotspot_info = identify_hotspots(
-        lst, 
+        lst,
         std_threshold=hotspot_std_threshold,
-        nodata_value=nodata_value
+        nodata_value=nodata_value,
+        mean_temp=overall_stats["mean"],
+        std_temp=overall_stats["std"],
+        valid_mask=valid_lst,
     )
     
     # Count hotspot clusters
-    cluster_count, cluster_labels = count_hotspot_clusters(hotspot_mask)
+    cluster_count, cluster_labels = count_hotspot_clusters(
+        hotspot_mask, return_labels=return_labels
+    )
     
     # Calculate affected area
     area_stats = calculate_affected_area(hotspot_mask, pixel_resolution_m)
     
-    # Calculate overall LST statistics
-    valid_mask = (lst != nodata_value) & np.isfinite(lst)
-    overall_stats = {
-        "min": float(np.min(lst[valid_mask])) if np.any(valid_mask) else None,
-        "max": float(np.max(lst[valid_mask])) if np.any(valid_mask) else None,
-        "mean": float(np.mean(lst[valid_mask])) if np.any(valid_mask) else None,
-        "std": float(np.std(lst[valid_mask])) if np.any(valid_mask) else None,
-    }
-    
-    return {
+    result = {
         # Primary UHI metrics
         "uhi_intensity": round(uhi_intensity, 2) if uhi_intensity is not None else None,
         "uhi_category": UHI_CATEGORY_NAMES[uhi_category],
@@ -391,18 +592,25 @@ def analyze_uhi(
         
         # Masks for visualization
         "hotspot_mask": hotspot_mask,
-        "cluster_labels": cluster_labels,
         
         # Metadata
         "pixel_resolution_m": pixel_resolution_m,
         "unit": "Celsius",
     }
+    
+    # The label raster is as large as the scene; only keep it on request
+    if return_labels:
+        result["cluster_labels"] = cluster_labels
+    
+    return result
 
 
 def create_uhi_map(
     lst: NDArray[np.floating],
     land_cover: NDArray[np.int8],
     nodata_value: float = -9999.0,
+    dtype: DTypeLike = np.float32,
+    out: Optional[NDArray[np.floating]] = None,
 ) -> NDArray[np.floating]:
     """
     Create a UHI intensity map (temperature anomaly from rural mean).
@@ -414,6 +622,8 @@ def create_uhi_map(
         lst: LST array in Celsius
         land_cover: Land cover classification array
         nodata_value: Value indicating no-data pixels
+        dtype: Floating-point dtype for computation and output (default: float32)
+        out: Optional pre-allocated output array (its dtype takes precedence)
     
     Returns:
         Array with temperature anomaly values (positive = warmer than rural)
@@ -422,15 +632,30 @@ def create_uhi_map(
     vegetation_mask = land_cover == LandCoverClass.VEGETATION
     rural_stats = calculate_zone_temperature(lst, vegetation_mask, nodata_value)
     
+    uhi_map = np.empty(lst.shape, dtype=dtype) if out is None else out
+    
     if rural_stats["mean"] is None:
-        return np.full(lst.shape, nodata_value, dtype=np.float64)
+        uhi_map.fill(nodata_value)
+        return uhi_map
     
     rural_mean = rural_stats["mean"]
     
-    # Create anomaly map
-    uhi_map = np.full(lst.shape, nodata_value, dtype=np.float64)
-    valid_mask = (lst != nodata_value) & np.isfinite(lst)
-    uhi_map[valid_mask] = lst[valid_mask] - rural_mean
+    # Create anomaly map (every pixel is written, so no pre-fill)
+    if HAS_NUMBA:
+        # Single pass: subtract and nodata fill per pixel, in the LST dtype
+        buffer = _kernel_output(uhi_map)
+        _uhi_map_kernel(
+            np.ravel(lst), lst.dtype.type(rural_mean), nodata_value,
+            buffer.reshape(-1),
+        )
+        if buffer is not uhi_map:
+            np.copyto(uhi_map, buffer)
+    else:
+        # Compute every pixel, then reset invalid ones
+        # (cheaper than pre-filling with nodata when most pixels are valid)
+        np.subtract(lst, rural_mean, out=uhi_map, casting="unsafe")
+        valid_mask = (lst != nodata_value) & np.isfinite(lst)
+        np.putmask(uhi_map, ~valid_mask, nodata_value)
     
     return uhi_map
 
@@ -454,44 +679,62 @@ def create_hotspot_visualization(
     Returns:
         RGBA array for visualization (uint8)
     """
+    if HAS_CUPY:
+        # The image is rendered on the host; copy device masks back once
+        hotspot_mask = cp.asnumpy(hotspot_mask)
+        if intensity is not None:
+            intensity = cp.asnumpy(intensity)
+    
     height, width = hotspot_mask.shape
     channels = 4 if alpha else 3
     
     # Initialize transparent/black
     rgb = np.zeros((height, width, channels), dtype=np.uint8)
     
-    if intensity is not None and np.any(hotspot_mask):
-        # Normalize intensity for color mapping
-        valid_intensity = intensity[hotspot_mask]
-        min_val = np.min(valid_intensity)
-        max_val = np.max(valid_intensity)
+    if not np.any(hotspot_mask):
+        return rgb
+    
+    # Solid red for hotspots unless an intensity gradient applies
+    color = (255, 50, 50)
+    
+    if intensity is not None:
+        dtype = intensity.dtype.type
+        mask_flat = np.ravel(hotspot_mask)
+        values = np.ravel(intensity)
         
-        if max_val > min_val:
-            # Create gradient: yellow (low) to red (high)
-            normalized = (intensity - min_val) / (max_val - min_val)
-            
-            # R channel: always 255 for hotspots
-            rgb[hotspot_mask, 0] = 255
-            
-            # G channel: 255 (yellow) to 0 (red) based on intensity
-            rgb[hotspot_mask, 1] = (255 * (1 - normalized[hotspot_mask])).astype(np.uint8)
-            
-            # B channel: 0
-            rgb[hotspot_mask, 2] = 0
+        # Intensity range over hotspot pixels only
+        if HAS_NUMBA:
+            min_val, max_val = _masked_range_kernel(mask_flat, values)
+            min_val, max_val = dtype(min_val), dtype(max_val)
         else:
-            # All same intensity, use solid orange
-            rgb[hotspot_mask, 0] = 255
-            rgb[hotspot_mask, 1] = 100
-            rgb[hotspot_mask, 2] = 0
-    else:
-        # Solid red for hotspots
-        rgb[hotspot_mask, 0] = 255
-        rgb[hotspot_mask, 1] = 50
-        rgb[hotspot_mask, 2] = 50
-    
-    if alpha:
-        # Set alpha: opaque for hotspots, transparent otherwise
-        rgb[hotspot_mask, 3] = 200  # Slightly transparent
+            valid_intensity = values[mask_flat]
+            min_val = np.min(valid_intensity)
+            max_val = np.max(valid_intensity)
+        
+        if max_val > min_val:
+            # Gradient: yellow (low) to red (high), green fading with intensity
+            rgb_flat = rgb.reshape(-1, channels)
+            if HAS_NUMBA:
+                _render_hotspots_kernel(
+                    mask_flat, values, min_val, max_val - min_val,
+                    dtype(1), dtype(255), rgb_flat,
+                )
+            else:
+                normalized = (valid_intensity - min_val) / (max_val - min_val)
+                colors = np.zeros((normalized.size, channels), dtype=np.uint8)
+                colors[:, 0] = 255
+                colors[:, 1] = (255 * (1 - normalized)).astype(np.uint8)
+                if alpha:
+                    colors[:, 3] = 200
+                rgb_flat[mask_flat] = colors
+            return rgb
+        
+        # All same intensity, use solid orange
+        color = (255, 100, 0)
+    
+    # One scatter writes every channel, including alpha
+    # (slightly transparent for hotspots, transparent otherwise)
+    rgb[hotspot_mask] = color + (200,) if alpha else color
     
     return rgb
 
@@ -9,44 +9,70 @@ This API processes Landsat 8/9 imagery to calculate:
 - Actionable recommendations for heat mitigation
 """
 
+import io
 import os
+import sys
 import time
+import shutil
+import asyncio
+import multiprocessing
 import uuid
 import logging
 import tempfile
 from typing import Optional, List, Dict, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from xml.sax.saxutils import escape
 
 import numpy as np
 from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+
+# orjson serializes the large analysis payloads (and NumPy arrays and
+# scalars) in C; the stdlib encoder is used if it is not installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# CuPy is optional; with a visible CUDA device, NDVI/LST run on the GPU
+try:
+    import cupy as cp
+    HAS_CUDA = cp.cuda.runtime.getDeviceCount() > 0
+except (ImportError, RuntimeError):
+    HAS_CUDA = False
 
 # Rasterio for GeoTIFF processing
 import rasterio
 from rasterio.transform import xy
+from rasterio.windows import Window
 
 # Import calculation modules
 from calculations import (
     # NDVI
-    calculate_ndvi,
     classify_ndvi,
     get_ndvi_statistics,
     get_classification_percentages,
     # LST
-    dn_to_radiance,
-    radiance_to_brightness_temperature,
-    estimate_emissivity_from_ndvi,
-    calculate_lst,
-    get_lst_statistics,
+    calculate_ndvi_lst,
     classify_lst_thermal_zones,
+    get_lst_statistics,
+    get_thermal_zone_percentages,
     RadianceCoefficients,
     # Land Cover
     classify_land_cover,
     get_land_cover_statistics,
     # UHI
     analyze_uhi,
-    create_uhi_map,
+    # Threads
+    set_num_threads,
+    # Warm-up
+    warmup_kernels,
 )
 
 # Import analysis modules
@@ -54,10 +80,11 @@ from analysis import generate_insights
 
 # Import utility modules
 from utils.heatmap import (
-    generate_heatmap_data as gen_heatmap,
+    generate_heatmap_arrays as gen_heatmap,
     HeatmapConfig,
     get_heatmap_statistics,
 )
+from utils.file_handler import HEADER_GDAL_OPTIONS
 
 # Configure logging
 logging.basicConfig(
@@ -67,11 +94,74 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class ORJSONAPIResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+APIResponse = ORJSONAPIResponse if HAS_ORJSON else JSONResponse
+
+
+# Analysis worker processes, created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _init_worker(num_threads: int) -> None:
+    """Give an analysis worker its share of the cores and load the kernels."""
+    # Numba kernels and the calculation thread pools
+    set_num_threads(num_threads)
+    # GDAL decoding, unless a fixed thread count was configured
+    if os.environ.get("GDAL_NUM_THREADS") == "ALL_CPUS":
+        os.environ["GDAL_NUM_THREADS"] = str(num_threads)
+    warmup_kernels()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Return the process pool that runs the analysis pipeline.
+    
+    Workers are spawned (not forked, which is unsafe with the threads of
+    GDAL and Numba) and split the cores between them, so concurrent
+    analyses run in parallel without oversubscribing the CPU.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=ANALYSIS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(max(1, (os.cpu_count() or 1) // ANALYSIS_WORKERS),),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut the analysis process pool down; the next use creates a new one."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the analysis workers (each compiles the kernels it runs)."""
+    get_process_pool()
+    yield
+    shutdown_process_pool()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="UHI-LST Analysis API",
     description="API for processing Landsat 8/9 imagery to calculate Land Surface Temperature (LST) and Urban Heat Island (UHI) indices",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=APIResponse,
 )
 
 # CORS configuration - allow frontend requests
@@ -92,13 +182,36 @@ REQUIRED_BANDS = ["B2", "B3", "B4", "B5", "B6", "B7", "B10"]
 # Default nodata value
 NODATA_VALUE = -9999.0
 
+# Uploads are copied to disk in chunks of this many bytes
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Uploads backed by a file descriptor are copied file to file in the
+# kernel (Linux)
+HAS_SENDFILE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+
+# Bands are processed in row strips of about this many rows (a multiple of
+# the file's block height), so full-scene band arrays are never loaded
+STRIP_ROWS = 1024
+
+# Let GDAL decode compressed band files on all cores, keep decoded blocks
+# of the band stack in its cache and buffer file reads, unless configured
+os.environ.setdefault("GDAL_NUM_THREADS", "ALL_CPUS")
+os.environ.setdefault("GDAL_CACHEMAX", "512")
+os.environ.setdefault("VSI_CACHE", "TRUE")
+
+# Analyses run in this many worker processes (default: half the cores)
+ANALYSIS_WORKERS = max(1, int(os.environ.get("ANALYSIS_WORKERS", (os.cpu_count() or 1) // 2)))
+
+# HTTP caching of the static /api/legend response
+LEGEND_CACHE_CONTROL = "public, max-age=86400"
+
 # Maximum heatmap points to return (for performance)
 MAX_HEATMAP_POINTS = 5000
 
 # Heatmap configuration
 HEATMAP_CONFIG = HeatmapConfig(
     max_points=MAX_HEATMAP_POINTS,
-    sample_step=10,  # Sample every 10th pixel
+    sampling="stratified",  # Points spread over the temperature range
     nodata_value=NODATA_VALUE,
 )
 
@@ -111,6 +224,207 @@ def validate_tiff_file(file: UploadFile) -> bool:
     return ext in ALLOWED_EXTENSIONS
 
 
+def save_upload(file: UploadFile, file_path: str) -> None:
+    """
+    Copy an uploaded file to disk (blocking; run it in a worker thread).
+    
+    The upload is copied with sendfile, without passing through Python
+    bytes, when it is backed by a file descriptor; otherwise it is copied
+    in UPLOAD_CHUNK_SIZE chunks.
+    
+    Args:
+        file: Uploaded file
+        file_path: Destination path
+    """
+    src = file.file
+    # Rewinding also flushes any buffered upload data to the descriptor
+    src.seek(0)
+    with open(file_path, "wb") as dst:
+        if HAS_SENDFILE:
+            try:
+                src_fd = src.fileno()
+                size = os.fstat(src_fd).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except (AttributeError, io.UnsupportedOperation, OSError):
+                # No usable descriptor (or sendfile is not supported for
+                # it): start over with a buffered copy
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+        shutil.copyfileobj(src, dst, UPLOAD_CHUNK_SIZE)
+
+
+def read_bands(
+    src: rasterio.io.DatasetReader,
+    window: Optional[Window] = None,
+    indexes: Optional[List[int]] = None,
+) -> np.ndarray:
+    """
+    Read bands of an open dataset as float32 with nodata standardized.
+    
+    Args:
+        src: Open rasterio dataset (a single band file or a band stack)
+        window: Optional window to read (default: the whole raster)
+        indexes: Optional 1-based band indexes to read (default: all bands)
+    
+    Returns:
+        float32 array of shape (bands, rows, cols) with each band's nodata,
+        zero and negative pixels set to NODATA_VALUE
+    """
+    indexes = list(indexes or src.indexes)
+    
+    # Decode straight into a float32 buffer (no native-dtype copy)
+    data = src.read(indexes, window=window, out_dtype=np.float32)
+    
+    # Replace nodata, zeros and negative values (common nodata
+    # indicators) with our standard nodata value, one band at a time with
+    # the comparisons written into two reused single-band masks
+    invalid = np.empty(data.shape[1:], dtype=bool)
+    matches = np.empty(data.shape[1:], dtype=bool)
+    for band, index in zip(data, indexes):
+        np.less_equal(band, 0, out=invalid)
+        nodata = src.nodatavals[index - 1]
+        if nodata is not None:
+            np.equal(band, np.float32(nodata), out=matches)
+            invalid |= matches
+        np.putmask(band, invalid, NODATA_VALUE)
+    
+    return data
+
+
+def build_band_stack(file_paths: Dict[str, str]) -> Tuple[str, dict]:
+    """
+    Describe single-band files as one multi-band VRT dataset.
+    
+    The VRT has one Float32 band per file (in the given order) carrying that
+    file's nodata value and block size, so one read returns every band as
+    a (bands, rows, cols) array. It is georeferenced with the first band's
+    CRS and transform.
+    
+    Args:
+        file_paths: Band name to GeoTIFF path
+    
+    Returns:
+        Tuple of (VRT XML, openable with rasterio.open, and the metadata
+        dict of the first band)
+    
+    Raises:
+        ValueError: If the bands do not all have the same shape
+    """
+    metadata = None
+    georeferencing = ""
+    vrt_bands = []
+    for index, file_path in enumerate(file_paths.values(), start=1):
+        with rasterio.open(file_path) as src:
+            if metadata is None:
+                metadata = band_metadata(src)
+                # The stack takes the first band's CRS and geotransform
+                # (GDAL order: c, a, b, f, d, e)
+                if src.crs:
+                    georeferencing += f"<SRS>{escape(src.crs.to_wkt())}</SRS>"
+                geotransform = ", ".join(repr(value) for value in src.get_transform())
+                georeferencing += f"<GeoTransform>{geotransform}</GeoTransform>"
+            elif src.shape != (metadata["height"], metadata["width"]):
+                raise ValueError(
+                    f"All input bands must have the same shape, got "
+                    f"{src.shape} and {(metadata['height'], metadata['width'])}"
+                )
+            block_rows, block_cols = src.block_shapes[0]
+            nodata = "" if src.nodata is None else f"<NoDataValue>{src.nodata!r}</NoDataValue>"
+            vrt_bands.append(
+                f'<VRTRasterBand dataType="Float32" band="{index}" '
+                f'blockXSize="{block_cols}" blockYSize="{block_rows}">{nodata}'
+                f'<SimpleSource><SourceFilename relativeToVRT="0">{escape(file_path)}'
+                f'</SourceFilename><SourceBand>1</SourceBand></SimpleSource>'
+                f'</VRTRasterBand>'
+            )
+    
+    vrt = (
+        f'<VRTDataset rasterXSize="{metadata["width"]}" rasterYSize="{metadata["height"]}">'
+        + georeferencing
+        + "".join(vrt_bands)
+        + "</VRTDataset>"
+    )
+    return vrt, metadata
+
+
+def band_metadata(src: rasterio.io.DatasetReader) -> dict:
+    """Return the metadata dict (transform, crs, bounds, ...) of a dataset."""
+    return {
+        "transform": src.transform,
+        "crs": str(src.crs),
+        "bounds": src.bounds,
+        "width": src.width,
+        "height": src.height,
+        "nodata": src.nodata,
+    }
+
+
+def validate_band_headers(file_paths: Dict[str, str]) -> None:
+    """
+    Check that all bands share one grid, reading only the file headers.
+    
+    Opening a dataset reads its header but no pixel data, so mismatched
+    uploads are rejected before any raster I/O is done.
+    
+    Args:
+        file_paths: Band name to GeoTIFF path
+    
+    Raises:
+        ValueError: If the bands differ in shape, CRS or transform
+        rasterio.errors.RasterioIOError: If a file cannot be opened
+    """
+    reference = None
+    for band_name, file_path in file_paths.items():
+        with rasterio.Env(**HEADER_GDAL_OPTIONS), rasterio.open(file_path) as src:
+            grid = (src.shape, src.crs, src.transform)
+        if reference is None:
+            reference = (band_name, grid)
+            continue
+        
+        reference_name, reference_grid = reference
+        for label, value, expected in zip(("shape", "CRS", "transform"), grid, reference_grid):
+            if value != expected:
+                raise ValueError(
+                    f"All input bands must have the same {label}: {band_name} has "
+                    f"{value}, {reference_name} has {expected}"
+                )
+
+
+def strip_windows(src: rasterio.io.DatasetReader, target_rows: int = STRIP_ROWS) -> List[Window]:
+    """
+    Split a dataset into full-width row strips aligned to its blocks.
+    
+    Untiled files store full-width row strips, so any row range can be read
+    directly; when such a strip is taller than ``target_rows`` (e.g. a file
+    written as one strip) the windows are not aligned to it, keeping strip
+    memory bounded instead of reading the whole scene at once.
+    
+    Args:
+        src: Open rasterio dataset
+        target_rows: Approximate strip height, rounded down to a multiple
+            of the block height (at least one block)
+    
+    Returns:
+        List of windows covering the dataset top to bottom
+    """
+    block_rows, block_cols = src.block_shapes[0]
+    if block_cols >= src.width and block_rows > target_rows:
+        rows = max(1, target_rows)
+    else:
+        rows = max(block_rows, target_rows // block_rows * block_rows)
+    return [
+        Window(0, row, src.width, min(rows, src.height - row))
+        for row in range(0, src.height, rows)
+    ]
+
+
 def load_band_as_array(file_path: str) -> Tuple[np.ndarray, dict]:
     """
     Load a GeoTIFF band file and return the data array and metadata.
@@ -122,28 +436,10 @@ def load_band_as_array(file_path: str) -> Tuple[np.ndarray, dict]:
         Tuple of (data array, metadata dict with transform, crs, bounds)
     """
     with rasterio.open(file_path) as src:
-        data = src.read(1).astype(np.float64)
-        
-        # Replace nodata with our standard nodata value
-        if src.nodata is not None:
-            data[data == src.nodata] = NODATA_VALUE
-        
-        # Replace zeros and negative values (common nodata indicators)
-        data[data <= 0] = NODATA_VALUE
-        
-        metadata = {
-            "transform": src.transform,
-            "crs": str(src.crs),
-            "bounds": src.bounds,
-            "width": src.width,
-            "height": src.height,
-            "nodata": src.nodata,
-        }
-        
-        return data, metadata
+        return read_bands(src, indexes=[1])[0], band_metadata(src)
 
 
-# Note: generate_heatmap_data is now imported from utils.heatmap
+# Note: heatmap generation (generate_heatmap_arrays) is imported from utils.heatmap
 
 
 @app.get("/")
@@ -162,7 +458,249 @@ async def health_check():
     return {"status": "ok"}
 
 
-@app.post("/api/analyze")
+def run_pipeline(
+    saved_files: Dict[str, str],
+    ml_coefficient: float,
+    al_coefficient: float,
+    job_id: str,
+) -> Dict[str, Any]:
+    """
+    Run Steps 2-8 of the analysis on saved band files.
+    
+    A top-level function that only takes file paths and scalars, so it can
+    run in a worker process without pickling any raster data.
+    
+    Args:
+        saved_files: Band name (B2 ... B10) to GeoTIFF path
+        ml_coefficient: Radiance multiplicative factor from MTL file
+        al_coefficient: Radiance additive factor from MTL file
+        job_id: Job identifier for log messages
+    
+    Returns:
+        Response sections (metadata, lst, ndvi, land_cover, uhi, insights,
+        heatmap) plus "step_times" with the duration of each step
+    """
+    step_times = {}
+    
+    # ========== Steps 2-5: Load bands, NDVI, LST, land cover ==========
+    # Processed in row strips: only one strip of each band and of
+    # the LST intermediates is in memory at a time, while NDVI, LST
+    # and land cover are written into full-scene outputs
+    logger.info(f"[{job_id}] Steps 2-5: Processing bands in row strips...")
+    for step in ("load_bands", "ndvi", "lst", "land_cover"):
+        step_times[step] = 0.0
+    
+    # All bands are read through one VRT stack: one dataset and one
+    # read call per strip returning every band
+    stack_vrt, metadata = build_band_stack(saved_files)
+    
+    # The next strip is read in a worker thread while the current one is
+    # computed: GDAL decodes and the fused kernel both run without the
+    # GIL, so reading overlaps computation. The reader is shut down (a
+    # read in flight finished) before the stack is closed.
+    with rasterio.open(stack_vrt) as stack, ThreadPoolExecutor(max_workers=1) as reader:
+        height, width = metadata["height"], metadata["width"]
+        windows = strip_windows(stack)
+        
+        ndvi = np.empty((height, width), dtype=np.float32)
+        lst = np.empty((height, width), dtype=np.float32)
+        land_cover = np.empty((height, width), dtype=np.int8)
+        
+        pending = reader.submit(read_bands, stack, windows[0])
+        for index, window in enumerate(windows):
+            rows = slice(window.row_off, window.row_off + window.height)
+            
+            # One (bands, rows, cols) read; the per-band arrays are views
+            # into it
+            step_start = time.time()
+            strip = dict(zip(saved_files, pending.result()))
+            if index + 1 < len(windows):
+                pending = reader.submit(read_bands, stack, windows[index + 1])
+            step_times["load_bands"] += time.time() - step_start
+            
+            # NDVI and DN → Radiance → Brightness Temperature,
+            # NDVI → Emissivity → LST in one fused pass (timed as
+            # the LST step)
+            step_start = time.time()
+            if HAS_CUDA:
+                # Three bands up, NDVI and LST back: one
+                # transfer each way per strip
+                ndvi_strip, lst_strip = calculate_ndvi_lst(
+                    nir=cp.asarray(strip["B5"]),
+                    red=cp.asarray(strip["B4"]),
+                    band_10=cp.asarray(strip["B10"]),
+                    ml=ml_coefficient,
+                    al=al_coefficient,
+                    nodata_value=NODATA_VALUE,
+                )
+                cp.asnumpy(ndvi_strip, out=ndvi[rows])
+                cp.asnumpy(lst_strip, out=lst[rows])
+            else:
+                calculate_ndvi_lst(
+                    nir=strip["B5"],
+                    red=strip["B4"],
+                    band_10=strip["B10"],
+                    ml=ml_coefficient,
+                    al=al_coefficient,
+                    nodata_value=NODATA_VALUE,
+                    out_ndvi=ndvi[rows],
+                    out_lst=lst[rows],
+                )
+            step_times["lst"] += time.time() - step_start
+            
+            step_start = time.time()
+            land_cover[rows], _ = classify_land_cover(
+                band_2=strip["B2"],
+                band_3=strip["B3"],
+                band_4=strip["B4"],
+                band_5=strip["B5"],
+                band_6=strip["B6"],
+                band_7=strip["B7"],
+                nodata_value=NODATA_VALUE,
+                ndvi=ndvi[rows],
+                include_urban_index=False,
+            )
+            step_times["land_cover"] += time.time() - step_start
+    
+    logger.info(f"[{job_id}] Bands loaded in {step_times['load_bands']:.3f}s. Shape: {lst.shape}")
+    
+    # Scene-wide statistics over the assembled outputs
+    step_start = time.time()
+    ndvi_stats = get_ndvi_statistics(ndvi, NODATA_VALUE)
+    # int8 class buffer shared by the NDVI classes and thermal zones
+    class_buffer = np.empty(ndvi.shape, dtype=np.int8)
+    ndvi_classified = classify_ndvi(ndvi, NODATA_VALUE, out=class_buffer)
+    ndvi_percentages = get_classification_percentages(ndvi_classified)
+    step_times["ndvi"] += time.time() - step_start
+    logger.info(f"[{job_id}] NDVI calculated in {step_times['ndvi']:.3f}s. Mean: {ndvi_stats['mean']:.3f}")
+    
+    step_start = time.time()
+    lst_stats = get_lst_statistics(lst, NODATA_VALUE)
+    # Reuse the scene mean/std instead of recomputing the statistics
+    # (the NDVI classes are no longer needed once counted)
+    thermal_zones = classify_lst_thermal_zones(
+        lst, lst_stats["mean"], lst_stats["std"],
+        nodata_value=NODATA_VALUE, out=class_buffer,
+    )
+    thermal_zone_percentages = get_thermal_zone_percentages(thermal_zones)
+    step_times["lst"] += time.time() - step_start
+    logger.info(f"[{job_id}] LST calculated in {step_times['lst']:.3f}s. Mean: {lst_stats['mean']:.1f}°C")
+    
+    step_start = time.time()
+    land_cover_stats = get_land_cover_statistics(land_cover)
+    step_times["land_cover"] += time.time() - step_start
+    logger.info(f"[{job_id}] Land cover classified in {step_times['land_cover']:.3f}s")
+    
+    for step in ("load_bands", "ndvi", "lst", "land_cover"):
+        step_times[step] = round(step_times[step], 3)
+    
+    # ========== Step 6: Calculate UHI ==========
+    step_start = time.time()
+    logger.info(f"[{job_id}] Step 6: Analyzing Urban Heat Island...")
+    
+    # The scene statistics from Step 4 stand in for the overall
+    # statistics, saving another pass over the LST raster
+    uhi_result = analyze_uhi(
+        lst=lst,
+        land_cover=land_cover,
+        nodata_value=NODATA_VALUE,
+        lst_stats=lst_stats,
+    )
+    
+    step_times["uhi"] = round(time.time() - step_start, 3)
+    logger.info(f"[{job_id}] UHI analyzed in {step_times['uhi']}s. Intensity: {uhi_result['uhi_intensity']}°C")
+    
+    # ========== Step 7: Generate Insights ==========
+    step_start = time.time()
+    logger.info(f"[{job_id}] Step 7: Generating insights and recommendations...")
+    
+    # Prepare stats for insights
+    insights_result = generate_insights(
+        uhi_result=uhi_result,
+        land_cover_stats=land_cover_stats,
+        ndvi_stats=ndvi_stats,
+        lst_stats=lst_stats,
+    )
+    
+    step_times["insights"] = round(time.time() - step_start, 3)
+    logger.info(f"[{job_id}] Insights generated in {step_times['insights']}s")
+    
+    # ========== Step 8: Generate Heatmap Data ==========
+    step_start = time.time()
+    logger.info(f"[{job_id}] Step 8: Generating heatmap data...")
+    
+    heatmap = gen_heatmap(
+        lst=lst,
+        transform=metadata["transform"],
+        source_crs=metadata["crs"],
+        config=HEATMAP_CONFIG,
+    )
+    # Statistics of the sampled points; stratified sampling over-represents
+    # the temperature extremes, the scene's own are in lst.statistics
+    heatmap_stats = get_heatmap_statistics(heatmap)
+    
+    step_times["heatmap"] = round(time.time() - step_start, 3)
+    logger.info(f"[{job_id}] Heatmap generated with {heatmap.temp.size} points in {step_times['heatmap']}s")
+    
+    # ========== Prepare Response ==========
+    # Remove numpy arrays from UHI result for JSON serialization
+    uhi_response = {k: v for k, v in uhi_result.items() 
+                  if not isinstance(v, np.ndarray)}
+    
+    return {
+        "step_times": step_times,
+        
+        # Image metadata
+        "metadata": {
+            "width": metadata["width"],
+            "height": metadata["height"],
+            "crs": metadata["crs"],
+            "bounds": {
+                "left": metadata["bounds"].left,
+                "bottom": metadata["bounds"].bottom,
+                "right": metadata["bounds"].right,
+                "top": metadata["bounds"].top,
+            },
+        },
+        
+        # LST results
+        "lst": {
+            "statistics": lst_stats,
+            "thermal_zone_percentages": thermal_zone_percentages,
+            "unit": "Celsius",
+        },
+        
+        # NDVI results
+        "ndvi": {
+            "statistics": ndvi_stats,
+            "classification_percentages": ndvi_percentages,
+        },
+        
+        # Land cover results
+        "land_cover": land_cover_stats,
+        
+        # UHI results
+        "uhi": uhi_response,
+        
+        # Insights and recommendations
+        "insights": insights_result,
+        
+        # Heatmap data for visualization
+        "heatmap": {
+            # Parallel lat/lon/temp arrays, one entry per point
+            "points": heatmap.to_columns(),
+            "point_count": heatmap.temp.size,
+            "statistics": heatmap_stats,
+            "config": {
+                "max_points": HEATMAP_CONFIG.max_points,
+                "sample_step": HEATMAP_CONFIG.sample_step,
+                "sampling": HEATMAP_CONFIG.sampling,
+            },
+        },
+    }
+
+
+@app.post("/api/analyze", response_class=APIResponse)
 async def analyze_landsat_imagery(
     band_2: UploadFile = File(..., description="Band 2 (Blue) - .tif file"),
     band_3: UploadFile = File(..., description="Band 3 (Green) - .tif file"),
@@ -235,213 +773,46 @@ async def analyze_landsat_imagery(
             step_start = time.time()
             logger.info(f"[{job_id}] Step 1: Saving uploaded files...")
             
-            saved_files = {}
-            for band_name, file in band_files.items():
-                file_path = os.path.join(temp_dir, f"{band_name}.tif")
-                content = await file.read()
-                with open(file_path, "wb") as f:
-                    f.write(content)
-                saved_files[band_name] = file_path
-                await file.seek(0)
+            saved_files = {
+                band_name: os.path.join(temp_dir, f"{band_name}.tif")
+                for band_name in band_files
+            }
+            # The bands are copied concurrently in the thread pool, off
+            # the event loop
+            await asyncio.gather(*(
+                run_in_threadpool(save_upload, file, saved_files[band_name])
+                for band_name, file in band_files.items()
+            ))
             
             step_times["file_upload"] = round(time.time() - step_start, 3)
             logger.info(f"[{job_id}] Files saved in {step_times['file_upload']}s")
             
-            # ========== Step 2: Load band data ==========
-            step_start = time.time()
-            logger.info(f"[{job_id}] Step 2: Loading band data with rasterio...")
-            
-            bands = {}
-            metadata = None
-            
-            for band_name, file_path in saved_files.items():
-                data, meta = load_band_as_array(file_path)
-                bands[band_name] = data
-                if metadata is None:
-                    metadata = meta
-            
-            step_times["load_bands"] = round(time.time() - step_start, 3)
-            logger.info(f"[{job_id}] Bands loaded in {step_times['load_bands']}s. Shape: {bands['B10'].shape}")
-            
-            # ========== Step 3: Calculate NDVI ==========
-            step_start = time.time()
-            logger.info(f"[{job_id}] Step 3: Calculating NDVI...")
-            
-            ndvi = calculate_ndvi(
-                nir=bands["B5"],
-                red=bands["B4"],
-                nodata_value=NODATA_VALUE
-            )
-            ndvi_stats = get_ndvi_statistics(ndvi, NODATA_VALUE)
-            ndvi_classified = classify_ndvi(ndvi, NODATA_VALUE)
-            ndvi_percentages = get_classification_percentages(ndvi_classified)
-            
-            step_times["ndvi"] = round(time.time() - step_start, 3)
-            logger.info(f"[{job_id}] NDVI calculated in {step_times['ndvi']}s. Mean: {ndvi_stats['mean']:.3f}")
-            
-            # ========== Step 4: Calculate LST ==========
-            step_start = time.time()
-            logger.info(f"[{job_id}] Step 4: Calculating LST...")
-            
-            # DN to Radiance
-            radiance = dn_to_radiance(
-                bands["B10"],
-                ml=ml_coefficient,
-                al=al_coefficient,
-                nodata_value=NODATA_VALUE
-            )
-            
-            # Radiance to Brightness Temperature
-            brightness_temp = radiance_to_brightness_temperature(
-                radiance,
-                nodata_value=NODATA_VALUE
-            )
-            
-            # Estimate Emissivity from NDVI
-            emissivity = estimate_emissivity_from_ndvi(
-                ndvi,
-                nodata_value=NODATA_VALUE
-            )
-            
-            # Calculate LST
-            lst = calculate_lst(
-                brightness_temp,
-                emissivity,
-                nodata_value=NODATA_VALUE,
-                output_celsius=True
-            )
-            lst_stats = get_lst_statistics(lst, NODATA_VALUE)
-            thermal_zones = classify_lst_thermal_zones(lst, nodata_value=NODATA_VALUE)
-            
-            step_times["lst"] = round(time.time() - step_start, 3)
-            logger.info(f"[{job_id}] LST calculated in {step_times['lst']}s. Mean: {lst_stats['mean']:.1f}°C")
-            
-            # ========== Step 5: Classify Land Cover ==========
-            step_start = time.time()
-            logger.info(f"[{job_id}] Step 5: Classifying land cover...")
-            
-            land_cover, indices = classify_land_cover(
-                band_2=bands["B2"],
-                band_3=bands["B3"],
-                band_4=bands["B4"],
-                band_5=bands["B5"],
-                band_6=bands["B6"],
-                band_7=bands["B7"],
-                nodata_value=NODATA_VALUE,
-                ndvi=ndvi
-            )
-            land_cover_stats = get_land_cover_statistics(land_cover)
-            
-            step_times["land_cover"] = round(time.time() - step_start, 3)
-            logger.info(f"[{job_id}] Land cover classified in {step_times['land_cover']}s")
-            
-            # ========== Step 6: Calculate UHI ==========
-            step_start = time.time()
-            logger.info(f"[{job_id}] Step 6: Analyzing Urban Heat Island...")
-            
-            uhi_result = analyze_uhi(
-                lst=lst,
-                land_cover=land_cover,
-                nodata_value=NODATA_VALUE,
-            )
-            
-            # Create UHI anomaly map
-            uhi_map = create_uhi_map(lst, land_cover, NODATA_VALUE)
-            
-            step_times["uhi"] = round(time.time() - step_start, 3)
-            logger.info(f"[{job_id}] UHI analyzed in {step_times['uhi']}s. Intensity: {uhi_result['uhi_intensity']}°C")
-            
-            # ========== Step 7: Generate Insights ==========
-            step_start = time.time()
-            logger.info(f"[{job_id}] Step 7: Generating insights and recommendations...")
-            
-            # Prepare stats for insights
-            insights_result = generate_insights(
-                uhi_result=uhi_result,
-                land_cover_stats=land_cover_stats,
-                ndvi_stats=ndvi_stats,
-                lst_stats=lst_stats,
-            )
-            
-            step_times["insights"] = round(time.time() - step_start, 3)
-            logger.info(f"[{job_id}] Insights generated in {step_times['insights']}s")
-            
-            # ========== Step 8: Generate Heatmap Data ==========
-            step_start = time.time()
-            logger.info(f"[{job_id}] Step 8: Generating heatmap data...")
-            
-            heatmap_data = gen_heatmap(
-                lst=lst,
-                transform=metadata["transform"],
-                source_crs=metadata["crs"],
-                config=HEATMAP_CONFIG,
+            # Reject mismatched bands from their headers alone, before
+            # any raster data is read or a worker is occupied
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, validate_band_headers, saved_files)
+            
+            # ========== Steps 2-8: Analysis in a worker process ==========
+            # Only the file paths cross the process boundary; the rasters
+            # are read and processed entirely inside the worker
+            analysis = await loop.run_in_executor(
+                get_process_pool(), run_pipeline,
+                saved_files, ml_coefficient, al_coefficient, job_id,
             )
-            heatmap_stats = get_heatmap_statistics(heatmap_data)
+            step_times.update(analysis.pop("step_times"))
             
-            step_times["heatmap"] = round(time.time() - step_start, 3)
-            logger.info(f"[{job_id}] Heatmap generated with {len(heatmap_data)} points in {step_times['heatmap']}s")
-            
-            # ========== Prepare Response ==========
             total_time = round(time.time() - start_time, 3)
             logger.info(f"[{job_id}] Analysis complete in {total_time}s")
             
-            # Remove numpy arrays from UHI result for JSON serialization
-            uhi_response = {k: v for k, v in uhi_result.items() 
-                          if not isinstance(v, np.ndarray)}
-            
             response_data = {
                 "job_id": job_id,
                 "status": "completed",
                 "execution_time_seconds": total_time,
                 "step_times": step_times,
-                
-                # Image metadata
-                "metadata": {
-                    "width": metadata["width"],
-                    "height": metadata["height"],
-                    "crs": metadata["crs"],
-                    "bounds": {
-                        "left": metadata["bounds"].left,
-                        "bottom": metadata["bounds"].bottom,
-                        "right": metadata["bounds"].right,
-                        "top": metadata["bounds"].top,
-                    },
-                },
-                
-                # LST results
-                "lst": {
-                    "statistics": lst_stats,
-                    "unit": "Celsius",
-                },
-                
-                # NDVI results
-                "ndvi": {
-                    "statistics": ndvi_stats,
-                    "classification_percentages": ndvi_percentages,
-                },
-                
-                # Land cover results
-                "land_cover": land_cover_stats,
-                
-                # UHI results
-                "uhi": uhi_response,
-                
-                # Insights and recommendations
-                "insights": insights_result,
-                
-                # Heatmap data for visualization
-                "heatmap": {
-                    "points": heatmap_data,
-                    "point_count": len(heatmap_data),
-                    "statistics": heatmap_stats,
-                    "config": {
-                        "max_points": HEATMAP_CONFIG.max_points,
-                        "sample_step": HEATMAP_CONFIG.sample_step,
-                    },
-                },
+                **analysis,
             }
             
-            return JSONResponse(content=response_data)
+            return APIResponse(content=response_data)
             
     except rasterio.errors.RasterioIOError as e:
         logger.error(f"[{job_id}] Rasterio error: {str(e)}")
@@ -455,6 +826,19 @@ async def analyze_landsat_imagery(
             }
         )
     
+    except BrokenProcessPool as e:
+        # A worker died (e.g. out of memory); replace the pool for later requests
+        logger.error(f"[{job_id}] Analysis worker failed: {str(e)}")
+        shutdown_process_pool()
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "Processing failed",
+                "message": "The analysis worker process terminated unexpectedly",
+                "job_id": job_id,
+            }
+        )
+    
     except ValueError as e:
         logger.error(f"[{job_id}] Validation error: {str(e)}")
         raise HTTPException(
@@ -492,15 +876,13 @@ async def get_job_status(job_id: str):
     }
 
 
-@app.get("/api/legend")
-async def get_legend():
-    """
-    Get color legends for map visualizations.
-    """
+@lru_cache(maxsize=1)
+def _legend_body() -> bytes:
+    """Serialized legend payload; it never changes, so it is built once."""
     from calculations.land_cover import export_classification_legend, LAND_COVER_COLORS
     from calculations.uhi import UHI_CATEGORY_NAMES
     
-    return {
+    return APIResponse(content={
         "land_cover": export_classification_legend(),
         "uhi_categories": {
             name: {
@@ -517,7 +899,22 @@ async def get_legend():
             "hot": {"value": 5, "description": "mean + 1σ to mean + 2σ"},
             "very_hot": {"value": 6, "description": "> mean + 2σ"},
         },
-    }
+    }).body
+
+
+@app.get("/api/legend")
+async def get_legend():
+    """
+    Get color legends for map visualizations.
+    
+    The legend is static, so the serialized body is reused and clients may
+    cache it for a day.
+    """
+    return Response(
+        content=_legend_body(),
+        media_type="application/json",
+        headers={"Cache-Control": LEGEND_CACHE_CONTROL},
+    )
 
 
 if __name__ == "__main__":
@@ -45,6 +45,7 @@ def test_legend_endpoint(client):
     """Test legend endpoint."""
     response = client.get("/api/legend")
     assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=86400"
     
     data = response.json()
     assert "land_cover" in data
@@ -94,5 +95,31 @@ def test_job_status_endpoint(client):
     assert "status" in data
 
 
+def test_validate_band_headers(tmp_path):
+    """Test that bands on different grids are rejected from their headers."""
+    import numpy as np
+    import rasterio
+    from rasterio.transform import Affine
+    from main import validate_band_headers
+    
+    def write_band(name, shape, crs="EPSG:32633"):
+        path = str(tmp_path / f"{name}.tif")
+        with rasterio.open(
+            path, "w", driver="GTiff", width=shape[1], height=shape[0], count=1,
+            dtype="uint16", crs=crs, transform=Affine(30, 0, 500000, 0, -30, 4000000),
+        ) as dst:
+            dst.write(np.ones((1, *shape), dtype=np.uint16))
+        return path
+    
+    files = {"B4": write_band("B4", (8, 8)), "B5": write_band("B5", (8, 8))}
+    validate_band_headers(files)
+    
+    with pytest.raises(ValueError, match="shape"):
+        validate_band_headers({**files, "B10": write_band("B10", (8, 4))})
+    
+    with pytest.raises(ValueError, match="CRS"):
+        validate_band_headers({**files, "B10": write_band("B10", (8, 8), "EPSG:32634")})
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,22 +5,78 @@ This script verifies that all calculation modules work correctly
 with synthetic test data.
 
 Run with: pytest tests/test_calculations.py -v
+(add --log-cli-level=INFO to see the progress output)
 Or directly: python tests/test_calculations.py
 """
 
 import numpy as np
 import sys
-import os
+import logging
+from pathlib import Path
 
 # Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rasterio.io import MemoryFile
+from rasterio.transform import Affine
+
+from calculations import lst as lst_module, ndvi as ndvi_module, uhi as uhi_module
+from calculations import _common as common_module
+from utils import heatmap as heatmap_module
+from calculations.ndvi import (
+    calculate_ndvi,
+    calculate_ndvi_streaming,
+    classify_ndvi,
+    get_ndvi_statistics,
+    STREAMING_PROFILE,
+)
+from calculations.lst import (
+    dn_to_radiance,
+    radiance_to_brightness_temperature,
+    estimate_emissivity_from_ndvi,
+    calculate_lst,
+    calculate_lst_from_band10,
+    calculate_ndvi_lst,
+    get_lst_statistics,
+    LSTWorkspace,
+)
+from calculations.land_cover import (
+    classify_land_cover,
+    calculate_all_indices,
+    calculate_ndbi,
+    calculate_urban_index,
+    get_land_cover_statistics,
+    LandCoverClass,
+)
+from calculations.uhi import analyze_uhi, count_hotspot_clusters, UHICategory
+from calculations import warmup_kernels
+from analysis.insights import (
+    generate_insights,
+    generate_insights_batch,
+    classify_uhi_severity,
+    classify_uhi_severity_batch,
+    UHISeverity,
+)
+from utils.heatmap import (
+    generate_heatmap_from_array,
+    HeatmapConfig,
+    HeatmapArrays,
+    get_heatmap_statistics,
+    filter_heatmap_by_bounds,
+    filter_heatmap_by_temperature,
+)
+
+# Land cover class codes as int8 scalars, matching the class rasters
+_CLASS_CODES = {cls.name: np.int8(cls) for cls in LandCoverClass}
+
+# Test progress is logged at INFO: formatted only when shown (pytest's
+# log capture, or the run_all_tests driver)
+log = logging.getLogger(__name__)
 
 
 def test_ndvi_calculation():
     """Test NDVI calculation with known values."""
-    print("\n📊 Testing NDVI Calculation...")
-    
-    from calculations.ndvi import calculate_ndvi, classify_ndvi, get_ndvi_statistics
+    log.info("\n📊 Testing NDVI Calculation...")
     
     # Create test data
     # NIR = 0.5, Red = 0.1 -> NDVI = (0.5 - 0.1) / (0.5 + 0.1) = 0.667
@@ -35,37 +91,75 @@ def test_ndvi_calculation():
     # Calculate NDVI
     ndvi = calculate_ndvi(nir, red, nodata_value=-9999.0)
     
-    # Expected: (0.5-0.1)/(0.5+0.1) = 0.667 for first pixel
-    expected_first = (0.5 - 0.1) / (0.5 + 0.1)
-    assert abs(ndvi[0, 0] - expected_first) < 0.001, f"Expected {expected_first}, got {ndvi[0, 0]}"
+    # Expected: (0.5-0.1)/(0.5+0.1) = 0.667 for the first pixel, and the
+    # same formula for every other (all valid) pixel
+    expected = (nir - red) / (nir + red)
+    np.testing.assert_allclose(ndvi, expected, atol=1e-3)
+    
+    # The fused Numba kernel and the NumPy path agree, including invalid pixels
+    bad_nir = nir.copy()
+    bad_nir[0, 1:] = [-9999.0, np.nan]
+    bad_nir[2, 2] = -red[2, 2]
+    has_numba = ndvi_module.HAS_NUMBA
+    try:
+        results = []
+        for use_numba in {False, has_numba}:
+            ndvi_module.HAS_NUMBA = use_numba
+            results.append(calculate_ndvi(bad_nir, red))
+    finally:
+        ndvi_module.HAS_NUMBA = has_numba
+    assert all(np.array_equal(r, results[0]) for r in results)
+    assert np.all(results[0][[0, 0, 2], [1, 2, 2]] == -9999.0)
+    
+    # Results can be written into a caller-supplied buffer
+    buffer = np.empty(nir.shape, dtype=np.float32)
+    assert calculate_ndvi(bad_nir, red, out=buffer) is buffer
+    assert np.array_equal(buffer, results[0])
+    
+    # Raw integer DNs give the same result as the same values as floats
+    dn_nir = np.array([[400, 0], [65535, 120]], dtype=np.uint16)
+    dn_red = np.array([[100, 0], [1, 120]], dtype=np.uint16)
+    assert np.array_equal(
+        calculate_ndvi(dn_nir, dn_red),
+        calculate_ndvi(dn_nir.astype(np.float32), dn_red.astype(np.float32)),
+    )
+    
+    # Streaming block-by-block NDVI matches the in-memory result
+    profile = {**STREAMING_PROFILE, "width": 3, "height": 3,
+               "blockxsize": 16, "blockysize": 16}
+    with MemoryFile() as nir_file, MemoryFile() as red_file, MemoryFile() as out_file:
+        for memfile, band in ((nir_file, nir), (red_file, red)):
+            with memfile.open(**profile) as dst:
+                dst.write(band.astype(np.float32), 1)
+        with nir_file.open() as nir_ds, red_file.open() as red_ds, \
+                out_file.open(**profile) as out_ds:
+            calculate_ndvi_streaming(nir_ds, red_ds, out_ds)
+        with out_file.open() as out_ds:
+            assert np.array_equal(out_ds.read(1), calculate_ndvi(nir, red))
     
     # Test classification
     classified = classify_ndvi(ndvi)
     assert classified.shape == ndvi.shape
     
+    # Boundaries belong to the upper category; nodata and NaN map to -1
+    edges = np.array([-0.1, 0.0, 0.2, 0.4, -9999.0, np.nan], dtype=np.float32)
+    assert classify_ndvi(edges).tolist() == [0, 1, 2, 3, -1, -1]
+    
     # Test statistics
     stats = get_ndvi_statistics(ndvi)
     assert stats["min"] is not None
     assert stats["max"] is not None
     assert -1 <= stats["min"] <= stats["max"] <= 1
     
-    print(f"  ✅ NDVI range: {stats['min']:.3f} to {stats['max']:.3f}")
-    print(f"  ✅ NDVI mean: {stats['mean']:.3f}")
-    print("  ✅ NDVI calculation passed!")
+    log.info("  ✅ NDVI range: %.3f to %.3f", stats['min'], stats['max'])
+    log.info("  ✅ NDVI mean: %.3f", stats['mean'])
+    log.info("  ✅ NDVI calculation passed!")
     return True
 
 
 def test_lst_calculation():
     """Test LST calculation pipeline."""
-    print("\n🌡️ Testing LST Calculation...")
-    
-    from calculations.lst import (
-        dn_to_radiance,
-        radiance_to_brightness_temperature,
-        estimate_emissivity_from_ndvi,
-        calculate_lst,
-        get_lst_statistics
-    )
+    log.info("\n🌡️ Testing LST Calculation...")
     
     # Create test thermal band data (DN values typical for Landsat)
     # DN values around 20000-30000 are typical for Band 10
@@ -81,19 +175,19 @@ def test_lst_calculation():
     # Step 1: DN to Radiance
     radiance = dn_to_radiance(band_10, ml=3.342e-4, al=0.1)
     assert np.all(radiance > 0), "Radiance should be positive"
-    print(f"  ✅ Radiance range: {np.min(radiance):.2f} to {np.max(radiance):.2f}")
+    log.info("  ✅ Radiance range: %.2f to %.2f", np.min(radiance), np.max(radiance))
     
     # Step 2: Radiance to Brightness Temperature
     bt = radiance_to_brightness_temperature(radiance)
     assert np.all(bt > 200), "Brightness temp should be > 200K"
     assert np.all(bt < 400), "Brightness temp should be < 400K"
-    print(f"  ✅ Brightness Temp range: {np.min(bt):.1f}K to {np.max(bt):.1f}K")
+    log.info("  ✅ Brightness Temp range: %.1fK to %.1fK", np.min(bt), np.max(bt))
     
     # Step 3: Estimate Emissivity
     emissivity = estimate_emissivity_from_ndvi(ndvi)
     assert np.all(emissivity >= 0.95), "Emissivity should be >= 0.95"
     assert np.all(emissivity <= 1.0), "Emissivity should be <= 1.0"
-    print(f"  ✅ Emissivity range: {np.min(emissivity):.4f} to {np.max(emissivity):.4f}")
+    log.info("  ✅ Emissivity range: %.4f to %.4f", np.min(emissivity), np.max(emissivity))
     
     # Step 4: Calculate LST
     lst = calculate_lst(bt, emissivity, output_celsius=True)
@@ -104,21 +198,106 @@ def test_lst_calculation():
     assert stats["min"] > -50, "LST should be > -50°C"
     assert stats["max"] < 80, "LST should be < 80°C"
     
-    print(f"  ✅ LST range: {stats['min']:.1f}°C to {stats['max']:.1f}°C")
-    print(f"  ✅ LST mean: {stats['mean']:.1f}°C")
-    print("  ✅ LST calculation passed!")
+    log.info("  ✅ LST range: %.1f°C to %.1f°C", stats['min'], stats['max'])
+    log.info("  ✅ LST mean: %.1f°C", stats['mean'])
+    log.info("  ✅ LST calculation passed!")
+    return True
+
+
+def test_lst_from_band10():
+    """Test the fused LST pipeline against the step-by-step functions."""
+    log.info("\n🔗 Testing Fused LST Pipeline...")
+    
+    np.random.seed(7)
+    band_10 = np.random.uniform(20000, 35000, (16, 16))
+    ndvi = np.random.uniform(-0.2, 0.8, (16, 16))
+    
+    # Invalid pixels: nodata, NaN and non-positive DN
+    band_10[0, :4] = [-9999.0, np.nan, 0.0, -5.0]
+    ndvi[1, :2] = [-9999.0, np.nan]
+    
+    # Scene margins: a fully empty row and ragged nodata row edges
+    band_10[2], ndvi[2] = -9999.0, -9999.0
+    band_10[3:6, :5], ndvi[3:6, :5] = 0.0, -9999.0
+    band_10[4:8, -3:], ndvi[4:8, -3:] = -9999.0, np.nan
+    
+    rad = dn_to_radiance(band_10, ml=3.342e-4, al=0.1)
+    bt = radiance_to_brightness_temperature(rad)
+    emissivity = estimate_emissivity_from_ndvi(ndvi)
+    expected = calculate_lst(bt, emissivity, output_celsius=True)
+    
+    has_numba = lst_module.HAS_NUMBA
+    try:
+        for use_numba in {False, has_numba}:
+            lst_module.HAS_NUMBA = use_numba
+            lst, extra = calculate_lst_from_band10(band_10, ndvi, ml=3.342e-4, al=0.1)
+            
+            assert lst.dtype == np.float32
+            assert np.array_equal(lst == -9999.0, expected == -9999.0)
+            assert np.allclose(lst, expected, atol=1e-3)
+            assert np.allclose(extra["emissivity"], emissivity, atol=1e-6)
+            log.info("  ✅ Matches step-by-step pipeline (numba=%s)", use_numba)
+            
+            # Results land in (and reuse) the workspace buffers
+            workspace = LSTWorkspace.for_shape(band_10.shape)
+            for _ in range(2):
+                ws_lst, _ = calculate_lst_from_band10(
+                    band_10, ndvi, ml=3.342e-4, al=0.1, workspace=workspace
+                )
+                assert ws_lst is workspace.lst
+                assert np.array_equal(ws_lst, lst)
+            
+            # NDVI and LST straight from the bands match the two-step route
+            nir = np.random.uniform(0.05, 0.6, (16, 16))
+            red = np.random.uniform(0.05, 0.3, (16, 16))
+            nir[0, 4], red[1, 4] = -9999.0, np.nan
+            band_ndvi = calculate_ndvi(nir, red)
+            fused_ndvi, fused_lst = calculate_ndvi_lst(nir, red, band_10, ml=3.342e-4, al=0.1)
+            assert np.array_equal(fused_ndvi, band_ndvi)
+            assert np.array_equal(
+                fused_lst,
+                calculate_lst_from_band10(band_10, band_ndvi, ml=3.342e-4, al=0.1)[0],
+            )
+            
+            # Strided outputs (column windows of larger rasters) get the same values
+            ndvi_window = np.empty((16, 20), dtype=np.float32)[:, 2:18]
+            lst_window = np.empty((16, 20), dtype=np.float32)[:, 2:18]
+            calculate_ndvi_lst(
+                nir, red, band_10, ml=3.342e-4, al=0.1,
+                out_ndvi=ndvi_window, out_lst=lst_window,
+            )
+            assert np.array_equal(ndvi_window, fused_ndvi)
+            assert np.array_equal(lst_window, fused_lst)
+    finally:
+        lst_module.HAS_NUMBA = has_numba
+    
+    assert warmup_kernels() == has_numba
+    
+    # Thermal zones bin by std distance from the mean, -1 for nodata
+    zones = np.empty(lst.shape, dtype=np.int8)
+    assert lst_module.classify_lst_thermal_zones(lst, 30.0, 2.0, out=zones) is zones
+    valid = lst != -9999.0
+    expected_zones = np.digitize(lst, [26.0, 28.0, 29.0, 31.0, 32.0, 34.0])
+    assert np.array_equal(zones[valid], expected_zones[valid])
+    assert np.all(zones[~valid] == -1)
+    percentages = lst_module.get_thermal_zone_percentages(zones)
+    assert list(percentages) == list(lst_module.THERMAL_ZONE_NAMES)
+    assert percentages["comfortable"] == np.mean(expected_zones[valid] == 3) * 100
+    assert abs(sum(percentages.values()) - 100.0) < 1e-9
+    
+    try:
+        calculate_lst_from_band10(band_10, ndvi[:-1])
+        assert False, "Mismatched shapes should raise ValueError"
+    except ValueError:
+        log.info("  ✅ Shape mismatch rejected")
+    
+    log.info("  ✅ Fused LST pipeline passed!")
     return True
 
 
 def test_land_cover_classification():
     """Test land cover classification."""
-    print("\n🏞️ Testing Land Cover Classification...")
-    
-    from calculations.land_cover import (
-        classify_land_cover,
-        get_land_cover_statistics,
-        LandCoverClass
-    )
+    log.info("\n🏞️ Testing Land Cover Classification...")
     
     # Create synthetic band data
     # Simulate water (high green, low NIR)
@@ -132,12 +311,12 @@ def test_land_cover_classification():
     # Vegetation (bottom-left quadrant)
     # Bare soil (bottom-right quadrant)
     
-    band_2 = np.random.uniform(0.1, 0.3, size).astype(np.float64)
-    band_3 = np.random.uniform(0.1, 0.3, size).astype(np.float64)
-    band_4 = np.random.uniform(0.1, 0.3, size).astype(np.float64)
-    band_5 = np.random.uniform(0.1, 0.5, size).astype(np.float64)
-    band_6 = np.random.uniform(0.1, 0.3, size).astype(np.float64)
-    band_7 = np.random.uniform(0.1, 0.3, size).astype(np.float64)
+    # One float32 (band, row, col) buffer, as read from the band stack;
+    # the bands are views into it
+    rng = np.random.default_rng(42)
+    bands = rng.uniform(0.1, 0.3, (6, *size)).astype(np.float32)
+    bands[3] = rng.uniform(0.1, 0.5, size)
+    band_2, band_3, band_4, band_5, band_6, band_7 = bands
     
     # Set up water pixels (high green, low NIR -> NDWI > 0)
     band_3[:5, :5] = 0.4  # High green
@@ -160,43 +339,64 @@ def test_land_cover_classification():
     stats = get_land_cover_statistics(classification)
     
     assert stats["total_valid_pixels"] > 0
-    print(f"  ✅ Total pixels classified: {stats['total_valid_pixels']}")
+    log.info("  ✅ Total pixels classified: %s", stats['total_valid_pixels'])
     
     for class_name, pct in stats["class_percentages"].items():
-        print(f"  ✅ {class_name}: {pct:.1f}%")
+        log.info("  ✅ %s: %.1f%%", class_name, pct)
     
     # Verify we have multiple classes
-    unique_classes = np.unique(classification)
-    assert len(unique_classes) >= 2, "Should have at least 2 land cover classes"
-    
-    print("  ✅ Land cover classification passed!")
+    class_counts = np.bincount(classification.view(np.uint8).ravel(), minlength=len(LandCoverClass))
+    assert np.count_nonzero(class_counts) >= 2, "Should have at least 2 land cover classes"
+    
+    # Index calculators accept a shared pre-computed validity mask
+    band_5[0, 0] = -9999.0
+    band_6[1, 1] = np.nan
+    valid_mask = (
+        np.isfinite(band_5) & (band_5 != -9999.0) &
+        np.isfinite(band_6) & (band_6 != -9999.0)
+    )
+    for func in (calculate_ndbi, calculate_urban_index):
+        assert np.array_equal(
+            func(band_6, band_5, valid_mask=valid_mask), func(band_6, band_5)
+        )
+    log.info("  ✅ Shared validity mask gives identical indices")
+    
+    # Normalized differences stay within [-1, 1], with or without negative
+    # (atmospherically over-corrected) reflectances
+    band_3[2, 2] = -0.05
+    indices = calculate_all_indices(band_2, band_3, band_4, band_5, band_6, band_7)
+    for name in ("ndvi", "ndwi", "ndbi", "mndwi"):
+        values = indices[name][indices[name] != -9999.0]
+        assert np.all((values >= -1.0) & (values <= 1.0)), f"{name} out of range"
+    log.info("  ✅ Normalized difference indices bounded to [-1, 1]")
+    
+    log.info("  ✅ Land cover classification passed!")
     return True
 
 
 def test_uhi_analysis():
     """Test UHI analysis."""
-    print("\n🔥 Testing UHI Analysis...")
-    
-    from calculations.uhi import analyze_uhi, UHICategory
-    from calculations.land_cover import LandCoverClass
+    log.info("\n🔥 Testing UHI Analysis...")
     
     # Create synthetic LST data (temperatures in Celsius)
     size = (20, 20)
     
     # Base temperature
-    lst = np.random.uniform(30, 35, size).astype(np.float64)
+    rng = np.random.default_rng(42)
+    lst = rng.uniform(30, 35, size).astype(np.float32)
     
     # Urban areas are hotter
-    lst[:10, :10] = np.random.uniform(38, 45, (10, 10))
+    lst[:10, :10] = rng.uniform(38, 45, (10, 10))
     
     # Vegetation areas are cooler
-    lst[10:, 10:] = np.random.uniform(28, 32, (10, 10))
+    lst[10:, 10:] = rng.uniform(28, 32, (10, 10))
     
     # Create land cover classification
-    land_cover = np.full(size, LandCoverClass.BARE_SOIL, dtype=np.int8)
-    land_cover[:10, :10] = LandCoverClass.URBAN
-    land_cover[10:, 10:] = LandCoverClass.VEGETATION
-    land_cover[:5, 15:] = LandCoverClass.WATER
+    land_cover = np.empty(size, dtype=np.int8)
+    land_cover[:] = _CLASS_CODES["BARE_SOIL"]
+    land_cover[:10, :10] = _CLASS_CODES["URBAN"]
+    land_cover[10:, 10:] = _CLASS_CODES["VEGETATION"]
+    land_cover[:5, 15:] = _CLASS_CODES["WATER"]
     
     # Analyze UHI
     result = analyze_uhi(lst, land_cover)
@@ -206,26 +406,63 @@ def test_uhi_analysis():
     assert result["urban_mean_temp"] is not None
     assert result["rural_mean_temp"] is not None
     
-    print(f"  ✅ UHI Intensity: {result['uhi_intensity']:.2f}°C")
-    print(f"  ✅ Urban Mean Temp: {result['urban_mean_temp']:.2f}°C")
-    print(f"  ✅ Rural Mean Temp: {result['rural_mean_temp']:.2f}°C")
-    print(f"  ✅ UHI Category: {result['uhi_category']}")
-    print(f"  ✅ Hotspot Count: {result['hotspot_count']}")
-    print(f"  ✅ Affected Area: {result['affected_area_km2']:.4f} km²")
+    log.info("  ✅ UHI Intensity: %.2f°C", result['uhi_intensity'])
+    log.info("  ✅ Urban Mean Temp: %.2f°C", result['urban_mean_temp'])
+    log.info("  ✅ Rural Mean Temp: %.2f°C", result['rural_mean_temp'])
+    log.info("  ✅ UHI Category: %s", result['uhi_category'])
+    log.info("  ✅ Hotspot Count: %s", result['hotspot_count'])
+    log.info("  ✅ Affected Area: %.4f km²", result['affected_area_km2'])
     
     # Urban should be hotter than rural
     assert result["urban_mean_temp"] > result["rural_mean_temp"], \
         "Urban areas should be hotter than rural"
     
-    print("  ✅ UHI analysis passed!")
+    # Pre-computed scene statistics replace the overall-statistics pass
+    scene_stats = get_lst_statistics(lst)
+    reused = analyze_uhi(lst, land_cover, lst_stats=scene_stats)
+    assert reused["overall_stats"] == {
+        key: scene_stats[key] for key in ("min", "max", "mean", "std")
+    }
+    assert reused["uhi_intensity"] == result["uhi_intensity"]
+    
+    # Single-pass zone statistics agree with and without Numba
+    lst[0, :3] = [-9999.0, np.nan, np.inf]
+    has_numba = common_module.HAS_NUMBA
+    try:
+        zone_stats = []
+        for use_numba in {False, has_numba}:
+            common_module.HAS_NUMBA = use_numba
+            zone_stats.append(uhi_module.calculate_zone_temperature(
+                lst, land_cover == _CLASS_CODES["URBAN"]
+            ))
+    finally:
+        common_module.HAS_NUMBA = has_numba
+    expected = lst[:10, :10][np.isfinite(lst[:10, :10]) & (lst[:10, :10] != -9999.0)]
+    for stats in zone_stats:
+        assert stats["pixel_count"] == expected.size == 97
+        assert np.isclose(stats["mean"], expected.mean())
+        assert np.isclose(stats["std"], expected.std())
+    log.info("  ✅ Zone statistics skip nodata and non-finite pixels")
+    
+    # Clusters are 4-connected: the diagonal pair stays separate
+    mask = np.zeros((6, 8), dtype=bool)
+    mask[0:3, 0:4] = True   # 12-pixel block
+    mask[4, 6] = True
+    mask[5, 7] = True
+    count, labels = count_hotspot_clusters(mask, min_cluster_size=1, return_labels=True)
+    assert count == 3 and labels.dtype == np.int32
+    assert len(np.unique(labels[0:3, 0:4])) == 1 and labels[4, 6] != labels[5, 7]
+    assert count_hotspot_clusters(mask, min_cluster_size=10) == (1, None)
+    assert "cluster_labels" not in result
+    log.info("  ✅ Hotspot clusters labeled")
+    
+    log.info("  ✅ UHI analysis passed!")
     return True
 
 
 def test_insights_generation():
     """Test insights and recommendations generation."""
-    print("\n💡 Testing Insights Generation...")
-    
-    from analysis.insights import generate_insights, UHISeverity
+    log.info("\n💡 Testing Insights Generation...")
     
     # Create mock analysis results
     uhi_result = {
@@ -275,29 +512,57 @@ def test_insights_generation():
     assert len(insights["explanation"]) > 100, "Explanation should be substantial"
     assert len(insights["recommendations"]) >= 3, "Should have at least 3 recommendations"
     
-    print(f"  ✅ Severity: {insights['severity']}")
-    print(f"  ✅ Recommendation count: {insights['recommendation_count']}")
+    log.info("  ✅ Severity: %s", insights['severity'])
+    log.info("  ✅ Recommendation count: %s", insights['recommendation_count'])
     
     for rec in insights["recommendations"][:3]:
-        print(f"  ✅ [{rec['priority']}] {rec['title']}")
+        log.info("  ✅ [%s] %s", rec['priority'], rec['title'])
+    
+    # Batch generation should match per-record generation
+    mild_uhi = dict(uhi_result, uhi_intensity=2.0)
+    batch = generate_insights_batch([
+        (uhi_result, land_cover_stats, ndvi_stats, lst_stats),
+        (mild_uhi, land_cover_stats, ndvi_stats, lst_stats),
+    ])
+    assert batch[0] == insights
+    assert batch[1] == generate_insights(mild_uhi, land_cover_stats, ndvi_stats, lst_stats)
+    assert batch[1]["severity"] == "mild"
+    
+    log.info("  ✅ Insights generation passed!")
+    return True
+
+
+def test_uhi_severity_classification():
+    """Test scalar and batch UHI severity classification agree."""
+    log.info("\n🚦 Testing UHI Severity Classification...")
+    
+    # Include values exactly on each threshold boundary
+    intensities = np.array([-2.0, 0.5, 1.0, 2.9, 3.0, 4.5, 5.0, 6.9, 7.0, 12.0])
+    expected = [
+        UHISeverity.MINIMAL, UHISeverity.MINIMAL,
+        UHISeverity.MILD, UHISeverity.MILD,
+        UHISeverity.MODERATE, UHISeverity.MODERATE,
+        UHISeverity.SEVERE, UHISeverity.SEVERE,
+        UHISeverity.CRITICAL, UHISeverity.CRITICAL,
+    ]
+    
+    scalar = [classify_uhi_severity(float(v)) for v in intensities]
+    assert scalar == expected, f"Expected {expected}, got {scalar}"
+    
+    batch = classify_uhi_severity_batch(intensities)
+    assert batch.tolist() == [int(s) for s in expected]
     
-    print("  ✅ Insights generation passed!")
+    log.info("  ✅ UHI severity classification passed!")
     return True
 
 
 def test_heatmap_generation():
     """Test heatmap data generation."""
-    print("\n🗺️ Testing Heatmap Generation...")
-    
-    from utils.heatmap import (
-        generate_heatmap_from_array,
-        HeatmapConfig,
-        get_heatmap_statistics
-    )
+    log.info("\n🗺️ Testing Heatmap Generation...")
     
     # Create synthetic LST data
     size = (100, 100)
-    lst = np.random.uniform(25, 45, size).astype(np.float64)
+    lst = np.random.default_rng(42).uniform(25, 45, size).astype(np.float32)
     
     # Set some nodata values
     lst[0, :] = -9999.0
@@ -327,18 +592,69 @@ def test_heatmap_generation():
     assert "temp" in point
     
     # Check coordinates are within bounds
-    for p in heatmap:
-        assert bounds[1] <= p["lat"] <= bounds[3], f"Lat {p['lat']} out of bounds"
-        assert bounds[0] <= p["lon"] <= bounds[2], f"Lon {p['lon']} out of bounds"
-        assert p["temp"] != -9999.0, "NoData values should be filtered"
+    points = np.array([(p["lat"], p["lon"], p["temp"]) for p in heatmap], dtype=np.float64)
+    lats, lons, temps = points.T
+    assert np.all((lats >= bounds[1]) & (lats <= bounds[3])), "Lat out of bounds"
+    assert np.all((lons >= bounds[0]) & (lons <= bounds[2])), "Lon out of bounds"
+    assert not np.any(temps == config.nodata_value), "NoData values should be filtered"
+    
+    # Without reprojection the compiled stride kernel gives the NumPy points
+    lst[1, 1:4] = [np.nan, np.inf, 95.0]
+    transform = Affine(0.01, 0.0, 8.0, 0.0, -0.01, 10.0)
+    has_numba = heatmap_module.HAS_NUMBA
+    try:
+        arrays_by_path = []
+        for use_numba in {False, has_numba}:
+            heatmap_module.HAS_NUMBA = use_numba
+            arrays_by_path.append(heatmap_module.generate_heatmap_arrays(
+                lst, transform, None, HeatmapConfig(max_points=300, sample_step=1)
+            ))
+    finally:
+        heatmap_module.HAS_NUMBA = has_numba
+    for arrays in arrays_by_path:
+        assert arrays.temp.size == 300
+        assert all(np.array_equal(a, b) for a, b in zip(arrays, arrays_by_path[0]))
+    
+    # Stratified sampling keeps a small hot pocket that stride sampling thins out
+    lst[40:44, 40:44] = 60.0
+    stratified = generate_heatmap_from_array(
+        lst, bounds, HeatmapConfig(max_points=200, sampling="stratified")
+    )
+    assert len(stratified) == 200
+    assert sum(p["temp"] == 60.0 for p in stratified) == 16
+    assert all(p["temp"] != -9999.0 for p in stratified)
+    try:
+        HeatmapConfig(sampling="stratified", stratify_bins=256)
+        assert False, "More bins than fit in uint8 should raise ValueError"
+    except ValueError:
+        log.info("  ✅ Oversized stratify_bins rejected")
     
     # Get statistics
     stats = get_heatmap_statistics(heatmap)
     
-    print(f"  ✅ Heatmap points: {len(heatmap)}")
-    print(f"  ✅ Temperature range: {stats['min_temp']:.1f}°C to {stats['max_temp']:.1f}°C")
-    print(f"  ✅ Geographic bounds: ({stats['min_lat']:.4f}, {stats['min_lon']:.4f}) to ({stats['max_lat']:.4f}, {stats['max_lon']:.4f})")
-    print("  ✅ Heatmap generation passed!")
+    # Column layout (as returned by the API) gives the same statistics
+    columns = {key: [p[key] for p in heatmap] for key in ("lat", "lon", "temp")}
+    assert get_heatmap_statistics(columns) == stats
+    arrays = HeatmapArrays(*(np.asarray(columns[key]) for key in ("lat", "lon", "temp")))
+    assert get_heatmap_statistics(arrays) == stats
+    assert arrays.to_columns() == columns
+    assert arrays.to_points() == heatmap
+    
+    # Mask-based filtering of the array layout keeps the same points
+    window = (8.2, 9.1, 8.7, 9.6)
+    assert filter_heatmap_by_bounds(arrays, window).to_points() == filter_heatmap_by_bounds(heatmap, window)
+    assert (
+        filter_heatmap_by_temperature(arrays, 30.0, 40.0).to_points()
+        == filter_heatmap_by_temperature(heatmap, 30.0, 40.0)
+    )
+    
+    log.info("  ✅ Heatmap points: %s", len(heatmap))
+    log.info("  ✅ Temperature range: %.1f°C to %.1f°C", stats['min_temp'], stats['max_temp'])
+    log.info(
+        "  ✅ Geographic bounds: (%.4f, %.4f) to (%.4f, %.4f)",
+        stats['min_lat'], stats['min_lon'], stats['max_lat'], stats['max_lon'],
+    )
+    log.info("  ✅ Heatmap generation passed!")
     return True
 
 
@@ -351,9 +667,11 @@ def run_all_tests():
     tests = [
         ("NDVI Calculation", test_ndvi_calculation),
         ("LST Calculation", test_lst_calculation),
+        ("Fused LST Pipeline", test_lst_from_band10),
         ("Land Cover Classification", test_land_cover_classification),
         ("UHI Analysis", test_uhi_analysis),
         ("Insights Generation", test_insights_generation),
+        ("UHI Severity Classification", test_uhi_severity_classification),
         ("Heatmap Generation", test_heatmap_generation),
     ]
     
@@ -391,5 +709,7 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
+    # Show the tests' progress messages
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     success = run_all_tests()
     sys.exit(0 if success else 1)
@@ -2,39 +2,85 @@
 Utility modules for UHI-LST Analysis.
 """
 
-from .heatmap import (
-    generate_heatmap_data,
-    generate_heatmap_from_array,
-    HeatmapConfig,
-    HeatmapPoint,
-    get_heatmap_statistics,
-    filter_heatmap_by_bounds,
-    filter_heatmap_by_temperature,
-)
+from typing import TYPE_CHECKING
 
-from .file_handler import (
-    TempFileManager,
-    BandData,
-    BandMetadata,
-    LoadedBands,
-    validate_file_extension,
-    validate_geotiff,
-    validate_bands_match,
-    load_band,
-    load_all_bands,
-    temp_band_files,
-    get_file_info,
-    FileValidationError,
-    BandMismatchError,
-    CorruptFileError,
-)
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    # Static view of the lazy exports for type checkers and IDEs
+    from .heatmap import (
+        generate_heatmap_data,
+        generate_heatmap_columns,
+        generate_heatmap_arrays,
+        generate_heatmap_from_array,
+        HeatmapConfig,
+        HeatmapPoint,
+        HeatmapColumns,
+        HeatmapArrays,
+        get_heatmap_statistics,
+        filter_heatmap_by_bounds,
+        filter_heatmap_by_temperature,
+    )
+    from .file_handler import (
+        TempFileManager,
+        BandData,
+        BandMetadata,
+        LoadedBands,
+        validate_file_extension,
+        validate_geotiff,
+        validate_bands_match,
+        load_band,
+        load_all_bands,
+        temp_band_files,
+        get_file_info,
+        FileValidationError,
+        BandMismatchError,
+        CorruptFileError,
+    )
+
+# Public name -> submodule that defines it.
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing the package does not pull in rasterio and pyproj up front.
+_LAZY_IMPORTS = {
+    # Heatmap
+    "generate_heatmap_data": "heatmap",
+    "generate_heatmap_columns": "heatmap",
+    "generate_heatmap_arrays": "heatmap",
+    "generate_heatmap_from_array": "heatmap",
+    "HeatmapConfig": "heatmap",
+    "HeatmapPoint": "heatmap",
+    "HeatmapColumns": "heatmap",
+    "HeatmapArrays": "heatmap",
+    "get_heatmap_statistics": "heatmap",
+    "filter_heatmap_by_bounds": "heatmap",
+    "filter_heatmap_by_temperature": "heatmap",
+    # File Handler
+    "TempFileManager": "file_handler",
+    "BandData": "file_handler",
+    "BandMetadata": "file_handler",
+    "LoadedBands": "file_handler",
+    "validate_file_extension": "file_handler",
+    "validate_geotiff": "file_handler",
+    "validate_bands_match": "file_handler",
+    "load_band": "file_handler",
+    "load_all_bands": "file_handler",
+    "temp_band_files": "file_handler",
+    "get_file_info": "file_handler",
+    "FileValidationError": "file_handler",
+    "BandMismatchError": "file_handler",
+    "CorruptFileError": "file_handler",
+}
 
 __all__ = [
     # Heatmap
     "generate_heatmap_data",
+    "generate_heatmap_columns",
+    "generate_heatmap_arrays",
     "generate_heatmap_from_array",
     "HeatmapConfig",
     "HeatmapPoint",
+    "HeatmapColumns",
+    "HeatmapArrays",
     "get_heatmap_statistics",
     "filter_heatmap_by_bounds",
     "filter_heatmap_by_temperature",
@@ -54,3 +100,5 @@ __all__ = [
     "BandMismatchError",
     "CorruptFileError",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS, __all__)
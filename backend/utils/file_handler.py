@@ -15,13 +15,15 @@ Features:
 """
 
 import os
+import asyncio
 import tempfile
 import shutil
 import logging
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any, Union
+from dataclasses import dataclass, field, replace
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import atexit
 
 import numpy as np
@@ -32,6 +34,7 @@ try:
     import rasterio
     from rasterio.transform import Affine
     from rasterio.crs import CRS
+    from rasterio.enums import Resampling
     from rasterio.errors import RasterioIOError
     HAS_RASTERIO = True
 except ImportError:
@@ -44,6 +47,32 @@ logger = logging.getLogger(__name__)
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {".tif", ".tiff", ".geotiff"}
 
+# Uploads are copied to disk in chunks of this many bytes
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of band files read concurrently
+MAX_LOAD_WORKERS = 8
+
+# GDAL options for opening and reading band files, unless configured in
+# the environment: decode compressed files on all cores and keep decoded
+# blocks in a larger cache (in MB)
+GDAL_OPTIONS = {"GDAL_NUM_THREADS": "ALL_CPUS", "GDAL_CACHEMAX": 512}
+
+# Extra GDAL options for opens that only read the header: no directory
+# listing for sidecar files and no HEAD request before remote reads
+HEADER_GDAL_OPTIONS = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "CPL_VSIL_CURL_USE_HEAD": "NO",
+}
+
+
+def _gdal_env(header_only: bool = False) -> "rasterio.Env":
+    """Return a rasterio.Env with the GDAL options not set in the environment."""
+    options = {**GDAL_OPTIONS, **HEADER_GDAL_OPTIONS} if header_only else GDAL_OPTIONS
+    return rasterio.Env(
+        **{key: value for key, value in options.items() if key not in os.environ}
+    )
+
 # Default nodata value
 DEFAULT_NODATA = -9999.0
 
@@ -78,8 +107,8 @@ class BandMetadata:
 
 @dataclass
 class BandData:
-    """Complete band data with array and metadata."""
-    array: NDArray[np.floating]
+    """Complete band data with array (float32) and metadata."""
+    array: NDArray[np.float32]
     metadata: BandMetadata
     
     def to_dict(self) -> Dict[str, Any]:
@@ -103,7 +132,7 @@ class BandData:
 @dataclass
 class LoadedBands:
     """Collection of loaded bands with shared metadata."""
-    bands: Dict[str, NDArray[np.floating]]
+    bands: Dict[str, NDArray[np.float32]]
     transform: Any  # rasterio.Affine
     crs: str
     bounds: Tuple[float, float, float, float]
@@ -161,13 +190,50 @@ class TempFileManager:
         
         return file_path
     
-    async def save_upload(self, upload_file, filename: Optional[str] = None) -> str:
+    def save_stream(self, stream: BinaryIO, filename: str) -> str:
+        """
+        Save a binary file object to temp directory, copied in chunks.
+        
+        Only COPY_CHUNK_SIZE bytes are in memory at a time, however large
+        the file is.
+        
+        Args:
+            stream: Readable binary file object, read from its current position
+            filename: Name for the saved file
+        
+        Returns:
+            Absolute path to the saved file
+        """
+        temp_dir = self._ensure_temp_dir()
+        file_path = os.path.join(temp_dir, filename)
+        
+        with open(file_path, "wb") as f:
+            shutil.copyfileobj(stream, f, COPY_CHUNK_SIZE)
+            size = f.tell()
+        
+        self._files.append(file_path)
+        logger.debug(f"Saved file: {file_path} ({size} bytes)")
+        
+        return file_path
+    
+    async def save_upload(
+        self,
+        upload_file,
+        filename: Optional[str] = None,
+        one_shot: bool = True,
+    ) -> str:
         """
         Save an FastAPI UploadFile to temp directory.
         
+        The upload is streamed to disk in a worker thread, so it is never
+        held in memory as a whole and the event loop is not blocked.
+        
         Args:
             upload_file: FastAPI UploadFile object
             filename: Optional filename (uses upload name if not provided)
+            one_shot: Whether the upload is consumed only here. If False,
+                it is rewound before and after saving so that it can be
+                read again.
         
         Returns:
             Absolute path to the saved file
@@ -175,16 +241,32 @@ class TempFileManager:
         if filename is None:
             filename = upload_file.filename or "upload.tif"
         
-        content = await upload_file.read()
+        if one_shot:
+            # A fresh upload is already at position 0 and is not read again
+            return await asyncio.to_thread(self.save_stream, upload_file.file, filename)
+        
+        await upload_file.seek(0)
+        file_path = await asyncio.to_thread(self.save_stream, upload_file.file, filename)
         await upload_file.seek(0)  # Reset for potential re-read
         
-        return self.save_file(content, filename)
+        return file_path
     
     def cleanup(self):
         """Remove temp directory and all files."""
         if self.temp_dir and os.path.exists(self.temp_dir):
             try:
-                shutil.rmtree(self.temp_dir)
+                # The directory normally holds only the files saved here:
+                # unlink them and remove the then empty directory, falling
+                # back to rmtree if anything else was put in it
+                for file_path in self._files:
+                    try:
+                        os.unlink(file_path)
+                    except FileNotFoundError:
+                        pass
+                try:
+                    os.rmdir(self.temp_dir)
+                except OSError:
+                    shutil.rmtree(self.temp_dir)
                 logger.debug(f"Cleaned up temp directory: {self.temp_dir}")
             except Exception as e:
                 logger.warning(f"Failed to cleanup temp directory: {e}")
@@ -240,7 +322,7 @@ def validate_geotiff(file_path: str) -> BandMetadata:
         raise FileValidationError(f"File not found: {file_path}")
     
     try:
-        with rasterio.open(file_path) as src:
+        with _gdal_env(header_only=True), rasterio.open(file_path) as src:
             # Check if it has at least one band
             if src.count < 1:
                 raise FileValidationError(f"File has no bands: {file_path}")
@@ -295,12 +377,16 @@ def validate_bands_match(
     if not band_files:
         raise FileValidationError("No band files provided")
     
+    # Header reads release the GIL, so the files are opened concurrently;
+    # the comparisons below then only look at the parsed metadata
+    with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(band_files))) as pool:
+        parsed = dict(zip(band_files, pool.map(validate_geotiff, band_files.values())))
+    
     metadata_dict = {}
     reference_meta: Optional[BandMetadata] = None
     reference_band: Optional[str] = None
     
-    for band_name, file_path in band_files.items():
-        meta = validate_geotiff(file_path)
+    for band_name, meta in parsed.items():
         meta.band_name = band_name
         metadata_dict[band_name] = meta
         
@@ -334,6 +420,9 @@ def load_band(
     file_path: str,
     nodata_value: float = DEFAULT_NODATA,
     band_index: int = 1,
+    out: Optional[NDArray[np.float32]] = None,
+    decimation: Optional[int] = None,
+    metadata: Optional[BandMetadata] = None,
 ) -> BandData:
     """
     Load a GeoTIFF band as numpy array with metadata.
@@ -342,9 +431,18 @@ def load_band(
         file_path: Path to the GeoTIFF file
         nodata_value: Value to use for nodata pixels
         band_index: Band index to read (1-based, default: 1)
+        out: Optional float32 buffer to read the band into instead of
+            allocating a new array (of the decimated shape, if decimating)
+        decimation: Optional factor k to read the band at 1/k resolution
+            (each output pixel the average of a k x k block); GDAL reads
+            from overviews when the file has them
+        metadata: Optional BandMetadata of the file already parsed by
+            validate_geotiff; its grid and CRS are reused instead of
+            being read from the dataset again
     
     Returns:
-        BandData object with array and metadata
+        BandData object with array and metadata (width, height and
+        transform describe the decimated grid when decimating)
     
     Raises:
         CorruptFileError: If file cannot be read
@@ -353,27 +451,55 @@ def load_band(
         raise ImportError("rasterio is required for loading bands")
     
     try:
-        with rasterio.open(file_path) as src:
-            # Read band data
-            data = src.read(band_index).astype(np.float64)
+        with _gdal_env(), rasterio.open(file_path) as src:
+            # Read band data straight into a float32 buffer (GDAL
+            # converts while decoding; no native-dtype copy)
+            height, width = src.height, src.width
+            transform = src.transform
+            read_options = {}
+            if decimation is not None and decimation > 1:
+                height = max(1, src.height // decimation)
+                width = max(1, src.width // decimation)
+                transform = src.transform * Affine.scale(
+                    src.width / width, src.height / height
+                )
+                read_options = {"resampling": Resampling.average}
             
-            # Replace nodata values
+            if out is None:
+                data = src.read(
+                    band_index, out_shape=(height, width),
+                    out_dtype=np.float32, **read_options,
+                )
+            else:
+                data = src.read(band_index, out=out, **read_options)
+            
+            # Replace nodata and invalid values (zeros, negatives,
+            # non-finite) in one write; each test goes into one of two
+            # reused masks rather than allocating a temporary of its own
+            invalid = np.less_equal(data, 0)
+            scratch = np.empty(data.shape, dtype=bool)
             if src.nodata is not None:
-                data[data == src.nodata] = nodata_value
+                np.equal(data, np.float32(src.nodata), out=scratch)
+                invalid |= scratch
+            np.isfinite(data, out=scratch)
+            np.logical_not(scratch, out=scratch)
+            invalid |= scratch
+            np.putmask(data, invalid, nodata_value)
             
-            # Replace invalid values (zeros, negatives)
-            data[data <= 0] = nodata_value
-            data[~np.isfinite(data)] = nodata_value
+            # Reuse validated metadata when it describes the grid read
+            if metadata is not None and (metadata.height, metadata.width) == data.shape:
+                metadata = replace(metadata, nodata=nodata_value, dtype=str(data.dtype))
+                return BandData(array=data, metadata=metadata)
             
             # Get bounds
             bounds = (src.bounds.left, src.bounds.bottom,
                      src.bounds.right, src.bounds.top)
             
             metadata = BandMetadata(
-                width=src.width,
-                height=src.height,
+                width=width,
+                height=height,
                 crs=str(src.crs) if src.crs else "EPSG:4326",
-                transform=src.transform,
+                transform=transform,
                 bounds=bounds,
                 nodata=nodata_value,
                 dtype=str(data.dtype),
@@ -406,14 +532,35 @@ def load_all_bands(
         BandMismatchError: If bands don't match (when validate=True)
         CorruptFileError: If any file cannot be read
     """
+    # Validated bands all have the same shape: read them into one
+    # preallocated (bands, rows, cols) buffer
+    stack = None
+    metadata: Dict[str, BandMetadata] = {}
     if validate:
-        validate_bands_match(band_files)
+        metadata = validate_bands_match(band_files)
+        reference_meta = next(iter(metadata.values()))
+        stack = np.empty(
+            (len(band_files), reference_meta.height, reference_meta.width),
+            dtype=np.float32,
+        )
     
     bands = {}
     reference_data: Optional[BandData] = None
     
-    for band_name, file_path in band_files.items():
-        band_data = load_band(file_path, nodata_value)
+    # GDAL releases the GIL while reading and decoding, so the band files
+    # are read concurrently in threads
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_LOAD_WORKERS, len(band_files)))) as pool:
+        futures = {
+            band_name: pool.submit(
+                load_band, file_path, nodata_value,
+                out=None if stack is None else stack[index],
+                metadata=metadata.get(band_name),
+            )
+            for index, (band_name, file_path) in enumerate(band_files.items())
+        }
+        loaded = {band_name: future.result() for band_name, future in futures.items()}
+    
+    for band_name, band_data in loaded.items():
         bands[band_name] = band_data.array
         
         if reference_data is None:
@@ -492,12 +639,14 @@ def get_file_info(file_path: str) -> Dict[str, Any]:
         raise ImportError("rasterio is required")
     
     try:
-        with rasterio.open(file_path) as src:
+        size_bytes = os.path.getsize(file_path)
+        with _gdal_env(header_only=True), rasterio.open(file_path) as src:
+            transform = src.transform
             return {
                 "path": file_path,
                 "filename": os.path.basename(file_path),
-                "size_bytes": os.path.getsize(file_path),
-                "size_mb": round(os.path.getsize(file_path) / (1024 * 1024), 2),
+                "size_bytes": size_bytes,
+                "size_mb": round(size_bytes / (1024 * 1024), 2),
                 "width": src.width,
                 "height": src.height,
                 "count": src.count,
@@ -510,7 +659,10 @@ def get_file_info(file_path: str) -> Dict[str, Any]:
                     "right": src.bounds.right,
                     "top": src.bounds.top,
                 },
-                "transform": list(src.transform)[:6],
+                "transform": [
+                    transform.a, transform.b, transform.c,
+                    transform.d, transform.e, transform.f,
+                ],
                 "driver": src.driver,
             }
     except Exception as e:
@@ -14,19 +14,33 @@ Features:
 
 import numpy as np
 from numpy.typing import NDArray
-from typing import Dict, List, Optional, Tuple, TypedDict, Union
+from typing import Dict, List, NamedTuple, Optional, Tuple, TypedDict, Union
 from dataclasses import dataclass, field
+from functools import lru_cache
 import math
 
 # Try to import rasterio and pyproj for coordinate transformation
 try:
     import rasterio
-    from rasterio.transform import xy, Affine
+    from rasterio.transform import Affine
     from rasterio.crs import CRS
     HAS_RASTERIO = True
 except ImportError:
     HAS_RASTERIO = False
 
+try:
+    from pyproj import Transformer
+    HAS_PYPROJ = True
+except ImportError:
+    HAS_PYPROJ = False
+
+# Numba is optional; without it all points are built with NumPy.
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 
 class HeatmapPoint(TypedDict):
     """Type definition for a heatmap data point."""
@@ -35,6 +49,57 @@ class HeatmapPoint(TypedDict):
     temp: float
 
 
+class HeatmapColumns(TypedDict):
+    """
+    Heatmap points as parallel arrays (one list per field).
+    
+    Element i of each list describes point i; this avoids one object per
+    point and the repeated key names in the serialized payload.
+    """
+    lat: List[float]
+    lon: List[float]
+    temp: List[float]
+
+
+class HeatmapArrays(NamedTuple):
+    """
+    Heatmap points as parallel float64 NumPy arrays.
+    
+    The form kept for post-processing (statistics are NumPy reductions);
+    to_columns() and to_points() convert it to JSON-serializable layouts.
+    """
+    lat: NDArray[np.float64]
+    lon: NDArray[np.float64]
+    temp: NDArray[np.float64]
+    
+    def to_columns(self) -> HeatmapColumns:
+        """Return the points as HeatmapColumns (lists of Python floats)."""
+        return {
+            "lat": self.lat.tolist(),
+            "lon": self.lon.tolist(),
+            "temp": self.temp.tolist(),
+        }
+    
+    def to_points(self) -> List[HeatmapPoint]:
+        """Return the points as a list of HeatmapPoint dictionaries."""
+        return [
+            {"lat": lat, "lon": lon, "temp": temp}
+            for lat, lon, temp in zip(self.lat.tolist(), self.lon.tolist(), self.temp.tolist())
+        ]
+
+
+# Record layout of one heatmap point in a NumPy structured array
+_POINT_DTYPE = np.dtype([("lat", np.float64), ("lon", np.float64), ("temp", np.float64)])
+
+
+# Pixels per row tile of the stratified sampler's passes over the raster
+SAMPLE_TILE_PIXELS = 1 << 20
+
+# Largest HeatmapConfig.stratify_bins (bin indices and the invalid-pixel
+# sentinel must fit in uint8)
+MAX_STRATIFY_BINS = np.iinfo(np.uint8).max
+
+
 @dataclass
 class HeatmapConfig:
     """Configuration for heatmap generation."""
@@ -47,6 +112,18 @@ class HeatmapConfig:
     decimal_places_latlon: int = 6     # Precision for lat/lon
     decimal_places_temp: int = 2       # Precision for temperature
     target_crs: str = "EPSG:4326"      # Output coordinate system (WGS84)
+    sampling: str = "stride"           # "stride" (regular grid) or "stratified"
+    stratify_bins: int = 10            # Temperature bins for stratified sampling
+    random_seed: Optional[int] = 0     # Seed for stratified sampling (None: random)
+    
+    def __post_init__(self):
+        # Stratified sampling stores bin indices, plus a sentinel bin for
+        # invalid pixels, in uint8
+        if not 1 <= self.stratify_bins <= MAX_STRATIFY_BINS:
+            raise ValueError(
+                f"stratify_bins must be between 1 and {MAX_STRATIFY_BINS}, "
+                f"got {self.stratify_bins}"
+            )
 
 
 def is_valid_temperature(
@@ -67,15 +144,13 @@ def is_valid_temperature(
     Returns:
         True if temperature is valid, False otherwise
     """
-    if temp == nodata_value:
-        return False
-    if not np.isfinite(temp):
-        return False
-    if temp < min_temp or temp > max_temp:
+    # math.isfinite: a scalar check without NumPy ufunc dispatch
+    if temp == nodata_value or not math.isfinite(temp):
         return False
-    return True
+    return min_temp <= temp <= max_temp
 
 
+@lru_cache(maxsize=64)
 def calculate_optimal_sample_step(
     height: int,
     width: int,
@@ -84,6 +159,10 @@ def calculate_optimal_sample_step(
     """
     Calculate optimal sampling step to achieve approximately max_points.
     
+    The step is the smallest integer with step² * max_points >= the pixel
+    count, computed exactly in integer arithmetic. Results are cached per
+    (height, width, max_points), as requests repeat the same scene size.
+    
     Args:
         height: Raster height in pixels
         width: Raster width in pixels
@@ -99,12 +178,300 @@ def calculate_optimal_sample_step(
     
     # Calculate step based on desired density
     # We want: (height / step) * (width / step) ≈ max_points
-    # Therefore: step ≈ sqrt(total_pixels / max_points)
-    step = int(math.ceil(math.sqrt(total_pixels / max_points)))
+    # Therefore: step = ceil(sqrt(total_pixels / max_points)), rounded up
+    # from the integer square root
+    step = math.isqrt(total_pixels // max_points)
+    if step * step * max_points < total_pixels:
+        step += 1
     
     return max(1, step)
 
 
+def _allocate_quotas(counts: NDArray[np.intp], max_points: int) -> NDArray[np.intp]:
+    """
+    Split max_points across bins as evenly as their pixel counts allow.
+    
+    Bins are filled smallest first, so the share a small bin cannot use is
+    passed on to the larger ones.
+    """
+    quotas = np.zeros_like(counts)
+    remaining = max_points
+    bins_left = int(np.count_nonzero(counts))
+    
+    for k in np.argsort(counts, kind="stable"):
+        if counts[k] == 0:
+            continue
+        quotas[k] = min(counts[k], remaining // bins_left)
+        remaining -= quotas[k]
+        bins_left -= 1
+    
+    return quotas
+
+
+def _stratified_sample(
+    lst: NDArray[np.floating],
+    config: HeatmapConfig,
+) -> Tuple[NDArray[np.intp], NDArray[np.intp], NDArray[np.float64]]:
+    """
+    Sample valid pixels with an equal share per temperature bin.
+    
+    The valid temperature range is split into config.stratify_bins equal
+    bins and up to max_points pixels are drawn at random, spread evenly
+    over the bins, so small hot or cold pockets are represented as well as
+    the dominant temperatures.
+    
+    Args:
+        lst: 2D NumPy array with LST values
+        config: HeatmapConfig object
+    
+    Returns:
+        Tuple of (rows, cols, temperatures) of the sampled pixels, in
+        raster order
+    """
+    height, width = lst.shape
+    flat = lst.reshape(-1)
+    n_bins = config.stratify_bins
+    
+    # The raster is processed in row tiles, so apart from the uint8 bin
+    # index array only tile-sized temporaries are allocated
+    tile_rows = max(1, SAMPLE_TILE_PIXELS // max(1, width))
+    tiles = [
+        slice(start * width, min(start + tile_rows, height) * width)
+        for start in range(0, height, tile_rows)
+    ]
+    
+    def tile_valid(values: NDArray[np.floating]) -> NDArray[np.bool_]:
+        valid = np.isfinite(values)
+        valid &= values != config.nodata_value
+        valid &= values >= config.min_valid_temp
+        valid &= values <= config.max_valid_temp
+        return valid
+    
+    # Pass 1: temperature range of the valid pixels
+    low, high = np.inf, -np.inf
+    for tile in tiles:
+        values = flat[tile]
+        valid = tile_valid(values)
+        low = min(low, values.min(where=valid, initial=np.inf))
+        high = max(high, values.max(where=valid, initial=-np.inf))
+    
+    if low > high:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, np.empty(0, dtype=np.float64)
+    
+    # Pass 2: bin index = number of inner bin edges at or below the value,
+    # accumulated in uint8; invalid pixels get the sentinel bin n_bins.
+    # Per-tile bin counts locate each bin's members later.
+    edges = np.linspace(low, high, n_bins + 1)[1:-1].astype(lst.dtype)
+    bins = np.empty(flat.size, dtype=np.uint8)
+    tile_counts = np.empty((len(tiles), n_bins + 1), dtype=np.intp)
+    above = np.empty(min(flat.size, tile_rows * width), dtype=bool)
+    for t, tile in enumerate(tiles):
+        values = flat[tile]
+        tile_bins = bins[tile]
+        tile_above = above[:values.size]
+        tile_bins.fill(0)
+        for edge in edges:
+            np.greater_equal(values, edge, out=tile_above)
+            tile_bins += tile_above
+        np.logical_not(tile_valid(values), out=tile_above)
+        np.putmask(tile_bins, tile_above, n_bins)
+        tile_counts[t] = np.bincount(tile_bins, minlength=n_bins + 1)
+    
+    counts = tile_counts.sum(axis=0)[:n_bins]
+    quotas = _allocate_quotas(counts, config.max_points)
+    
+    # Draw ranks within each bin (the i-th member in raster order) and
+    # resolve them tile by tile, so a bin's member indices are only ever
+    # listed for one tile at a time
+    rng = np.random.default_rng(config.random_seed)
+    picks = []
+    for k in np.flatnonzero(quotas):
+        ranks = np.sort(rng.choice(counts[k], size=quotas[k], replace=False))
+        ends = np.cumsum(tile_counts[:, k])
+        owners = np.searchsorted(ends, ranks, side="right")
+        for t in np.unique(owners):
+            tile = tiles[t]
+            members = np.flatnonzero(bins[tile] == k)
+            first = ends[t] - tile_counts[t, k]
+            picks.append(members[ranks[owners == t] - first] + tile.start)
+    picked = np.sort(np.concatenate(picks))
+    
+    rows, cols = np.unravel_index(picked, lst.shape)
+    return rows, cols, flat[picked].astype(np.float64)
+
+
+def _resolve_sample_step(shape: Tuple[int, int], config: HeatmapConfig) -> int:
+    """Return the stride sampling step for a raster of the given shape."""
+    height, width = shape
+    
+    # Calculate optimal sampling step
+    if config.sample_step is None:
+        sample_step = calculate_optimal_sample_step(
+            height, width, config.max_points
+        )
+    else:
+        sample_step = config.sample_step
+    
+    # Ensure minimum step of 1
+    return max(1, sample_step)
+
+
+def _sample_valid_pixels(
+    lst: NDArray[np.floating],
+    config: HeatmapConfig,
+) -> Tuple[NDArray[np.intp], NDArray[np.intp], NDArray[np.float64]]:
+    """
+    Sample the LST grid according to config and keep valid temperatures.
+    
+    Stride sampling is the vectorized equivalent of looping over every
+    sample_step-th pixel with is_valid_temperature; stratified sampling
+    draws up to max_points pixels spread over the temperature range.
+    
+    Args:
+        lst: 2D NumPy array with LST values
+        config: HeatmapConfig object
+    
+    Returns:
+        Tuple of (rows, cols, temperatures) of the valid sampled pixels,
+        in raster order
+    
+    Raises:
+        ValueError: If config.sampling is not "stride" or "stratified"
+    """
+    if config.sampling == "stratified":
+        return _stratified_sample(lst, config)
+    if config.sampling != "stride":
+        raise ValueError(
+            f"Unknown sampling '{config.sampling}'; expected 'stride' or 'stratified'"
+        )
+    
+    sample_step = _resolve_sample_step(lst.shape, config)
+    
+    # Validate in float64, as is_valid_temperature does on Python floats
+    temps = lst[::sample_step, ::sample_step].astype(np.float64)
+    valid = np.isfinite(temps)
+    valid &= temps != config.nodata_value
+    valid &= temps >= config.min_valid_temp
+    valid &= temps <= config.max_valid_temp
+    
+    rows, cols = np.nonzero(valid)
+    return rows * sample_step, cols * sample_step, temps[valid]
+
+
+def _pixel_centers(
+    transform: "Affine",
+    rows: Union[int, NDArray[np.integer]],
+    cols: Union[int, NDArray[np.integer]],
+) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Apply the affine transform to pixel centers as plain arithmetic.
+    
+    Args:
+        transform: Rasterio affine transform
+        rows: Row index or indices
+        cols: Column index or indices
+    
+    Returns:
+        Tuple of (x, y) coordinates in the transform's CRS (floats for
+        scalar indices, float64 arrays for arrays)
+    """
+    col_centers = cols + 0.5
+    row_centers = rows + 0.5
+    xs = transform.a * col_centers + transform.b * row_centers + transform.c
+    ys = transform.d * col_centers + transform.e * row_centers + transform.f
+    return xs, ys
+
+
+if HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _stride_point(lst, r, c, nodata_value, min_temp, max_temp, a, b, c0, d, e, f):
+        """
+        Temperature and pixel-center x/y of one sampled pixel.
+        
+        Returns a NaN temperature if the pixel is invalid or its center is
+        not finite, with the same float64 checks and arithmetic as
+        _sample_valid_pixels and _pixel_centers.
+        """
+        t = np.float64(lst[r, c])
+        if not (
+            math.isfinite(t) and t != nodata_value
+            and t >= min_temp and t <= max_temp
+        ):
+            return np.nan, 0.0, 0.0
+        col_center = c + 0.5
+        row_center = r + 0.5
+        x = a * col_center + b * row_center + c0
+        y = d * col_center + e * row_center + f
+        if not (math.isfinite(x) and math.isfinite(y)):
+            return np.nan, 0.0, 0.0
+        return t, x, y
+    
+    @numba.njit(parallel=True, cache=True)
+    def _stride_points_kernel(
+        lst, step, nodata_value, min_temp, max_temp, a, b, c, d, e, f, max_points
+    ):
+        """
+        Stride-sampled valid pixels as (lats, lons, temps), in raster order.
+        
+        Sampled rows are processed in parallel in two passes: the first
+        counts the points of each row, the second writes them at the row's
+        offset in the output, which is cut off after max_points points.
+        """
+        n_rows = (lst.shape[0] + step - 1) // step
+        n_cols = (lst.shape[1] + step - 1) // step
+        
+        counts = np.zeros(n_rows, dtype=np.int64)
+        for i in numba.prange(n_rows):
+            for j in range(n_cols):
+                t, x, y = _stride_point(
+                    lst, i * step, j * step, nodata_value, min_temp, max_temp,
+                    a, b, c, d, e, f,
+                )
+                if math.isfinite(t):
+                    counts[i] += 1
+        
+        offsets = np.zeros(n_rows + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        n_points = min(offsets[n_rows], max_points)
+        
+        lats = np.empty(n_points, dtype=np.float64)
+        lons = np.empty(n_points, dtype=np.float64)
+        temps = np.empty(n_points, dtype=np.float64)
+        for i in numba.prange(n_rows):
+            k = offsets[i]
+            if k >= n_points:
+                continue
+            for j in range(n_cols):
+                t, x, y = _stride_point(
+                    lst, i * step, j * step, nodata_value, min_temp, max_temp,
+                    a, b, c, d, e, f,
+                )
+                if math.isfinite(t):
+                    # lat is y, lon is x
+                    lats[k] = y
+                    lons[k] = x
+                    temps[k] = t
+                    k += 1
+                    if k >= n_points:
+                        break
+        
+        return lats, lons, temps
+
+
+@lru_cache(maxsize=32)
+def _get_transformer(source_crs: str, target_crs: str) -> "Transformer":
+    """
+    Return a cached source -> target CRS transformer (x/y axis order).
+    
+    Creating a transformer looks the CRSs up in the PROJ database, so one
+    is built per CRS pair and reused across calls and requests.
+    """
+    if not HAS_PYPROJ:
+        raise ImportError("pyproj is required for coordinate reprojection")
+    return Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
+
 def pixel_to_latlon(
     row: int,
     col: int,
@@ -128,20 +495,155 @@ def pixel_to_latlon(
     if not HAS_RASTERIO:
         raise ImportError("rasterio is required for coordinate transformation")
     
-    # Get coordinates in source CRS
-    x, y = xy(transform, row, col, offset="center")
+    # Get coordinates of the pixel center in source CRS
+    x, y = _pixel_centers(transform, row, col)
     
     # If source CRS is different from target, reproject
     if source_crs and source_crs != target_crs:
-        from pyproj import Transformer
-        transformer = Transformer.from_crs(source_crs, target_crs, always_xy=True)
-        x, y = transformer.transform(x, y)
+        x, y = _get_transformer(source_crs, target_crs).transform(x, y)
     
     # Return as (lat, lon) - note y is lat, x is lon
     return (y, x)
 
 
 
+def generate_heatmap_arrays(
+    lst: NDArray[np.floating],
+    transform: "Affine",
+    source_crs: Optional[str] = None,
+    config: Optional[HeatmapConfig] = None,
+) -> HeatmapArrays:
+    """
+    Generate heatmap data from LST array as parallel lat/lon/temp arrays.
+    
+    Args:
+        lst: 2D NumPy array with Land Surface Temperature values (Celsius)
+        transform: Rasterio affine transform for coordinate conversion
+        source_crs: Source coordinate reference system (e.g., "EPSG:32632")
+        config: HeatmapConfig object with generation parameters
+    
+    Returns:
+        HeatmapArrays with equal-length, rounded lat, lon and temp arrays
+    """
+    if not HAS_RASTERIO:
+        raise ImportError("rasterio is required for heatmap generation")
+    
+    # Use default config if not provided
+    if config is None:
+        config = HeatmapConfig()
+    
+    # Without reprojection, stride sampling, validation and the affine
+    # transform run as one compiled pass over the sampled pixels
+    if (
+        HAS_NUMBA
+        and config.sampling == "stride"
+        and not (source_crs and source_crs != config.target_crs)
+    ):
+        lats, lons, temps = _stride_points_kernel(
+            lst,
+            _resolve_sample_step(lst.shape, config),
+            float(config.nodata_value),
+            float(config.min_valid_temp),
+            float(config.max_valid_temp),
+            float(transform.a), float(transform.b), float(transform.c),
+            float(transform.d), float(transform.e), float(transform.f),
+            config.max_points,
+        )
+        return _rounded_arrays(lats, lons, temps, config)
+    
+    rows, cols, temps = _sample_valid_pixels(lst, config)
+    
+    lat_parts, lon_parts, temp_parts = [], [], []
+    count = 0
+    
+    # One reprojection transformer for all points; if the CRS cannot be
+    # used, no point can be converted
+    transformer = None
+    if source_crs and source_crs != config.target_crs:
+        if not HAS_PYPROJ:
+            raise ImportError("pyproj is required for coordinate reprojection")
+        try:
+            transformer = _get_transformer(source_crs, config.target_crs)
+        except Exception:
+            empty = np.empty(0, dtype=np.float64)
+            return HeatmapArrays(empty, empty.copy(), empty.copy())
+    
+    # Convert the points in batches of the still missing count, so only
+    # about max_points coordinates are computed; points whose conversion
+    # fails (non-finite result) are skipped
+    start = 0
+    while start < temps.size and count < config.max_points:
+        batch = slice(start, start + config.max_points - count)
+        start = batch.stop
+        
+        # Pixel centers in the source CRS, then one reprojection call
+        # for the whole batch
+        xs, ys = _pixel_centers(transform, rows[batch], cols[batch])
+        try:
+            if transformer is not None:
+                xs, ys = transformer.transform(xs, ys)
+        except Exception:
+            # Skip if coordinate conversion fails
+            continue
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        converted = np.isfinite(xs) & np.isfinite(ys)
+        
+        # lat is y, lon is x
+        lat_parts.append(ys[converted])
+        lon_parts.append(xs[converted])
+        temp_parts.append(temps[batch][converted])
+        count += lat_parts[-1].size
+    
+    if not lat_parts:
+        empty = np.empty(0, dtype=np.float64)
+        return HeatmapArrays(empty, empty.copy(), empty.copy())
+    
+    return _rounded_arrays(
+        np.concatenate(lat_parts),
+        np.concatenate(lon_parts),
+        np.concatenate(temp_parts),
+        config,
+    )
+
+
+def _rounded_arrays(
+    lats: NDArray[np.float64],
+    lons: NDArray[np.float64],
+    temps: NDArray[np.float64],
+    config: HeatmapConfig,
+) -> HeatmapArrays:
+    """Round the point arrays in place to the configured precision."""
+    np.round(lats, config.decimal_places_latlon, out=lats)
+    np.round(lons, config.decimal_places_latlon, out=lons)
+    np.round(temps, config.decimal_places_temp, out=temps)
+    return HeatmapArrays(lats, lons, temps)
+
+
+def generate_heatmap_columns(
+    lst: NDArray[np.floating],
+    transform: "Affine",
+    source_crs: Optional[str] = None,
+    config: Optional[HeatmapConfig] = None,
+) -> HeatmapColumns:
+    """
+    Generate heatmap data from LST array as parallel lat/lon/temp lists.
+    
+    JSON-serializable form of generate_heatmap_arrays, as returned by the
+    analysis API.
+    
+    Args:
+        lst: 2D NumPy array with Land Surface Temperature values (Celsius)
+        transform: Rasterio affine transform for coordinate conversion
+        source_crs: Source coordinate reference system (e.g., "EPSG:32632")
+        config: HeatmapConfig object with generation parameters
+    
+    Returns:
+        HeatmapColumns dictionary with equal-length lat, lon and temp lists
+    """
+    return generate_heatmap_arrays(lst, transform, source_crs, config).to_columns()
+
+
 def generate_heatmap_data(
     lst: NDArray[np.floating],
     transform: "Affine",
@@ -151,7 +653,7 @@ def generate_heatmap_data(
     """
     Generate heatmap data from LST array with geospatial transform.
     
-    This is the main function for creating frontend-ready heatmap data.
+    Point-per-dictionary form of generate_heatmap_arrays.
     
     Args:
         lst: 2D NumPy array with Land Surface Temperature values (Celsius)
@@ -173,65 +675,7 @@ def generate_heatmap_data(
         >>> print(heatmap[0])
         {'lat': 9.0821, 'lon': 8.6754, 'temp': 35.2}
     """
-    if not HAS_RASTERIO:
-        raise ImportError("rasterio is required for heatmap generation")
-    
-    # Use default config if not provided
-    if config is None:
-        config = HeatmapConfig()
-    
-    height, width = lst.shape
-    
-    # Calculate optimal sampling step
-    if config.sample_step is None:
-        sample_step = calculate_optimal_sample_step(
-            height, width, config.max_points
-        )
-    else:
-        sample_step = config.sample_step
-    
-    # Ensure minimum step of 1
-    sample_step = max(1, sample_step)
-    
-    heatmap_data: List[HeatmapPoint] = []
-    
-    # Iterate with sampling
-    for row in range(0, height, sample_step):
-        for col in range(0, width, sample_step):
-            temp = float(lst[row, col])
-            
-            # Validate temperature
-            if not is_valid_temperature(
-                temp,
-                config.nodata_value,
-                config.min_valid_temp,
-                config.max_valid_temp,
-            ):
-                continue
-            
-            # Convert pixel to lat/lon
-            try:
-                lat, lon = pixel_to_latlon(
-                    row, col, transform, source_crs, config.target_crs
-                )
-            except Exception:
-                # Skip if coordinate conversion fails
-                continue
-            
-            # Create point with rounded values
-            point: HeatmapPoint = {
-                "lat": round(lat, config.decimal_places_latlon),
-                "lon": round(lon, config.decimal_places_latlon),
-                "temp": round(temp, config.decimal_places_temp),
-            }
-            
-            heatmap_data.append(point)
-            
-            # Check max points limit
-            if len(heatmap_data) >= config.max_points:
-                return heatmap_data
-    
-    return heatmap_data
+    return generate_heatmap_arrays(lst, transform, source_crs, config).to_points()
 
 
 def generate_heatmap_from_array(
@@ -267,60 +711,56 @@ def generate_heatmap_from_array(
     pixel_width = (max_lon - min_lon) / width
     pixel_height = (max_lat - min_lat) / height
     
-    # Calculate sampling step
-    if config.sample_step is None:
-        sample_step = calculate_optimal_sample_step(
-            height, width, config.max_points
-        )
-    else:
-        sample_step = config.sample_step
-    
-    sample_step = max(1, sample_step)
+    rows, cols, temps = _sample_valid_pixels(lst, config)
+    rows = rows[:config.max_points]
+    cols = cols[:config.max_points]
+    temps = temps[:config.max_points]
     
-    heatmap_data: List[HeatmapPoint] = []
+    # Calculate coordinates
+    # Note: row 0 is at max_lat (top of image)
+    lats = max_lat - (rows + 0.5) * pixel_height
+    lons = min_lon + (cols + 0.5) * pixel_width
     
-    for row in range(0, height, sample_step):
-        for col in range(0, width, sample_step):
-            temp = float(lst[row, col])
-            
-            if not is_valid_temperature(
-                temp,
-                config.nodata_value,
-                config.min_valid_temp,
-                config.max_valid_temp,
-            ):
-                continue
-            
-            # Calculate coordinates
-            # Note: row 0 is at max_lat (top of image)
-            lat = max_lat - (row + 0.5) * pixel_height
-            lon = min_lon + (col + 0.5) * pixel_width
-            
-            point: HeatmapPoint = {
-                "lat": round(lat, config.decimal_places_latlon),
-                "lon": round(lon, config.decimal_places_latlon),
-                "temp": round(temp, config.decimal_places_temp),
-            }
-            
-            heatmap_data.append(point)
-            
-            if len(heatmap_data) >= config.max_points:
-                return heatmap_data
-    
-    return heatmap_data
-
-
-def get_heatmap_statistics(heatmap_data: List[HeatmapPoint]) -> Dict[str, any]:
+    return [
+        {
+            "lat": round(lat, config.decimal_places_latlon),
+            "lon": round(lon, config.decimal_places_latlon),
+            "temp": round(temp, config.decimal_places_temp),
+        }
+        for lat, lon, temp in zip(lats.tolist(), lons.tolist(), temps.tolist())
+    ]
+
+
+def get_heatmap_statistics(
+    heatmap_data: Union[List[HeatmapPoint], HeatmapColumns, HeatmapArrays],
+) -> Dict[str, any]:
     """
     Calculate statistics for heatmap data.
     
     Args:
-        heatmap_data: List of heatmap points
+        heatmap_data: List of heatmap points, HeatmapColumns or HeatmapArrays
     
     Returns:
         Dictionary with min, max, mean, std of temperatures
     """
-    if not heatmap_data:
+    if isinstance(heatmap_data, HeatmapArrays):
+        lats, lons, temps = heatmap_data
+    elif isinstance(heatmap_data, dict):
+        lats, lons, temps = (
+            np.asarray(heatmap_data[key], dtype=np.float64)
+            for key in ("lat", "lon", "temp")
+        )
+    else:
+        # One pass over the points into a structured array; its fields
+        # are (strided) float64 views
+        points = np.fromiter(
+            ((p["lat"], p["lon"], p["temp"]) for p in heatmap_data),
+            dtype=_POINT_DTYPE,
+            count=len(heatmap_data),
+        )
+        lats, lons, temps = points["lat"], points["lon"], points["temp"]
+    
+    if not temps.size:
         return {
             "count": 0,
             "min_temp": None,
@@ -333,39 +773,43 @@ def get_heatmap_statistics(heatmap_data: List[HeatmapPoint]) -> Dict[str, any]:
             "max_lon": None,
         }
     
-    temps = [p["temp"] for p in heatmap_data]
-    lats = [p["lat"] for p in heatmap_data]
-    lons = [p["lon"] for p in heatmap_data]
-    
     return {
-        "count": len(heatmap_data),
-        "min_temp": min(temps),
-        "max_temp": max(temps),
-        "mean_temp": round(sum(temps) / len(temps), 2),
-        "std_temp": round(float(np.std(temps)), 2),
-        "min_lat": min(lats),
-        "max_lat": max(lats),
-        "min_lon": min(lons),
-        "max_lon": max(lons),
+        "count": int(temps.size),
+        "min_temp": float(temps.min()),
+        "max_temp": float(temps.max()),
+        "mean_temp": round(float(temps.mean()), 2),
+        "std_temp": round(float(temps.std()), 2),
+        "min_lat": float(lats.min()),
+        "max_lat": float(lats.max()),
+        "min_lon": float(lons.min()),
+        "max_lon": float(lons.max()),
     }
 
 
 def filter_heatmap_by_bounds(
-    heatmap_data: List[HeatmapPoint],
+    heatmap_data: Union[List[HeatmapPoint], HeatmapArrays],
     bounds: Tuple[float, float, float, float],
-) -> List[HeatmapPoint]:
+) -> Union[List[HeatmapPoint], HeatmapArrays]:
     """
     Filter heatmap points to only include those within bounds.
     
     Args:
-        heatmap_data: List of heatmap points
+        heatmap_data: List of heatmap points, or HeatmapArrays (filtered
+            with one boolean mask)
         bounds: Tuple of (min_lon, min_lat, max_lon, max_lat)
     
     Returns:
-        Filtered list of heatmap points
+        Filtered heatmap points, in the layout they were given in
     """
     min_lon, min_lat, max_lon, max_lat = bounds
     
+    if isinstance(heatmap_data, HeatmapArrays):
+        lats, lons, _ = heatmap_data
+        keep = (lats >= min_lat) & (lats <= max_lat)
+        keep &= lons >= min_lon
+        keep &= lons <= max_lon
+        return HeatmapArrays(*(values[keep] for values in heatmap_data))
+    
     return [
         point for point in heatmap_data
         if (min_lat <= point["lat"] <= max_lat and
@@ -374,21 +818,31 @@ def filter_heatmap_by_bounds(
 
 
 def filter_heatmap_by_temperature(
-    heatmap_data: List[HeatmapPoint],
+    heatmap_data: Union[List[HeatmapPoint], HeatmapArrays],
     min_temp: Optional[float] = None,
     max_temp: Optional[float] = None,
-) -> List[HeatmapPoint]:
+) -> Union[List[HeatmapPoint], HeatmapArrays]:
     """
     Filter heatmap points by temperature range.
     
     Args:
-        heatmap_data: List of heatmap points
+        heatmap_data: List of heatmap points, or HeatmapArrays (filtered
+            with one boolean mask)
         min_temp: Minimum temperature (inclusive)
         max_temp: Maximum temperature (inclusive)
     
     Returns:
-        Filtered list of heatmap points
+        Filtered heatmap points, in the layout they were given in
     """
+    if isinstance(heatmap_data, HeatmapArrays):
+        temps = heatmap_data.temp
+        keep = np.ones(temps.shape, dtype=bool)
+        if min_temp is not None:
+            keep &= temps >= min_temp
+        if max_temp is not None:
+            keep &= temps <= max_temp
+        return HeatmapArrays(*(values[keep] for values in heatmap_data))
+    
     result = heatmap_data
     
     if min_temp is not None:
@@ -417,24 +871,29 @@ def create_temperature_bins(
     if not heatmap_data:
         return {}
     
-    temps = [p["temp"] for p in heatmap_data]
-    min_temp = min(temps)
-    max_temp = max(temps)
+    temps = np.fromiter(
+        (p["temp"] for p in heatmap_data), dtype=np.float64, count=len(heatmap_data)
+    )
+    min_temp = float(temps.min())
+    max_temp = float(temps.max())
     bin_size = (max_temp - min_temp) / num_bins
     
-    bins: Dict[str, List[HeatmapPoint]] = {}
+    # Labels are formatted once per bin, not once per point
+    labels = [
+        f"{min_temp + i * bin_size:.1f}-{min_temp + (i + 1) * bin_size:.1f}"
+        for i in range(num_bins)
+    ]
+    bins: Dict[str, List[HeatmapPoint]] = {label: [] for label in labels}
     
-    for i in range(num_bins):
-        bin_min = min_temp + i * bin_size
-        bin_max = min_temp + (i + 1) * bin_size
-        bin_label = f"{bin_min:.1f}-{bin_max:.1f}"
-        bins[bin_label] = []
+    # Bin index of every point in one vectorized pass (all points fall in
+    # the first bin if they share one temperature)
+    if bin_size > 0:
+        bin_indices = ((temps - min_temp) / bin_size).astype(np.intp)
+        np.minimum(bin_indices, num_bins - 1, out=bin_indices)
+    else:
+        bin_indices = np.zeros(temps.size, dtype=np.intp)
     
-    for point in heatmap_data:
-        bin_index = min(int((point["temp"] - min_temp) / bin_size), num_bins - 1)
-        bin_min = min_temp + bin_index * bin_size
-        bin_max = min_temp + (bin_index + 1) * bin_size
-        bin_label = f"{bin_min:.1f}-{bin_max:.1f}"
-        bins[bin_label].append(point)
+    for point, bin_index in zip(heatmap_data, bin_indices.tolist()):
+        bins[labels[bin_index]].append(point)
     
     return bins
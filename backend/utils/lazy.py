@@ -0,0 +1,53 @@
+"""
+Lazy Package Exports
+
+Shared PEP 562 hooks for packages whose __init__ re-exports names from
+their submodules: a submodule is only imported when one of its names is
+first accessed, so importing the package does not pull in every
+dependency up front.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def lazy_exports(
+    package_name: str,
+    lazy_imports: Dict[str, str],
+    public_names: Sequence[str],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module-level __getattr__ and __dir__ of a package.
+    
+    Args:
+        package_name: The package's __name__
+        lazy_imports: Public name -> submodule (relative to the package)
+            that defines it
+        public_names: The package's __all__
+    
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign in the package's __init__
+    
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS, __all__)
+    """
+    def __getattr__(name: str) -> Any:
+        """Import the defining submodule on first access to a public name."""
+        try:
+            module_name = lazy_imports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package_name!r} has no attribute {name!r}"
+            ) from None
+        
+        value = getattr(importlib.import_module(f".{module_name}", package_name), name)
+        # Cache on the package, so later lookups do not come back here
+        setattr(sys.modules[package_name], name, value)
+        return value
+    
+    def __dir__() -> List[str]:
+        """List lazily resolved public names alongside loaded globals."""
+        return sorted(set(vars(sys.modules[package_name])) | set(public_names))
+    
+    return __getattr__, __dir__
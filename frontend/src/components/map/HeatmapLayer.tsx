@@ -7,6 +7,7 @@ import { useEffect } from 'react';
 import { useMap } from 'react-leaflet';
 import L from 'leaflet';
 import 'leaflet/dist/leaflet.css';
+import type { HeatmapColumns } from '@/types/api';
 
 // Import leaflet.heat
 import 'leaflet.heat';
@@ -34,14 +35,8 @@ declare module 'leaflet' {
     }
 }
 
-export interface HeatmapPoint {
-    lat: number;
-    lon: number;
-    temp: number;
-}
-
 interface HeatmapLayerProps {
-    points: HeatmapPoint[];
+    points: HeatmapColumns;
     minTemp?: number;
     maxTemp?: number;
     radius?: number;
@@ -77,22 +72,22 @@ export const HeatmapLayer: React.FC<HeatmapLayerProps> = ({
     const map = useMap();
 
     useEffect(() => {
-        if (!points || points.length === 0) {
+        if (!points || points.temp.length === 0) {
             return;
         }
 
         // Calculate min/max if not provided
-        const temps = points.map(p => p.temp);
+        const temps = points.temp;
         const actualMin = minTemp ?? Math.min(...temps);
         const actualMax = maxTemp ?? Math.max(...temps);
         const tempRange = actualMax - actualMin;
 
         // Normalize temperatures to 0-1 intensity
-        const heatData: Array<[number, number, number]> = points.map(point => {
+        const heatData: Array<[number, number, number]> = temps.map((temp, i) => {
             const intensity = tempRange > 0
-                ? (point.temp - actualMin) / tempRange
+                ? (temp - actualMin) / tempRange
                 : 0.5;
-            return [point.lat, point.lon, intensity];
+            return [points.lat[i], points.lon[i], intensity];
         });
 
         // Create heat layer
@@ -109,8 +104,8 @@ export const HeatmapLayer: React.FC<HeatmapLayerProps> = ({
 
         // Fit bounds to heatmap data
         if (heatData.length > 0) {
-            const lats = heatData.map(d => d[0]);
-            const lons = heatData.map(d => d[1]);
+            const lats = points.lat;
+            const lons = points.lon;
             const bounds = L.latLngBounds(
                 [Math.min(...lats), Math.min(...lons)],
                 [Math.max(...lats), Math.max(...lons)]
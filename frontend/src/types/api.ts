@@ -31,6 +31,15 @@ export interface AnalysisResult {
             total_pixels: number;
             unit: string;
         };
+        thermal_zone_percentages: {
+            very_cold: number;
+            cold: number;
+            cool: number;
+            comfortable: number;
+            warm: number;
+            hot: number;
+            very_hot: number;
+        };
         unit: string;
     };
 
@@ -85,22 +94,28 @@ export interface AnalysisResult {
     };
 
     heatmap: {
-        points: HeatmapPoint[];
+        points: HeatmapColumns;
         point_count: number;
+        /**
+         * Statistics of the sampled points, not of the whole scene (see
+         * lst.statistics): stratified sampling over-represents the extremes
+         */
         statistics: {
             count: number;
-            min_temp: number;
-            max_temp: number;
-            mean_temp: number;
-            std_temp: number;
-            min_lat: number;
-            max_lat: number;
-            min_lon: number;
-            max_lon: number;
+            min_temp: number | null;
+            max_temp: number | null;
+            mean_temp: number | null;
+            std_temp: number | null;
+            min_lat: number | null;
+            max_lat: number | null;
+            min_lon: number | null;
+            max_lon: number | null;
         };
         config: {
             max_points: number;
-            sample_step: number;
+            /** null when the step is derived from max_points */
+            sample_step: number | null;
+            sampling: 'stride' | 'stratified';
         };
     };
 }
@@ -111,6 +126,13 @@ export interface HeatmapPoint {
     temp: number;
 }
 
+/** Heatmap points as parallel arrays: point i is (lat[i], lon[i], temp[i]) */
+export interface HeatmapColumns {
+    lat: number[];
+    lon: number[];
+    temp: number[];
+}
+
 export interface Recommendation {
     title: string;
     description: string;